@@ -0,0 +1,105 @@
+"""`python -X importtime` 기반 시작 시간 벤치마크 (GUI / CLI)
+
+    gui: main.py를 KDA_STARTUP_BENCH=1로 실행 (첫 화면이 그려지면 종료, 화면이 있는 환경 필요)
+    cli: python -m kda --help
+
+각 대상을 여러 번 실행해 import 시간 합계(중앙값)와 누적 시간이 큰 모듈을 출력한다.
+--cold면 매번 빈 PYTHONPYCACHEPREFIX를 써서 .pyc 없이 처음 실행하는 상황을 재현한다.
+--forbid requests,bs4,PIL 처럼 지정하면 그 모듈이 시작 중에 import될 때 종료 코드 1.
+
+사용법: python benchmarks/bench_importtime.py [cli gui] [--repeat 5] [--cold] [--top 15] [--forbid requests,bs4]
+"""
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+IMPORT_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+TARGETS = {
+    "gui": [os.path.join(ROOT_DIR, "main.py")],
+    "cli": ["-m", "kda", "--help"]
+}
+
+def parse_importtime(stderr):
+    """{모듈: (self_us, cumulative_us)}와 최상위 import 누적 시간 합계(us)"""
+    modules = {}
+    total = 0
+    for line in stderr.splitlines():
+        match = IMPORT_LINE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, name = int(match.group(1)), int(match.group(2)), match.group(3), match.group(4)
+        modules[name] = (self_us, cumulative_us)
+        if len(indent) <= 1:
+            total += cumulative_us
+    return modules, total
+
+def run_once(target, home, cold):
+    env = dict(os.environ, KDA_HOME=home, KDA_STARTUP_BENCH="1", PYTHONPATH=ROOT_DIR)
+    with tempfile.TemporaryDirectory() as pycache:
+        if cold:
+            env["PYTHONPYCACHEPREFIX"] = pycache
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime"] + TARGETS[target], env=env, cwd=home,
+            capture_output=True, text=True, encoding="utf-8", errors="replace", timeout=120
+        )
+    modules, total = parse_importtime(result.stderr)
+    if not modules:
+        raise RuntimeError(f"{target}: no importtime output (exit {result.returncode}):\n{result.stderr.strip()[-2000:]}")
+    return modules, total, result.returncode
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("targets", nargs="*", choices=sorted(TARGETS), default=["cli", "gui"])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--cold", action="store_true", help="start every run without cached .pyc files")
+    parser.add_argument("--top", type=int, default=15, help="number of slowest modules to list")
+    parser.add_argument("--forbid", default="", help="comma-separated modules that must not be imported at startup")
+    args = parser.parse_args()
+
+    forbidden = [name for name in args.forbid.split(",") if name]
+    failed = False
+
+    with tempfile.TemporaryDirectory() as home:
+        with open(os.path.join(home, "config.ini"), "w", encoding="utf-8") as f:
+            f.write("[Settings]\npid = 1\nsheet_id = bench\nlanguage = en\n")
+
+        for target in args.targets:
+            totals = []
+            cumulative = {}
+            exit_codes = set()
+            try:
+                for _ in range(args.repeat):
+                    modules, total, exit_code = run_once(target, home, args.cold)
+                    exit_codes.add(exit_code)
+                    totals.append(total)
+                    for name, (_, cumulative_us) in modules.items():
+                        cumulative.setdefault(name, []).append(cumulative_us)
+            except (RuntimeError, subprocess.TimeoutExpired) as e:
+                print(e, file=sys.stderr)
+                failed = True
+                continue
+
+            print(f"[{target}] total import time: median {statistics.median(totals) / 1000:.1f} ms "
+                  f"({args.repeat} runs{', cold' if args.cold else ''}), {len(cumulative)} modules")
+            if exit_codes != {0}:
+                # 예: 화면이 없는 환경에서 GUI 실행 → 창을 만들기 전까지의 import만 측정됨
+                print(f"  warning: process exited with {sorted(exit_codes)}, imports measured until exit")
+            slowest = sorted(cumulative.items(), key=lambda item: statistics.median(item[1]), reverse=True)
+            for name, values in slowest[:args.top]:
+                print(f"  {statistics.median(values) / 1000:8.1f} ms  {name}")
+
+            loaded = [name for name in forbidden if name in cumulative]
+            if loaded:
+                print(f"  FAIL: imported at startup: {', '.join(loaded)}", file=sys.stderr)
+                failed = True
+
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
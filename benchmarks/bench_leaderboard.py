@@ -0,0 +1,70 @@
+"""리더보드 파서 벤치마크: 기존 BeautifulSoup 방식 vs kda.leaderboard 스트리밍 파서
+
+사용법: python benchmarks/bench_leaderboard.py [--rows 200 1000 5000] [--repeat 5]
+"""
+import argparse
+import os
+import re
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from kda import leaderboard
+
+try:
+    from bs4 import BeautifulSoup
+except ImportError:
+    BeautifulSoup = None
+
+def make_page(rows):
+    """maps.php?raw=1 과 같은 구조의 합성 리더보드 페이지"""
+    parts = ["<html><body><table><tr><th>Rank</th><th>Player</th><th>Time</th><th>Date</th></tr>"]
+    for i in range(1, rows + 1):
+        parts.append(
+            f'<tr><td>{i}</td>'
+            f'<td><a href="players.php?pid={100000 + i}&edition=0"><span style="color:#ff0000">$f00P</span>layer{i}</a></td>'
+            f'<td>{i // 60000:02d}:{(i // 1000) % 60:02d}.{i % 1000:03d}</td>'
+            f'<td>2025-01-01 00:00:00</td></tr>'
+        )
+    parts.append("</table></body></html>")
+    return "".join(parts).encode("utf-8")
+
+def legacy_find(body, pid):
+    # 변경 전 fetch_record_time의 파싱 부분
+    soup = BeautifulSoup(body.decode("utf-8"), "html.parser")
+    for row in soup.find_all("tr"):
+        player_link = row.find("a", href=re.compile(f"pid={pid}"))
+        if player_link:
+            tds = row.find_all("td")
+            rank = int(tds[0].text.strip()) if tds else 0
+            time_str = tds[2].text.strip() if len(tds) > 2 else "0:00.000"
+            return {"rank": rank, "time": time_str}
+    return None
+
+def bench(func, repeat):
+    return min(timeit.repeat(func, number=1, repeat=repeat)) * 1000
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[200, 1000, 5000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    if BeautifulSoup is None:
+        print("beautifulsoup4 is not installed; legacy column is skipped")
+
+    print(f"{'rows':>6} {'target':>8} {'legacy ms':>10} {'stream ms':>10} {'speedup':>8}")
+    for rows in args.rows:
+        body = make_page(rows)
+        for label, position in (("top", 1), ("middle", rows // 2), ("bottom", rows), ("missing", rows + 1)):
+            pid = 100000 + position
+            stream_ms = bench(lambda: leaderboard.find_record(body, pid), args.repeat)
+            if BeautifulSoup is not None:
+                legacy_ms = bench(lambda: legacy_find(body, pid), args.repeat)
+                print(f"{rows:>6} {label:>8} {legacy_ms:>10.2f} {stream_ms:>10.2f} {legacy_ms / stream_ms:>7.1f}x")
+            else:
+                print(f"{rows:>6} {label:>8} {'-':>10} {stream_ms:>10.2f} {'-':>8}")
+
+if __name__ == "__main__":
+    main()
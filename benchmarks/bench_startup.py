@@ -0,0 +1,75 @@
+"""GUI 시작 시간 측정: main.py를 실행해 창이 처음 그려질 때까지 걸린 시간
+
+임시 데이터 폴더(KDA_HOME)에 pid / Sheet ID가 설정된 config.ini를 만들고
+KDA_STARTUP_BENCH=1로 main.py를 여러 번 실행한다 (main.py가 startup_ms를 출력하고 바로 종료).
+--offline이면 닿지 않는 프록시를 지정해 네트워크가 없는 상황에서도 창이 바로 뜨는지 확인한다.
+--max-ms를 주면 중앙값이 그보다 길 때 종료 코드 1 (테스트 / CI용).
+
+사용법: python benchmarks/bench_startup.py [--repeat 5] [--offline] [--max-ms 1500]
+"""
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MAIN_PATH = os.path.join(ROOT_DIR, "main.py")
+
+def run_once(home, offline, timeout):
+    env = dict(os.environ, KDA_HOME=home, KDA_STARTUP_BENCH="1")
+    if offline:
+        for key in ("HTTP_PROXY", "HTTPS_PROXY", "http_proxy", "https_proxy"):
+            env[key] = "http://127.0.0.1:9"
+        env.pop("NO_PROXY", None)
+        env.pop("no_proxy", None)
+
+    started = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, MAIN_PATH], env=env, cwd=home,
+        capture_output=True, text=True, encoding="utf-8", errors="replace", timeout=timeout
+    )
+    wall_ms = (time.perf_counter() - started) * 1000
+
+    match = re.search(r"startup_ms=([\d.]+)", result.stdout)
+    if not match:
+        raise RuntimeError(f"main.py did not report startup time (exit {result.returncode}):\n{result.stderr.strip()}")
+    return float(match.group(1)), wall_ms
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--pid", default="1", help="PID written to the temporary config.ini")
+    parser.add_argument("--offline", action="store_true", help="route HTTP(S) through an unreachable proxy")
+    parser.add_argument("--max-ms", type=float, help="fail if the median time to first paint exceeds this")
+    parser.add_argument("--timeout", type=float, default=60)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as home:
+        with open(os.path.join(home, "config.ini"), "w", encoding="utf-8") as f:
+            f.write(f"[Settings]\npid = {args.pid}\nsheet_id = bench\nlanguage = en\n")
+
+        paint_times, wall_times = [], []
+        for _ in range(args.repeat):
+            try:
+                paint_ms, wall_ms = run_once(home, args.offline, args.timeout)
+            except (RuntimeError, subprocess.TimeoutExpired) as e:
+                print(e, file=sys.stderr)
+                return 2
+            paint_times.append(paint_ms)
+            wall_times.append(wall_ms)
+
+    median = statistics.median(paint_times)
+    print(f"first paint: median {median:.1f} ms, max {max(paint_times):.1f} ms ({args.repeat} runs{', offline' if args.offline else ''})")
+    print(f"process wall time: median {statistics.median(wall_times):.1f} ms")
+
+    if args.max_ms is not None and median > args.max_ms:
+        print(f"FAIL: median {median:.1f} ms > {args.max_ms:.1f} ms", file=sys.stderr)
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,118 @@
+/**
+ * KK Dashboard Automator - 참고용 GAS 웹 앱 (delta 동기화 처리)
+ * Reference Apps Script web app that applies full / delta payloads from kda/sync.py.
+ *
+ * 배포: 확장 프로그램 - Apps Script 에 붙여 넣고 웹 앱으로 배포 (액세스: 모든 사용자)
+ * RECORDS_SHEET 는 대시보드 수식이 읽는 기록 시트 이름에 맞게 바꾸세요.
+ * 기록 시트: A 맵 이름, B 시간, C 랭크, D 맵 UID (행 구분용, 이름이 같은 맵도 각각 한 줄)
+ *
+ *   full : {"mode": "full", "version": n, "sheet_id", "rows": [[uid, name, time, rank]], "map_records": "name\ttime\trank\n..."}
+ *   delta: {"mode": "delta", "base_version": n, "version": n + 1, "sheet_id", "upsert": [[uid, name, time, rank]], "remove": [uid]}
+ *   응답 : {"status": "ok", "version": n} / {"status": "version_mismatch", "version": 현재 버전}
+ *   압축 : {"encoding": "gzip", "data": base64(gzip(위 JSON))}
+ */
+var RECORDS_SHEET = "map_records";
+
+function doPost(e) {
+  var payload = parsePayload_(e.postData.contents);
+  var lock = LockService.getScriptLock();
+  lock.waitLock(30000);
+  try {
+    return respond_(applyPayload_(payload));
+  } finally {
+    lock.releaseLock();
+  }
+}
+
+function parsePayload_(contents) {
+  var payload = JSON.parse(contents);
+  if (payload.encoding === "gzip") {
+    var blob = Utilities.newBlob(Utilities.base64Decode(payload.data), "application/x-gzip");
+    payload = JSON.parse(Utilities.ungzip(blob).getDataAsString("UTF-8"));
+  }
+  return payload;
+}
+
+function applyPayload_(payload) {
+  var props = PropertiesService.getScriptProperties();
+  var versionKey = "version:" + payload.sheet_id;
+  var current = Number(props.getProperty(versionKey) || 0);
+  var sheet = getRecordsSheet_(payload.sheet_id);
+
+  if (payload.mode === "delta") {
+    if (Number(payload.base_version) !== current) {
+      return {status: "version_mismatch", version: current};
+    }
+    applyDelta_(sheet, payload.upsert || [], payload.remove || []);
+  } else if (payload.rows) {
+    writeRows_(sheet, payload.rows);
+  } else {
+    // rows 가 없는 예전 클라이언트 요청 (mode 도 없음): 이름 / 시간 / 랭크 세 열만
+    var legacyRows = [];
+    String(payload.map_records || "").split("\n").forEach(function (line) {
+      var parts = line.split("\t");
+      if (parts.length === 3) {
+        legacyRows.push(["", parts[0], parts[1], parts[2]]);
+      }
+    });
+    writeRows_(sheet, legacyRows);
+  }
+
+  var version = Number(payload.version || current + 1);
+  props.setProperty(versionKey, String(version));
+  return {status: "ok", version: version};
+}
+
+function getRecordsSheet_(sheetId) {
+  var spreadsheet = SpreadsheetApp.openById(sheetId);
+  return spreadsheet.getSheetByName(RECORDS_SHEET) || spreadsheet.insertSheet(RECORDS_SHEET);
+}
+
+// [uid, name, time, rank] → 시트 행 [name, time, rank, uid]
+function toSheetRow_(row) {
+  return [row[1], row[2], row[3], row[0]];
+}
+
+// 바뀐 행만 제자리에서 수정하고, 새 행은 끝에 한 번에 추가, 삭제는 아래쪽부터 (행은 D열 UID로 찾음)
+function applyDelta_(sheet, upsert, remove) {
+  var lastRow = sheet.getLastRow();
+  var uids = lastRow ? sheet.getRange(1, 4, lastRow, 1).getDisplayValues() : [];
+  var rowIndex = {};
+  uids.forEach(function (row, i) { if (row[0]) rowIndex[row[0]] = i + 1; });
+
+  var appended = [];
+  upsert.forEach(function (row) {
+    var index = rowIndex[row[0]];
+    if (index) {
+      sheet.getRange(index, 1, 1, 4).setNumberFormat("@").setValues([toSheetRow_(row)]);
+    } else {
+      appended.push(toSheetRow_(row));
+    }
+  });
+  if (appended.length) {
+    sheet.getRange(lastRow + 1, 1, appended.length, 4).setNumberFormat("@").setValues(appended);
+  }
+
+  remove
+    .map(function (uid) { return rowIndex[uid]; })
+    .filter(function (index) { return index; })
+    .sort(function (a, b) { return b - a; })
+    .forEach(function (index) { sheet.deleteRow(index); });
+}
+
+// rows: [[uid, name, time, rank]], 이름 순 (같은 이름이면 UID 순)
+function writeRows_(sheet, rows) {
+  var values = rows.slice().sort(function (a, b) {
+    return a[1] < b[1] ? -1 : a[1] > b[1] ? 1 : a[0] < b[0] ? -1 : a[0] > b[0] ? 1 : 0;
+  }).map(toSheetRow_);
+  sheet.clearContents();
+  if (values.length) {
+    var range = sheet.getRange(1, 1, values.length, 4);
+    range.setNumberFormat("@");  // 시간 / 랭크를 문자열 그대로 저장
+    range.setValues(values);
+  }
+}
+
+function respond_(result) {
+  return ContentService.createTextOutput(JSON.stringify(result)).setMimeType(ContentService.MimeType.JSON);
+}
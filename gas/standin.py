@@ -0,0 +1,109 @@
+"""Code.gs와 같은 규칙으로 full / delta 요청을 처리하는 로컬 테스트 서버
+
+    python gas/standin.py --port 8765
+
+config.ini의 [Sync] webhook_url = http://127.0.0.1:8765/exec 로 지정하면
+구글 시트 대신 이 서버로 전송된다. 시트 내용은 메모리에만 저장되며 (--dump로 파일 저장 가능)
+GET 요청에는 현재 시트별 버전과 행을 JSON으로 돌려준다.
+"""
+import argparse
+import base64
+import gzip
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+class SheetStore:
+    def __init__(self):
+        self.sheets = {}  # sheet_id → {"version": n, "rows": {UID: [이름, 시간, 랭크]}}
+        self._lock = threading.Lock()
+
+    def apply(self, payload):
+        with self._lock:
+            sheet = self.sheets.setdefault(payload.get("sheet_id", ""), {"version": 0, "rows": {}})
+            current = sheet["version"]
+
+            if payload.get("mode") == "delta":
+                if int(payload.get("base_version", -1)) != current:
+                    return {"status": "version_mismatch", "version": current}
+                for uid in payload.get("remove", []):
+                    sheet["rows"].pop(uid, None)
+                for uid, name, time_str, rank in payload.get("upsert", []):
+                    sheet["rows"][uid] = [name, time_str, rank]
+            elif "rows" in payload:
+                sheet["rows"] = {uid: [name, time_str, rank] for uid, name, time_str, rank in payload["rows"]}
+            else:
+                # rows가 없는 예전 클라이언트 요청: UID를 모르므로 이름을 키로 사용
+                rows = {}
+                for line in str(payload.get("map_records", "")).split("\n"):
+                    parts = line.split("\t")
+                    if len(parts) == 3:
+                        rows[parts[0]] = parts
+                sheet["rows"] = rows
+
+            sheet["version"] = int(payload.get("version") or current + 1)
+            return {"status": "ok", "version": sheet["version"]}
+
+    def snapshot(self):
+        with self._lock:
+            return json.loads(json.dumps(self.sheets))
+
+def make_handler(store, dump_path=None):
+    class Handler(BaseHTTPRequestHandler):
+        def _send(self, result):
+            body = json.dumps(result, ensure_ascii=False).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length", 0))
+            payload = json.loads(self.rfile.read(length).decode("utf-8"))
+            if payload.get("encoding") == "gzip":
+                payload = json.loads(gzip.decompress(base64.b64decode(payload["data"])).decode("utf-8"))
+            if self.server.fail_next > 0:
+                # --fail N: 다음 N개 요청은 적용하지 않고 503 (outbox 재시도 확인용)
+                self.server.fail_next -= 1
+                self.send_error(503)
+                return
+            result = store.apply(payload)
+            print(
+                f"{payload.get('mode', 'full')} sheet={payload.get('sheet_id')} "
+                f"upsert={len(payload.get('upsert', []))} remove={len(payload.get('remove', []))} -> {result}",
+                flush=True
+            )
+            if dump_path:
+                with open(dump_path, "w", encoding="utf-8") as f:
+                    json.dump(store.snapshot(), f, ensure_ascii=False, indent=2)
+            self._send(result)
+
+        def do_GET(self):
+            self._send(store.snapshot())
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in for the dashboard Apps Script web app")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--dump", help="write sheet contents to this JSON file after every request")
+    parser.add_argument("--fail", type=int, default=0, help="answer the first N POST requests with 503")
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(SheetStore(), args.dump))
+    server.fail_next = args.fail
+    print(f"Listening on http://{args.host}:{args.port}/exec", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+if __name__ == "__main__":
+    main()
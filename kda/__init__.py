@@ -0,0 +1 @@
+"""KK Dashboard Automator 공용 모듈"""
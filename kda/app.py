@@ -0,0 +1,99 @@
+"""GUI와 CLI가 공유하는 실행 환경 (로그, 네트워크 설정, 리더보드 캐시, 기록 저장소, 맵 카탈로그, 동기화 outbox)"""
+import os
+
+from kda import http_client, log
+from kda.catalog import MapCatalog
+from kda.config import get_config
+from kda.http_cache import HttpCache
+from kda.log import log_message
+from kda.outbox import Outbox
+from kda.paths import BASE_DIR, CACHE_PATH, MAP_RECORDS_PATH, OUTBOX_DIR, RECORDS_DB_PATH, RECORDS_DIR
+from kda.settings import load_cache_settings, load_log_settings, load_network_settings, load_sync_settings
+from kda.store import RecordStore
+
+leaderboard_cache = None
+record_store = None
+map_catalog = None
+outbox = None
+
+def configure_logging():
+    settings = load_log_settings()
+    log.set_level(settings["level"])
+    path = settings["file"]
+    if path and not os.path.isabs(path):
+        path = os.path.join(BASE_DIR, path)
+    try:
+        log.configure_file(path, settings["file_max_kb"] * 1024, settings["file_backups"], settings["file_level"])
+    except OSError as e:
+        log_message("log_file_failed", error=e)
+
+def configure_network():
+    settings = load_network_settings()
+    http_client.configure(
+        settings["workers"],
+        rate=settings["rate"],
+        burst=settings["burst"],
+        min_concurrency=settings["min_workers"],
+        target_latency=settings["target_latency"],
+        gas_pool_size=load_sync_settings()["workers"]
+    )
+
+def open_leaderboard_cache():
+    global leaderboard_cache
+    enabled, ttl_days, max_mb = load_cache_settings()
+    if leaderboard_cache:
+        leaderboard_cache.close()
+        leaderboard_cache = None
+    if enabled:
+        try:
+            leaderboard_cache = HttpCache(CACHE_PATH, ttl=ttl_days * 86400, max_bytes=int(max_mb * 1024 * 1024))
+        except Exception as e:
+            log_message("cache_open_failed", error=e)
+
+def get_leaderboard_cache():
+    return leaderboard_cache
+
+# 기록 저장소 열기 (처음 한 번은 예전 map_records.txt / records/*.txt 가져오기)
+def open_record_store(pid=""):
+    global record_store
+    if record_store is None:
+        record_store = RecordStore(RECORDS_DB_PATH)
+    try:
+        imported = record_store.import_legacy(pid.strip(), MAP_RECORDS_PATH, RECORDS_DIR)
+        if imported:
+            log_message("legacy_imported", count=imported)
+    except Exception as e:
+        log_message("legacy_import_failed", error=e)
+    return record_store
+
+def get_record_store():
+    return record_store or open_record_store()
+
+def get_map_catalog():
+    global map_catalog
+    if map_catalog is None:
+        map_catalog = MapCatalog(get_record_store())
+    return map_catalog
+
+def get_outbox():
+    global outbox
+    if outbox is None:
+        outbox = Outbox(OUTBOX_DIR)
+    return outbox
+
+def init(pid=""):
+    configure_logging()
+    configure_network()
+    open_leaderboard_cache()
+    open_record_store(pid)
+
+def shutdown():
+    global leaderboard_cache
+    if leaderboard_cache:
+        leaderboard_cache.close()
+        leaderboard_cache = None
+    if record_store:
+        record_store.close()
+    http_client.close()
+    log.close_file()
+    get_config().flush()
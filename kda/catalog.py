@@ -0,0 +1,60 @@
+"""맵 카탈로그 (UID ↔ 이름 ↔ 에디션)
+
+edition_history의 FinishedMaps에 들어 있는 (이름, UID) 쌍을 받아올 때마다 (내 기록, 친구 기록 모두)
+records.db의 maps 테이블에 쌓고, 메모리에는 UID로 색인해 둔다.
+처음 쓸 때 한 번만 DB에서 읽고, 이후에는 새 맵이나 이름 / 에디션이 바뀐 맵만 DB에 쓴다.
+맵 이름은 서식 코드를 뺀 이름(kda.tmformat.plain_name)으로 받는다.
+
+정규화한 이름: 대소문자 / 연속 공백 차이를 무시한 이름 (maps.norm_name, 예전 TSV 기록 매칭은 SQL에서 이 열로 한다).
+"""
+import threading
+from collections import namedtuple
+
+MapEntry = namedtuple("MapEntry", ["uid", "name", "edition"])
+
+def normalize_name(name):
+    """plain_name을 거친 맵 이름 → 정규화한 이름 (서식 코드를 다시 해석하지 않음, `$`가 들어간 이름도 그대로)"""
+    return " ".join((name or "").casefold().split())
+
+class MapCatalog:
+    def __init__(self, store):
+        self._store = store
+        self._by_uid = {}
+        self._lock = threading.Lock()
+        self._loaded = False
+
+    def _load(self):
+        if self._loaded:
+            return
+        for uid, name, edition in self._store.get_maps():
+            self._by_uid[uid] = MapEntry(uid, name, edition)
+        self._loaded = True
+
+    def register(self, maps):
+        """(uid, name, edition) 목록 반영, 새로 추가된 맵 수 반환 (바뀐 것이 없으면 DB에 쓰지 않음)"""
+        with self._lock:
+            self._load()
+            added = 0
+            changed = {}
+            for uid, name, edition in maps:
+                old = self._by_uid.get(uid)
+                if old is None:
+                    added += 1
+                elif old.name == name and (edition is None or old.edition == edition):
+                    continue
+                entry = MapEntry(uid, name, old.edition if old and edition is None else edition)
+                changed[uid] = entry
+                self._by_uid[uid] = entry
+
+            if changed:
+                self._store.register_maps(changed.values())
+            return added
+
+    def total_maps(self, minimum=0):
+        """지금까지 확인된 맵 수 (minimum보다 작으면 minimum)"""
+        return max(len(self), minimum)
+
+    def __len__(self):
+        with self._lock:
+            self._load()
+            return len(self._by_uid)
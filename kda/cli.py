@@ -0,0 +1,171 @@
+"""명령줄 인터페이스 (Tk 없이 실행, 예약 작업 / 서버용)
+
+    python -m kda refresh [--sync]        내 기록 갱신 (친구 기록 시간도 함께)
+    python -m kda sync                    대시보드(구글 시트) 갱신
+    python -m kda flush                   보내지 못한 동기화 요청 다시 보내기
+    python -m kda watch [--interval 초]   바뀌었을 때만 갱신 + 동기화 (Ctrl+C로 종료)
+    python -m kda friends refresh [PID…]  친구 이름 + 맵 정보 갱신 (병렬)
+    python -m kda friends sync            Sheet ID가 있는 친구 대시보드 모두 갱신 (병렬)
+    python -m kda compare PID [--json]    친구와 기록 비교
+
+데이터 폴더는 기본적으로 프로그램 폴더이며 KDA_HOME 환경 변수로 바꿀 수 있다.
+설치하는 패키지가 아니므로 kda 폴더가 있는 프로그램 폴더에서 실행한다
+(다른 폴더에서는 PYTHONPATH에 프로그램 폴더를 지정).
+"""
+import argparse
+import json
+
+from kda import app, control
+from kda.log import LEVEL_NAMES, log_message, log_translate, set_language, set_level
+from kda.settings import load_account
+
+def _require_pid(pid):
+    if not pid:
+        log_message("no_pid")
+    return pid
+
+def cmd_refresh(args):
+    from kda.fetch import fetch_player_data
+    from kda.friends import load_friend_pids
+
+    pid = _require_pid(args.pid or args.account_pid)
+    if not pid:
+        return 2
+
+    friend_pids = [] if args.no_friends else load_friend_pids()
+    if not fetch_player_data(pid, include_time=True, friend_pids=friend_pids):
+        return 1
+    if args.sync:
+        return cmd_sync(args)
+    return 0
+
+def cmd_sync(args):
+    from kda.sync import sync_dashboard
+
+    pid = _require_pid(args.pid or args.account_pid)
+    sheet_id = args.sheet_id or args.account_sheet_id
+    if not pid:
+        return 2
+    return 0 if sync_dashboard(pid, sheet_id, full=getattr(args, "full", False)) else 1
+
+def cmd_flush(args):
+    from kda.sync import flush_outbox
+
+    left = flush_outbox(force=True)
+    log_message("sync_outbox_left", count=left) if left else log_message("sync_outbox_empty")
+    return 1 if left else 0
+
+def cmd_watch(args):
+    from kda.settings import load_watch_settings
+    from kda.watch import watch
+
+    pid = _require_pid(args.pid or args.account_pid)
+    if not pid:
+        return 2
+
+    interval = max(30.0, args.interval) if args.interval else load_watch_settings()
+    watch(
+        pid,
+        args.sheet_id or args.account_sheet_id,
+        interval=interval,
+        friend_pids=[] if args.no_friends else None,
+        sync=not args.no_sync
+    )
+    return 0
+
+def cmd_friends_refresh(args):
+    from kda.friends import refresh_friends
+
+    results = refresh_friends(args.pids, max_workers=args.workers)
+    return 1 if any(result is None for result in results.values()) else 0
+
+def cmd_friends_sync(args):
+    from kda.sync import sync_friend_dashboards
+
+    results = sync_friend_dashboards(args.workers)
+    return 1 if any(not result["ok"] for result in results) else 0
+
+def cmd_compare(args):
+    from kda.compare import compare_players
+
+    my_pid = _require_pid(args.pid or args.account_pid)
+    if not my_pid:
+        return 2
+
+    result = compare_players(my_pid, args.friend_pid)
+    if args.json:
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+        return 0
+
+    for key in ("friend_maps", "only_friend", "only_me", "worse_rank"):
+        print(log_translate("compare_section", title=log_translate(f"compare_{key}"), count=len(result[key])))
+        for map_name in result[key]:
+            print(f"  {map_name}")
+    return 0
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m kda",
+        description="KK Dashboard Automator (headless)",
+        epilog="Run from the program folder that contains the kda package (there is no installed kda command); "
+               "from another folder, add the program folder to PYTHONPATH. Set KDA_HOME to use a different data folder."
+    )
+    parser.add_argument("--pid", help="PID to use instead of config.ini [Settings] pid")
+    parser.add_argument("--lang", choices=["en", "ko"], help="log language (default: config.ini)")
+    parser.add_argument("--log-level", choices=list(LEVEL_NAMES), help="lowest log level to print (default: config.ini [Log] level)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    refresh = commands.add_parser("refresh", help="refresh my records")
+    refresh.add_argument("--no-friends", action="store_true", help="don't collect friends' times from the same pages")
+    refresh.add_argument("--sync", action="store_true", help="sync the dashboard after refreshing")
+    refresh.add_argument("--sheet-id", help="sheet ID to use with --sync")
+    refresh.set_defaults(func=cmd_refresh)
+
+    sync = commands.add_parser("sync", help="send my records to the dashboard sheet")
+    sync.add_argument("--sheet-id", help="sheet ID to use instead of config.ini [Settings] sheet_id")
+    sync.add_argument("--full", action="store_true", help="send every row instead of only the changes")
+    sync.set_defaults(func=cmd_sync)
+
+    flush = commands.add_parser("flush", help="resend queued dashboard updates now")
+    flush.set_defaults(func=cmd_flush)
+
+    watch = commands.add_parser("watch", help="refresh and sync only when cleared maps change")
+    watch.add_argument("--interval", type=float, help="seconds between checks (default: config.ini [Watch] interval, min 30)")
+    watch.add_argument("--no-friends", action="store_true", help="don't collect friends' times from the same pages")
+    watch.add_argument("--no-sync", action="store_true", help="refresh records only, don't sync the dashboard")
+    watch.add_argument("--sheet-id", help="sheet ID to use instead of config.ini [Settings] sheet_id")
+    watch.set_defaults(func=cmd_watch)
+
+    friends = commands.add_parser("friends", help="friend list commands")
+    friend_commands = friends.add_subparsers(dest="friends_command", required=True)
+    friends_refresh = friend_commands.add_parser("refresh", help="refresh friends' names and maps")
+    friends_refresh.add_argument("pids", nargs="*", help="friend PIDs (default: everyone in friends.ini)")
+    friends_refresh.add_argument("--workers", type=int, help="friends to refresh at once (default: config.ini [Network] workers)")
+    friends_refresh.set_defaults(func=cmd_friends_refresh)
+    friends_sync = friend_commands.add_parser("sync", help="refresh and sync every friend dashboard that has a sheet ID")
+    friends_sync.add_argument("--workers", type=int, help="dashboards to update at once (default: config.ini [Sync] workers)")
+    friends_sync.set_defaults(func=cmd_friends_sync)
+
+    compare = commands.add_parser("compare", help="compare my records with a friend")
+    compare.add_argument("friend_pid")
+    compare.add_argument("--json", action="store_true", help="print the result as JSON")
+    compare.set_defaults(func=cmd_compare)
+
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    args.account_pid, args.account_sheet_id, language = load_account()
+    set_language(args.lang or language)
+
+    app.init(args.pid or args.account_pid)
+    if args.log_level:
+        set_level(args.log_level)
+    try:
+        return args.func(args)
+    except (KeyboardInterrupt, InterruptedError):
+        control.request_stop()
+        log_message("script_stopped")
+        return 130
+    finally:
+        app.shutdown()
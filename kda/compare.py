@@ -0,0 +1,36 @@
+"""내 기록과 친구 기록 비교"""
+from kda.app import get_record_store
+
+# 기록 로드 ({맵 UID: Record})
+def load_records(pid):
+    if not pid:
+        return {}
+    return get_record_store().get_records(pid)
+
+def compare_players(my_pid, friend_pid):
+    my_records = load_records(my_pid)
+    friend_records = load_records(friend_pid)
+
+    friend_maps = set(friend_records.keys())
+    my_maps = set(my_records.keys())
+
+    only_friend = friend_maps - my_maps
+    only_me = my_maps - friend_maps
+    both = friend_maps & my_maps
+
+    worse_rank = []
+    for map_uid in both:
+        my_rank = my_records[map_uid].rank
+        friend_rank = friend_records[map_uid].rank
+        if my_rank and friend_rank and my_rank > friend_rank:
+            worse_rank.append(map_uid)
+
+    def names(map_uids):
+        return sorted((friend_records.get(uid) or my_records[uid]).name for uid in map_uids)
+
+    return {
+        "friend_maps": names(friend_maps),
+        "only_friend": names(only_friend),
+        "only_me": names(only_me),
+        "worse_rank": names(worse_rank)
+    }
@@ -0,0 +1,147 @@
+"""config.ini를 한 번만 읽어 메모리에 두고 쓰는 설정 객체
+
+    config = get_config()
+    pid = config.get("Settings", "pid")
+    config.set("Window", "x", 120)    # 값이 바뀔 때만 저장 예약
+    config.subscribe(on_change)       # on_change(section, key, value)
+
+- 읽기: 처음 한 번만 파일을 읽고 이후에는 메모리의 값을 사용 (get / get_int / get_float / get_bool)
+- 쓰기: set()은 값이 실제로 바뀐 경우에만 변경 알림을 보내고 WRITE_DELAY초 뒤 저장을 예약한다.
+  그 사이의 변경은 한 번의 쓰기로 합쳐지고, 임시 파일에 쓴 뒤 os.replace로 바꿔 반쯤 쓰인 파일이 남지 않는다.
+- 종료 전에는 flush()로 예약된 저장을 바로 실행한다 (app.shutdown).
+"""
+import configparser
+import io
+import os
+import tempfile
+import threading
+
+from kda.paths import CONFIG_PATH
+
+WRITE_DELAY = 0.5  # 저장 지연 (초)
+
+class Config:
+    def __init__(self, path, write_delay=WRITE_DELAY):
+        self.path = path
+        self.write_delay = write_delay
+        self._parser = configparser.ConfigParser()
+        self._lock = threading.RLock()
+        self._listeners = []
+        self._dirty = False
+        self._timer = None
+        if os.path.exists(path):
+            self._parser.read(path, encoding="utf-8")
+
+    def get(self, section, key, fallback=""):
+        with self._lock:
+            return self._parser.get(section, key, fallback=fallback).strip()
+
+    def get_int(self, section, key, fallback=0):
+        try:
+            return int(self.get(section, key, str(fallback)))
+        except ValueError:
+            return fallback
+
+    def get_float(self, section, key, fallback=0.0):
+        try:
+            return float(self.get(section, key, str(fallback)))
+        except ValueError:
+            return fallback
+
+    def get_bool(self, section, key, fallback=False):
+        value = self.get(section, key, "").lower()
+        if value in configparser.ConfigParser.BOOLEAN_STATES:
+            return configparser.ConfigParser.BOOLEAN_STATES[value]
+        return fallback
+
+    def has(self, section, key=None):
+        with self._lock:
+            if key is None:
+                return self._parser.has_section(section)
+            return self._parser.has_option(section, key)
+
+    def set(self, section, key, value):
+        """값 변경, 실제로 바뀌었으면 True (저장 예약 + 변경 알림)"""
+        return bool(self.update(section, {key: value}))
+
+    def update(self, section, values):
+        """여러 값을 한 번에 변경, 바뀐 키 목록 반환"""
+        changed = []
+        with self._lock:
+            if not self._parser.has_section(section):
+                self._parser.add_section(section)
+            for key, value in values.items():
+                value = str(value)
+                if self._parser.get(section, key, fallback=None) != value:
+                    self._parser.set(section, key, value)
+                    changed.append((key, value))
+            if changed:
+                self._schedule_write()
+            listeners = list(self._listeners)
+
+        for key, value in changed:
+            for listener in listeners:
+                listener(section, key, value)
+        return [key for key, _ in changed]
+
+    def set_defaults(self, section, defaults):
+        """없거나 비어 있는 값만 기본값으로 채움 (변경 알림 없음), 채운 것이 있으면 저장 예약"""
+        with self._lock:
+            if not self._parser.has_section(section):
+                self._parser.add_section(section)
+            changed = False
+            for key, value in defaults.items():
+                current = self._parser.get(section, key, fallback=None)
+                if current is None or (not current.strip() and str(value)):
+                    self._parser.set(section, key, str(value))
+                    changed = True
+            if changed:
+                self._schedule_write()
+            return changed
+
+    def subscribe(self, listener):
+        with self._lock:
+            self._listeners.append(listener)
+
+    def flush(self):
+        """예약된 저장을 바로 실행 (바뀐 것이 없으면 아무것도 하지 않음)"""
+        with self._lock:
+            if self._timer:
+                self._timer.cancel()
+                self._timer = None
+            if not self._dirty:
+                return
+            buffer = io.StringIO()
+            self._parser.write(buffer)
+            self._dirty = False
+            self._write(buffer.getvalue())
+
+    def _schedule_write(self):
+        self._dirty = True
+        if self._timer:
+            self._timer.cancel()
+        self._timer = threading.Timer(self.write_delay, self.flush)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _write(self, text):
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(prefix=".config-", suffix=".tmp", dir=directory)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+_config = None
+_config_lock = threading.Lock()
+
+def get_config():
+    global _config
+    with _config_lock:
+        if _config is None:
+            _config = Config(CONFIG_PATH)
+        return _config
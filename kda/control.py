@@ -0,0 +1,62 @@
+"""실행 중단 요청 관리 (작업별 취소 토큰, GUI의 중단 버튼, CLI의 Ctrl+C)
+
+핵심 로직은 check_stop()만 호출하고, 어떤 토큰을 확인할지는 실행 중인 스레드가 정한다.
+작업 스케줄러(kda.jobs)는 작업마다 새 CancelToken을 그 작업의 스레드에 설치하므로
+한 작업을 취소해도 다른 작업에는 영향이 없다. ThreadPoolExecutor에 넘기는 함수는
+bind()로 감싸 같은 토큰을 보게 한다. 토큰이 없는 스레드(CLI 등)는 프로그램 전체 토큰을 쓴다.
+"""
+import threading
+from contextlib import contextmanager
+
+class CancelToken:
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        self._event.set()
+
+    def cancelled(self):
+        return self._event.is_set()
+
+    def wait(self, timeout=None):
+        """취소되면 True, timeout이 지나면 False"""
+        return self._event.wait(timeout)
+
+    def check(self):
+        if self._event.is_set():
+            raise InterruptedError("🛑 The script was interrupted by the user.")
+
+_default_token = CancelToken()
+_local = threading.local()
+
+def current_token():
+    return getattr(_local, "token", None) or _default_token
+
+@contextmanager
+def use_token(token):
+    """with 블록 안에서 현재 스레드의 check_stop()이 token을 확인하도록 설치"""
+    previous = getattr(_local, "token", None)
+    _local.token = token
+    try:
+        yield token
+    finally:
+        _local.token = previous
+
+def bind(fn):
+    """현재 스레드의 토큰을 다른 스레드에서도 쓰도록 fn을 감쌈 (executor.submit(bind(fn), ...))"""
+    token = current_token()
+
+    def run(*args, **kwargs):
+        with use_token(token):
+            return fn(*args, **kwargs)
+
+    return run
+
+def request_stop():
+    current_token().cancel()
+
+def stop_requested():
+    return current_token().cancelled()
+
+def check_stop():
+    current_token().check()
@@ -0,0 +1,256 @@
+"""kackiestkacky.com 크롤링 (플레이어 클리어 목록, 리더보드 기록, 닉네임)
+
+같은 플레이어 / 맵을 동시에 요청하면 (친구 갱신과 실행이 겹치는 경우 등)
+요청과 파싱은 한 번만 하고 결과를 같이 사용한다 (kda.singleflight, 결과는 수정하지 않음).
+"""
+import hashlib
+import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from kda import http_client, leaderboard
+from kda.app import get_leaderboard_cache, get_map_catalog, get_record_store
+from kda.control import bind, check_stop
+from kda.log import log_message
+from kda.settings import load_network_settings
+from kda.singleflight import Group
+from kda.records import Record, to_rank
+from kda.tmformat import plain_name
+
+_inflight = Group()
+
+# 에디션별 클리어 목록 (edition_history.php) 한 번 요청, 실패 시 None
+def fetch_edition_history(pid):
+    return _inflight.do(("edition_history", str(pid)), _fetch_edition_history, pid)
+
+def _fetch_edition_history(pid):
+    url = f"https://kackiestkacky.com/hunting/editions/edition_history.php?pid={pid}&edition=0"
+    response = http_client.get(url)
+    if response.status_code != 200:
+        log_message("error", status_code=response.status_code)
+        log_message("response", response_text=response.text)
+        return None
+
+    data = response.json()
+    if not data:
+        log_message("script_output", output="❌ There is no response data.")
+        return None
+    return data
+
+# FinishedMaps / RecordsMaps 해시 (클리어 목록이나 랭크가 바뀌면 달라짐)
+def edition_generation(data):
+    generation = hashlib.sha1()
+    for entry in data:
+        generation.update(f"{entry.get('FinishedMaps', '')}|{entry.get('RecordsMaps', '')}\n".encode("utf-8"))
+    return generation.hexdigest()
+
+# 크롤링 함수 (history: 이미 받아둔 edition_history 응답이 있으면 다시 요청하지 않음)
+# (이름, 클리어 수, [Record]) 반환, 실패 시 None
+def fetch_player_data(pid, include_time=False, friend_pids=None, history=None):
+    try:
+        if include_time:
+            log_message("load_records")
+        log_message("fetching_map_uids")
+
+        data = history or fetch_edition_history(pid)
+        if not data:
+            return None
+
+        all_records = []
+        raw_name = None
+
+        finished_maps = []
+
+        for entry in data:
+            raw_name = entry.get("PlayerName") or raw_name
+            finished = entry.get("FinishedMaps", "")
+            ranks = entry.get("RecordsMaps", "")
+            if not finished or not ranks:
+                continue
+
+            parts = finished.split(";")
+            if len(parts) != 2:
+                continue
+
+            map_names_raw = parts[0].split(",")
+            map_uids = parts[1].split(",")
+            ranks_list = ranks.split(",")
+
+            # 랭크는 여기서 한 번만 정수로 변환
+            for i in range(min(len(map_names_raw), len(map_uids), len(ranks_list))):
+                finished_maps.append((plain_name(map_names_raw[i]), map_uids[i], to_rank(ranks_list[i]), entry.get("Edition")))
+
+        # 맵 카탈로그에 UID ↔ 이름 ↔ 에디션 반영 (새 맵 / 바뀐 이름만 저장) 후 기존 기록을 UID 기준으로 로드 ({uid: Record})
+        get_map_catalog().register((map_uid, map_name, edition) for map_name, map_uid, _, edition in finished_maps)
+        store = get_record_store()
+        existing_records = store.get_records(pid)
+
+        update_targets = []
+        seen_uids = set()
+
+        # 바뀐 기록만 작은 트랜잭션으로 바로 저장 (중단되어도 완료된 기록은 유지되고, 다시 실행하면 그 맵은 건너뜀)
+        with store.batch() as batch:
+            for map_name, map_uid, rank, _ in finished_maps:
+                check_stop()
+                seen_uids.add(map_uid)
+                old = existing_records.get(map_uid)
+
+                if not include_time:
+                    # 친구 기록: 랭크가 그대로면 이전에 받아둔 시간 유지
+                    record = Record.create(map_uid, map_name, old.time_ms if old and old.rank == rank else None, rank)
+                    all_records.append(record)
+                    if not old or record.result() != old.result():
+                        batch.add(pid, map_uid, record.time_ms, record.rank)
+                    continue
+
+                # 내 기록: 기존 기록 비교 (랭크가 바뀌었거나 시간이 없으면 다시 가져옴)
+                if not old or old.rank != rank or old.time_ms is None:
+                    update_targets.append((map_name, map_uid, rank, old))
+                else:
+                    all_records.append(old)
+
+            if include_time:
+                log_message("map_uid_collected", count=len(update_targets))
+
+                # 맵마다 리더보드를 한 번만 받아 내 기록과 친구들 기록을 함께 추출
+                friend_pids = [str(friend_pid) for friend_pid in (friend_pids or []) if str(friend_pid) != str(pid)]
+                results = [None] * len(update_targets)
+                target_indexes = {}
+                for i, target in enumerate(update_targets):
+                    target_indexes.setdefault(target[1], []).append(i)
+
+                for map_uid, rows, error in fetch_leaderboards([pid] + friend_pids, target_indexes):
+                    for i in target_indexes[map_uid]:
+                        map_name, _, rank, old = update_targets[i]
+
+                        if error:
+                            log_message("record_not_found", map_name=map_name, error=error)
+                            if old:
+                                results[i] = old
+                            else:
+                                results[i] = Record.create(map_uid, map_name, None, rank)
+                                batch.add(pid, map_uid, None, rank)
+                            continue
+
+                        mine = rows.get(str(pid))
+                        record = Record.create(map_uid, map_name, mine["time_ms"] if mine else None, rank)
+
+                        if old and old.time_ms == record.time_ms:
+                            log_message("record_same", map_name=map_name)
+                        else:
+                            log_message("record_updated", map_name=map_name, best_time=record.time_str, current_rank=record.rank_str)
+
+                        results[i] = record
+                        if not old or record.result() != old.result():
+                            batch.add(pid, map_uid, record.time_ms, record.rank)
+
+                        # 같은 페이지에서 얻은 친구 기록 시간도 함께 반영
+                        for friend_pid in friend_pids:
+                            friend = rows.get(friend_pid)
+                            if friend:
+                                batch.add(friend_pid, map_uid, friend["time_ms"], friend["rank"])
+
+                all_records.extend(results)
+
+            log_message("record_save")
+
+        # 더 이상 클리어 목록에 없는 맵 기록 삭제
+        removed_uids = set(existing_records) - seen_uids
+        if removed_uids:
+            store.delete_records(pid, removed_uids)
+
+        # PlayerName은 이름 캐시로도 저장 (kda.names)
+        clean_player_name = plain_name(raw_name) if raw_name else "Unknown"
+        clear_count = len(all_records)
+        store.upsert_player(pid, clean_player_name, clear_count, raw_name=raw_name)
+
+        if include_time:
+            log_message("save_complete")
+            log_message("network_stats", **http_client.stats()[http_client.KACKY_PREFIX])
+
+        return clean_player_name, clear_count, all_records
+
+    except Exception as e:
+        log_message("crawl_failed", e=str(e))
+        return None
+
+# 리더보드 한 페이지에서 여러 pid의 기록을 한 번에 추출 ({pid: {"rank", "time_ms"}})
+def fetch_leaderboard(map_uid, pids):
+    pids = sorted({str(pid) for pid in pids})
+    return _inflight.do(("leaderboard", map_uid, tuple(pids)), _fetch_leaderboard, map_uid, pids)
+
+def _fetch_leaderboard(map_uid, pids):
+    url = f"https://kackiestkacky.com/hunting/editions/maps.php?uid={map_uid}&raw=1"
+    leaderboard_cache = get_leaderboard_cache()
+    if leaderboard_cache:
+        # 페이지가 바뀌지 않았으면 저장된 파싱 결과를 그대로 사용
+        return leaderboard_cache.fetch(url, parse=lambda body: parse_leaderboard(body, pids), parse_key="rows:" + ",".join(pids))
+
+    response = http_client.get(url)
+    response.raise_for_status()
+    return parse_leaderboard(response.content, pids)
+
+def parse_leaderboard(body, pids):
+    records = leaderboard.find_records(body, pids)
+    return {pid: {"rank": record.rank, "time_ms": record.time_ms} for pid, record in records.items()}
+
+# 맵마다 리더보드를 한 번만 받아 모든 pid의 기록 추출 (완료 순서대로 (map_uid, rows, error) 반환)
+def fetch_leaderboards(pids, map_uids):
+    def fetch_one(map_uid):
+        check_stop()
+        detail_url = f"https://kackiestkacky.com/hunting/editions/maps.php?uid={map_uid}"
+        log_message("accessing", url=detail_url)
+        return fetch_leaderboard(map_uid, pids)
+
+    executor = ThreadPoolExecutor(max_workers=load_network_settings()["workers"])
+    futures = {executor.submit(bind(fetch_one), map_uid): map_uid for map_uid in map_uids}
+    try:
+        for future in as_completed(futures):
+            check_stop()
+            map_uid = futures[future]
+            try:
+                rows = future.result()
+            except InterruptedError:
+                raise
+            except Exception as e:
+                yield map_uid, None, e
+            else:
+                yield map_uid, rows, None
+    finally:
+        # 중단 시 대기 중인 작업은 취소하고 진행 중인 요청은 기다리지 않음
+        executor.shutdown(wait=False, cancel_futures=True)
+
+# 유저 페이지의 닉네임을 (텍스트, 색상, 굵기, 기울임) 조각으로 가져오기 (색상 없는 조각은 None)
+# 보통은 kda.names.get_name_parts를 통해 edition_history 데이터가 없을 때만 사용
+def fetch_name_parts(pid):
+    return _inflight.do(("name_parts", str(pid)), _fetch_name_parts, pid)
+
+def _fetch_name_parts(pid):
+    from bs4 import BeautifulSoup
+
+    url = f"https://kackiestkacky.com/hunting/editions/players.php?pid={pid}&edition=0"
+    response = http_client.get(url)
+    soup = BeautifulSoup(response.text, "html.parser")
+    h4 = soup.find("h4", class_="text-center padding-top")
+    if not h4:
+        return None
+
+    if all(isinstance(child, str) for child in h4.contents):
+        full_text = h4.get_text(strip=True)
+        if "on All Editions" in full_text:
+            return [(full_text.split("on All Editions")[0].strip(), None, None, None)]
+        return [(full_text.strip(), None, None, None)]
+
+    parts = []
+    for part in h4.contents:
+        if isinstance(part, str):
+            if "on All Editions" in part:
+                break
+            parts.append((part, None, None, None))
+        elif part.name == "span":
+            style = part.get("style", "")
+            color_match = re.search(r"color:(#[0-9a-fA-F]{6})", style)
+            color = color_match.group(1) if color_match else "#000000"
+            weight = "bold" if "font-weight:bold" in style else "normal"
+            slant = "italic" if "font-style:italic" in style else "roman"
+            parts.append((part.get_text(), color, weight, slant))
+    return parts
@@ -0,0 +1,155 @@
+"""friends.ini 친구 목록 관리"""
+import configparser
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from kda.control import bind, check_stop
+from kda.fetch import fetch_player_data
+from kda.log import log_message
+from kda.paths import FRIENDS_PATH
+from kda.settings import load_network_settings
+
+# 여러 친구를 병렬로 갱신할 때 friends.ini 읽기-수정-쓰기가 섞이지 않도록
+_write_lock = threading.Lock()
+
+def read_friends_ini():
+    config = configparser.ConfigParser()
+    if os.path.exists(FRIENDS_PATH):
+        config.read(FRIENDS_PATH, encoding="utf-8")
+    return config
+
+def write_friends_ini(config):
+    with open(FRIENDS_PATH, "w", encoding="utf-8") as f:
+        config.write(f)
+
+def load_friend_pids():
+    config = read_friends_ini()
+    return [config.get(section, "pid", fallback=section) for section in config.sections()]
+
+def load_friends():
+    config = configparser.ConfigParser()
+    if not os.path.exists(FRIENDS_PATH):
+        log_message("script_output", output="❌ friends.ini is missing!")
+        return []
+
+    config.read(FRIENDS_PATH, encoding="utf-8")
+    friends = []
+
+    log_message("friends_ini_loaded")
+    for section in config.sections():
+        if section.startswith("friend_") or section.isdigit():  # <- 숫자 PID인 경우 처리
+            try:
+                friend = {
+                    "pid": config.get(section, "pid", fallback=section),
+                    "sheet_id": config.get(section, "sheet_id", fallback=""),
+                    "name": config.get(section, "name", fallback="Unknown"),
+                    "clear_count": config.getint(section, "clear_count", fallback=0),
+                    "cleared_map": config.get(section, "cleared_map", fallback="").split(", ")
+                }
+                friends.append(friend)
+                # log_message("script_output", output=f"✅ 친구 로드됨: {friend['name']} (맵 {friend['clear_count']}개)")
+            except Exception as e:
+                log_message("friend_load_failed", section=section, e=e)
+
+    return friends
+
+def is_friend(pid):
+    return pid in read_friends_ini().sections()
+
+def save_friend(pid, name, clear_count, sheet_id=""):
+    with _write_lock:
+        config = read_friends_ini()
+        config[pid] = {
+            "pid": pid,
+            "name": name,
+            "clear_count": str(clear_count),
+            "sheet_id": sheet_id
+        }
+        write_friends_ini(config)
+
+def update_friend(pid, name, clear_count):
+    with _write_lock:
+        config = read_friends_ini()
+        if pid in config:
+            config[pid]["name"] = name
+            config[pid]["clear_count"] = str(clear_count)
+            write_friends_ini(config)
+
+def update_friends(updates):
+    """{pid: (name, clear_count)}를 한 번의 friends.ini 쓰기로 반영"""
+    with _write_lock:
+        config = read_friends_ini()
+        changed = False
+        for pid, (name, clear_count) in updates.items():
+            if pid in config:
+                config[pid]["name"] = name
+                config[pid]["clear_count"] = str(clear_count)
+                changed = True
+        if changed:
+            write_friends_ini(config)
+
+def delete_friend(pid):
+    with _write_lock:
+        config = read_friends_ini()
+        if pid in config.sections():
+            config.remove_section(pid)
+            write_friends_ini(config)
+
+# 이름 + 맵 정보를 다시 가져오기 (friends.ini는 건드리지 않음, 실패 시 None)
+# 이름은 같은 edition_history 응답의 PlayerName을 사용 (유저 페이지 요청 없음)
+# include_time=True면 내 기록처럼 리더보드에서 시간까지 가져옴 (대시보드 전송용)
+def fetch_friend(pid, include_time=False):
+    check_stop()
+    result = fetch_player_data(pid, include_time=include_time)
+    if not result:
+        return None
+
+    name, clear_count, _ = result
+    return name, clear_count
+
+# 이름 + 맵 정보를 다시 가져와 friends.ini 갱신 (실패 시 None)
+def refresh_friend(pid, include_time=False):
+    result = fetch_friend(pid, include_time)
+    if result:
+        update_friend(pid, *result)
+    return result
+
+def refresh_friends(pids=None, on_result=None, max_workers=None):
+    """친구들을 병렬로 갱신하고 friends.ini는 마지막에 한 번만 저장
+
+    on_result(pid, (name, clear_count) 또는 None)는 친구 한 명이 끝날 때마다 (작업 스레드에서) 호출된다.
+    {pid: (name, clear_count) 또는 None} 반환.
+    """
+    pids = [str(pid) for pid in (pids or load_friend_pids())]
+    if not pids:
+        return {}
+
+    results = {}
+    executor = ThreadPoolExecutor(max_workers=min(max_workers or load_network_settings()["workers"], len(pids)))
+    futures = {executor.submit(bind(fetch_friend), pid): pid for pid in pids}
+    try:
+        for future in as_completed(futures):
+            check_stop()
+            pid = futures[future]
+            try:
+                result = future.result()
+            except InterruptedError:
+                raise
+            except Exception as e:
+                log_message("crawl_failed", e=str(e))
+                result = None
+
+            results[pid] = result
+            if result:
+                log_message("friend_refresh_done", name=result[0], count=result[1])
+            else:
+                log_message("friend_refresh_failed", pid=pid)
+            if on_result:
+                on_result(pid, result)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+        # 중단되어도 그때까지 받은 결과는 저장
+        update_friends({pid: result for pid, result in results.items() if result})
+
+    return results
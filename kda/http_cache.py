@@ -0,0 +1,160 @@
+"""리더보드 페이지용 디스크 HTTP 캐시
+
+URL별로 응답 본문(zlib 압축), ETag/Last-Modified, 본문 해시, 파싱 결과를 SQLite 파일에 저장한다.
+다시 요청할 때는 조건부 요청(If-None-Match / If-Modified-Since)을 보내고,
+304 응답이거나 본문 해시가 같으면 저장된 파싱 결과를 그대로 재사용한다.
+오래된 항목은 TTL로 (열 때와 이후 PURGE_INTERVAL마다), 전체 크기는 LRU 방식으로 제한한다.
+URL마다 파싱 결과는 최근에 쓴 MAX_PARSE_KEYS개(parse_key 기준)만 남긴다.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+
+from kda import http_client
+
+PURGE_INTERVAL = 3600  # 만료 항목 정리 주기 (초, 감시 모드처럼 오래 켜 두는 경우)
+MAX_PARSE_KEYS = 8     # URL당 보관하는 파싱 결과 수 (친구 목록이 바뀔 때마다 새 parse_key가 생김)
+
+class HttpCache:
+    def __init__(self, path, ttl=7 * 24 * 3600, max_bytes=64 * 1024 * 1024):
+        self.path = path
+        self.ttl = ttl              # 마지막 다운로드 후 이 시간이 지나면 항목 삭제
+        self.max_bytes = max_bytes  # 저장된 본문 크기 합계 상한 (넘으면 LRU 삭제)
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS entries (
+                url TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                body_hash TEXT NOT NULL,
+                body BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                parsed TEXT NOT NULL DEFAULT '{}',
+                fetched_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed_at)")
+        self._conn.commit()
+
+        with self._lock:
+            self._purge_expired()
+            self._evict()
+
+    def fetch(self, url, parse, parse_key):
+        """url을 가져와 parse(body: bytes) 결과를 반환 (본문이 그대로면 파싱 생략)"""
+        entry = self._load(url)
+        now = time.time()
+
+        headers = {}
+        if entry:
+            if entry["etag"]:
+                headers["If-None-Match"] = entry["etag"]
+            if entry["last_modified"]:
+                headers["If-Modified-Since"] = entry["last_modified"]
+
+        response = http_client.get(url, headers=headers)
+
+        if response.status_code == 304 and entry:
+            body = entry["body"]
+            body_hash = entry["body_hash"]
+            etag = response.headers.get("ETag", entry["etag"])
+            last_modified = response.headers.get("Last-Modified", entry["last_modified"])
+        else:
+            response.raise_for_status()
+            body = response.content
+            body_hash = hashlib.sha1(body).hexdigest()
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+
+        unchanged = entry is not None and entry["body_hash"] == body_hash
+        parsed = entry["parsed"] if unchanged else {}
+
+        if parse_key in parsed:
+            result = parsed.pop(parse_key)
+        else:
+            result = parse(body)
+        # 방금 쓴 parse_key를 맨 뒤로 (dict 순서 = 최근 사용 순), 오래된 것부터 정리
+        parsed[parse_key] = result
+        while len(parsed) > MAX_PARSE_KEYS:
+            del parsed[next(iter(parsed))]
+
+        self._store(url, etag, last_modified, body_hash, body, parsed, now, rewrite_body=not unchanged)
+        return result
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def _load(self, url):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT etag, last_modified, body_hash, body, parsed, fetched_at FROM entries WHERE url = ?",
+                (url,)
+            ).fetchone()
+        if not row:
+            return None
+        etag, last_modified, body_hash, body, parsed, fetched_at = row
+        try:
+            body = zlib.decompress(body)
+            parsed = json.loads(parsed)
+        except (zlib.error, ValueError):
+            return None
+        return {
+            "etag": etag,
+            "last_modified": last_modified,
+            "body_hash": body_hash,
+            "body": body,
+            "parsed": parsed,
+            "fetched_at": fetched_at
+        }
+
+    def _store(self, url, etag, last_modified, body_hash, body, parsed, now, rewrite_body=True):
+        parsed_json = json.dumps(parsed, ensure_ascii=False)
+        with self._lock:
+            if now - self._purged_at >= PURGE_INTERVAL:
+                self._purge_expired()
+
+            if not rewrite_body:
+                # 본문이 같으면 메타데이터와 파싱 결과만 갱신
+                self._conn.execute(
+                    "UPDATE entries SET etag = ?, last_modified = ?, parsed = ?, fetched_at = ?, accessed_at = ? WHERE url = ?",
+                    (etag, last_modified, parsed_json, now, now, url)
+                )
+                self._conn.commit()
+                return
+
+            compressed = zlib.compress(body)
+            old = self._conn.execute("SELECT size FROM entries WHERE url = ?", (url,)).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (url, etag, last_modified, body_hash, body, size, parsed, fetched_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (url, etag, last_modified, body_hash, compressed, len(compressed), parsed_json, now, now)
+            )
+            self._total += len(compressed) - (old[0] if old else 0)
+            self._evict()
+            self._conn.commit()
+
+    def _purge_expired(self):
+        self._purged_at = time.time()
+        self._conn.execute("DELETE FROM entries WHERE fetched_at < ?", (self._purged_at - self.ttl,))
+        self._total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        self._conn.commit()
+
+    def _evict(self):
+        # 가장 오래 사용되지 않은 항목부터 삭제
+        while self._total > self.max_bytes:
+            row = self._conn.execute("SELECT url, size FROM entries ORDER BY accessed_at LIMIT 1").fetchone()
+            if not row:
+                self._total = 0
+                break
+            self._conn.execute("DELETE FROM entries WHERE url = ?", (row[0],))
+            self._total -= row[1]
+        self._conn.commit()
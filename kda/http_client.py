@@ -0,0 +1,131 @@
+"""kackiestkacky.com / GAS 웹 앱 요청을 위한 공용 HTTP 클라이언트
+
+모든 요청은 하나의 requests.Session을 공유하므로 keep-alive 연결이 재사용되고,
+호스트별 연결 풀 크기, 공통 타임아웃, 5xx/429 재시도(백오프)가 한 곳에서 적용된다.
+카키 사이트 요청은 kda.ratelimit.HostLimiter를 거쳐 속도와 동시성이 제한된다.
+같은 주소에 대한 GET이 동시에 들어오면 요청은 한 번만 보내고 응답을 같이 사용한다 (kda.singleflight).
+"""
+import threading
+import time
+
+from kda.ratelimit import HostLimiter, THROTTLE_STATUS
+from kda.singleflight import Group
+
+KACKY_PREFIX = "https://kackiestkacky.com/"
+GAS_PREFIXES = ("https://script.google.com/", "https://script.googleusercontent.com/")
+
+USER_AGENT = "Mozilla/5.0"
+TIMEOUT = (5, 30)  # (연결, 읽기) 초
+RETRY_STATUS = THROTTLE_STATUS
+
+_session = None
+_pool_size = 8
+_gas_pool_size = 2
+_limiters = {KACKY_PREFIX: HostLimiter()}
+_lock = threading.Lock()
+_inflight = Group()
+
+def _retry(methods):
+    from urllib3.util.retry import Retry
+
+    return Retry(
+        total=3,
+        backoff_factor=0.5,  # 0.5s, 1s, 2s
+        status_forcelist=RETRY_STATUS,
+        allowed_methods=frozenset(methods),
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+
+# requests는 첫 요청 때 불러온다 (GUI 첫 화면 / CLI 시작 시간 단축)
+def _build_session(pool_size, gas_pool_size):
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    session.headers["User-Agent"] = USER_AGENT
+
+    # 카키 사이트는 워커 수만큼 연결을 유지
+    kacky_adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=_retry(["GET", "HEAD"]))
+    session.mount(KACKY_PREFIX, kacky_adapter)
+
+    # GAS 웹 앱은 호출 수가 적고, 전체 전송은 시트를 덮어쓰고 delta는 버전을 확인하므로 POST도 재시도 가능
+    gas_adapter = HTTPAdapter(pool_connections=len(GAS_PREFIXES), pool_maxsize=gas_pool_size, max_retries=_retry(["GET", "POST"]))
+    for prefix in GAS_PREFIXES:
+        session.mount(prefix, gas_adapter)
+
+    return session
+
+def configure(pool_size, rate=5.0, burst=10, min_concurrency=1, target_latency=2.0, gas_pool_size=2):
+    """카키 사이트 / GAS 연결 풀 크기와 속도/동시성 제한 설정 (풀 크기가 바뀌면 세션을 새로 만든다)"""
+    global _session, _pool_size, _gas_pool_size
+    pool_size = max(1, int(pool_size))
+    gas_pool_size = max(1, int(gas_pool_size))
+    old_session = None
+    with _lock:
+        _limiters[KACKY_PREFIX] = HostLimiter(pool_size, min_concurrency, rate, burst, target_latency)
+        if (pool_size, gas_pool_size) != (_pool_size, _gas_pool_size):
+            old_session = _session
+            _pool_size = pool_size
+            _gas_pool_size = gas_pool_size
+            _session = None
+    if old_session is not None:
+        old_session.close()
+
+def stats():
+    """호스트별 현재 동시성 / 전송 속도 / 평균 지연"""
+    with _lock:
+        limiters = dict(_limiters)
+    return {prefix: limiter.stats() for prefix, limiter in limiters.items()}
+
+def get_session():
+    global _session
+    with _lock:
+        if _session is None:
+            _session = _build_session(_pool_size, _gas_pool_size)
+        return _session
+
+def _limiter_for(url):
+    with _lock:
+        for prefix, limiter in _limiters.items():
+            if url.startswith(prefix):
+                return limiter
+    return None
+
+def request(method, url, **kwargs):
+    kwargs.setdefault("timeout", TIMEOUT)
+    limiter = _limiter_for(url)
+    if limiter is None:
+        return get_session().request(method, url, **kwargs)
+
+    limiter.acquire()
+    started = time.monotonic()
+    try:
+        response = get_session().request(method, url, **kwargs)
+    except Exception:
+        limiter.release(time.monotonic() - started, failed=True)
+        raise
+
+    # urllib3가 내부에서 재시도한 429/5xx 응답도 제한 신호로 반영
+    retries = getattr(response.raw, "retries", None)
+    history = getattr(retries, "history", None) or ()
+    throttled_retries = sum(1 for item in history if item.status in THROTTLE_STATUS)
+    limiter.release(time.monotonic() - started, response.status_code, throttled_retries=throttled_retries)
+    return response
+
+def get(url, **kwargs):
+    # 헤더 외의 옵션이 없을 때만 합침 (stream이 아니므로 응답 본문은 이미 다 받은 상태로 공유됨)
+    if set(kwargs) <= {"headers"}:
+        key = (url, tuple(sorted((kwargs.get("headers") or {}).items())))
+        return _inflight.do(key, request, "GET", url, **kwargs)
+    return request("GET", url, **kwargs)
+
+def post(url, **kwargs):
+    return request("POST", url, **kwargs)
+
+def close():
+    global _session
+    with _lock:
+        session, _session = _session, None
+    if session is not None:
+        session.close()
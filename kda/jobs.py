@@ -0,0 +1,162 @@
+"""백그라운드 작업 스케줄러 (GUI의 실행 / 감시 / 친구 작업을 한곳에서 실행)
+
+    scheduler = JobScheduler()
+    scheduler.submit(("run", pid), run, pid, priority=HIGH, resources=(RECORDS,))
+
+- 우선순위: 숫자가 작을수록 먼저 실행 (같으면 넣은 순서)
+- 자원 잠금: 같은 자원(records.db, friends.ini)을 쓰는 작업은 한 번에 하나만 실행되고,
+  겹치는 자원이 없는 작업끼리는 동시에 실행된다
+- 중복 제거: 같은 key의 작업이 아직 대기 중이면 새로 넣지 않고 그 작업을 돌려준다
+  (실행 중인 작업은 해당 없음, 끝난 뒤 한 번 더 실행됨)
+- 취소: 작업마다 CancelToken이 있어 그 작업만 취소할 수 있다 (대기 중이면 실행되지 않음)
+"""
+import heapq
+import itertools
+import threading
+
+from kda import control
+from kda.log import log_message
+
+HIGH, NORMAL, LOW = 0, 10, 20
+
+RECORDS = "records"  # records.db (기록, 닉네임, 동기화 상태)와 outbox
+FRIENDS = "friends"  # friends.ini
+
+class Job:
+    def __init__(self, key, fn, args, kwargs, priority, resources):
+        self.key = key
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.priority = priority
+        self.resources = frozenset(resources)
+        self.token = control.CancelToken()
+        self.result = None
+        self.error = None
+        self._done = threading.Event()
+
+    def cancel(self):
+        self.token.cancel()
+
+    def cancelled(self):
+        return self.token.cancelled()
+
+    def done(self):
+        return self._done.is_set()
+
+    def wait(self, timeout=None):
+        return self._done.wait(timeout)
+
+class JobScheduler:
+    def __init__(self, workers=3):
+        self._max_workers = workers
+        self._threads = []
+        self._heap = []  # (priority, 순번, Job)
+        self._counter = itertools.count()
+        self._pending = {}  # key → 대기 중인 Job
+        self._running = set()
+        self._busy = set()  # 실행 중인 작업이 잡고 있는 자원
+        self._idle = 0
+        self._cond = threading.Condition()
+        self._closed = False
+
+    def submit(self, key, fn, *args, priority=NORMAL, resources=(), **kwargs):
+        """작업 넣기, 같은 key가 대기 중이면 그 Job을 반환 (우선순위는 더 높은 쪽으로)"""
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("scheduler is shut down")
+
+            job = self._pending.get(key)
+            if job is not None:
+                if priority < job.priority:
+                    job.priority = priority
+                    heapq.heappush(self._heap, (priority, next(self._counter), job))
+                return job
+
+            job = Job(key, fn, args, kwargs, priority, resources)
+            self._pending[key] = job
+            heapq.heappush(self._heap, (priority, next(self._counter), job))
+            if not self._idle and len(self._threads) < self._max_workers:
+                thread = threading.Thread(target=self._worker, daemon=True)
+                self._threads.append(thread)
+                thread.start()
+            self._cond.notify_all()
+            return job
+
+    def cancel(self, key):
+        """key 작업을 취소 (대기 중 / 실행 중 모두), 취소한 작업 수 반환"""
+        with self._cond:
+            jobs = [job for job in list(self._pending.values()) + list(self._running) if job.key == key]
+            for job in jobs:
+                job.cancel()
+            self._cond.notify_all()
+            return len(jobs)
+
+    def cancel_all(self):
+        """모든 작업 취소 (중단 버튼), 취소한 작업 수 반환"""
+        with self._cond:
+            jobs = list(self._pending.values()) + list(self._running)
+            for job in jobs:
+                job.cancel()
+            self._cond.notify_all()
+            return len(jobs)
+
+    def shutdown(self):
+        """새 작업을 받지 않고 남은 작업을 모두 취소 (작업 스레드는 daemon이라 기다리지 않음)"""
+        with self._cond:
+            self._closed = True
+        self.cancel_all()
+
+    def _next_job(self):
+        """실행할 수 있는 가장 우선순위 높은 작업을 꺼냄 (잠금 안에서 호출), 없으면 None"""
+        # 우선순위가 올라가며 남은 예전 항목 정리
+        self._heap = [entry for entry in self._heap
+                      if self._pending.get(entry[2].key) is entry[2] and entry[0] == entry[2].priority]
+        heapq.heapify(self._heap)
+
+        for entry in sorted(self._heap):
+            job = entry[2]
+            if job.cancelled() or not (job.resources & self._busy):
+                self._heap.remove(entry)
+                heapq.heapify(self._heap)
+                del self._pending[job.key]
+                return job
+        return None
+
+    def _worker(self):
+        while True:
+            with self._cond:
+                job = self._next_job()
+                while job is None:
+                    if self._closed:
+                        return
+                    self._idle += 1
+                    self._cond.wait()
+                    self._idle -= 1
+                    job = self._next_job()
+
+                if job.cancelled():
+                    job._done.set()
+                    continue
+                self._busy |= job.resources
+                self._running.add(job)
+
+            try:
+                self._run(job)
+            finally:
+                with self._cond:
+                    self._busy -= job.resources
+                    self._running.discard(job)
+                    self._cond.notify_all()
+
+    def _run(self, job):
+        with control.use_token(job.token):
+            try:
+                job.result = job.fn(*job.args, **job.kwargs)
+            except InterruptedError:
+                pass
+            except Exception as e:
+                job.error = e
+                log_message("unexpected_error", error=str(e))
+            finally:
+                job._done.set()
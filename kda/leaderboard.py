@@ -0,0 +1,122 @@
+"""maps.php?raw=1 리더보드 페이지용 스트리밍 파서
+
+전체 트리를 만들지 않고 바이트를 조각 단위로 디코딩해 HTMLParser에 넣으며,
+찾는 pid의 행을 만나면 그 자리에서 파싱을 멈춘다.
+"""
+import codecs
+import re
+from collections import namedtuple
+from html.parser import HTMLParser
+
+CHUNK_SIZE = 16 * 1024
+
+PID_RE = re.compile(r"[?&]pid=(\d+)(?:&|#|$)")
+
+LeaderboardRecord = namedtuple("LeaderboardRecord", ["rank", "time_ms"])
+
+def parse_time(text):
+    """'00:01.234', '01:12.34', '1:02:03.456', '1.23' 형식을 정수 밀리초로 변환"""
+    text = text.strip()
+    if not text:
+        raise ValueError("empty time")
+
+    *head, seconds = text.split(":")
+    whole, _, fraction = seconds.partition(".")
+    ms = int(whole or 0) * 1000 + int((fraction + "000")[:3])
+
+    multiplier = 60 * 1000
+    for part in reversed(head):
+        ms += int(part) * multiplier
+        multiplier *= 60
+    return ms
+
+def format_time(time_ms):
+    """map_records.txt 형식으로 변환 (1분 미만 → '1.23', 그 외 → '01:12.340')"""
+    minutes, ms = divmod(int(time_ms), 60 * 1000)
+    if minutes == 0:
+        return str(ms / 1000)
+    return f"{minutes:02d}:{ms // 1000:02d}.{ms % 1000:03d}"
+
+class _LeaderboardParser(HTMLParser):
+    def __init__(self, pids):
+        super().__init__(convert_charrefs=True)
+        self.pending = {str(pid) for pid in pids}
+        self.found = {}
+        self._cells = None     # 현재 <tr>의 셀 텍스트
+        self._cell = None      # 현재 <td>의 텍스트 조각
+        self._row_pid = None
+
+    @property
+    def done(self):
+        return not self.pending
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "tr":
+            self._cells = []
+            self._cell = None
+            self._row_pid = None
+        elif self._cells is None:
+            return
+        elif tag in ("td", "th"):
+            self._close_cell()
+            self._cell = []
+        elif tag == "a" and self._row_pid is None:
+            match = PID_RE.search(dict(attrs).get("href") or "")
+            if match and match.group(1) in self.pending:
+                self._row_pid = match.group(1)
+
+    def handle_endtag(self, tag):
+        if self._cells is None:
+            return
+        if tag in ("td", "th"):
+            self._close_cell()
+        elif tag == "tr":
+            self._close_cell()
+            if self._row_pid:
+                self._finish_row()
+            self._cells = None
+
+    def handle_data(self, data):
+        if self._cell is not None:
+            self._cell.append(data)
+
+    def _close_cell(self):
+        if self._cell is not None:
+            self._cells.append("".join(self._cell).strip())
+            self._cell = None
+
+    def _finish_row(self):
+        cells = self._cells
+        rank = int(cells[0]) if cells and cells[0] else 0
+        time_ms = parse_time(cells[2]) if len(cells) > 2 else 0
+        self.found[self._row_pid] = LeaderboardRecord(rank, time_ms)
+        self.pending.discard(self._row_pid)
+
+def _iter_chunks(body):
+    if isinstance(body, (bytes, bytearray, memoryview)):
+        view = memoryview(body)
+        for start in range(0, len(view), CHUNK_SIZE):
+            yield view[start:start + CHUNK_SIZE]
+    else:
+        yield from body
+
+def _parse(body, pids, encoding="utf-8"):
+    parser = _LeaderboardParser(pids)
+    decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+
+    for chunk in _iter_chunks(body):
+        parser.feed(decoder.decode(chunk))
+        if parser.done:
+            return parser.found
+
+    parser.feed(decoder.decode(b"", final=True))
+    parser.close()
+    return parser.found
+
+def find_record(body, pid, encoding="utf-8"):
+    """리더보드 본문(bytes 또는 bytes 조각 iterable)에서 pid의 기록을 찾아 반환, 없으면 None"""
+    return _parse(body, [pid], encoding).get(str(pid))
+
+def find_records(body, pids, encoding="utf-8"):
+    """한 번의 파싱으로 여러 pid의 기록을 찾아 {pid: LeaderboardRecord} 반환 (없는 pid는 빠짐)"""
+    return _parse(body, pids, encoding)
@@ -0,0 +1,319 @@
+"""로그 메시지 번역과 출력 대상 관리
+
+핵심 로직은 log_message(key, **kwargs)만 호출하고, 메시지가 어디에 출력될지는
+set_sink()로 정한다 (GUI: QueueSink → 로그 창, CLI: 표준 출력).
+출력 대상은 sink(message, level)로 호출되며 수준에 따라 보여줄지는 출력 대상이 정한다.
+configure_file()로 회전 로그 파일을 켜면 수준에 맞는 메시지가 파일에도 함께 기록된다.
+"""
+import os
+import queue
+import sys
+
+language = "en"
+
+# 로그 수준 (logging 모듈과 같은 값, 로그 파일을 켤 때만 logging을 import)
+DEBUG, INFO, WARNING, ERROR = 10, 20, 30, 40
+LEVEL_NAMES = {"debug": DEBUG, "info": INFO, "warning": WARNING, "error": ERROR}
+
+# INFO가 아닌 메시지 (맵마다 반복되는 진행 메시지는 DEBUG라 기본 설정에서는 보이지 않음)
+log_levels = {
+    "accessing": DEBUG,
+    "record_same": DEBUG,
+    "no_settings": WARNING,
+    "dropdown_not_found": WARNING,
+    "record_not_found": WARNING,
+    "python_not_found": WARNING,
+    "missing_libraries": WARNING,
+    "friend_load_failed": WARNING,
+    "legacy_import_failed": WARNING,
+    "cache_open_failed": WARNING,
+    "watch_poll_failed": WARNING,
+    "sync_version_mismatch": WARNING,
+    "sync_queued": WARNING,
+    "sync_outbox_left": WARNING,
+    "friend_sync_none": WARNING,
+    "log_file_failed": WARNING,
+    "error": ERROR,
+    "error_occurred": ERROR,
+    "unexpected_error": ERROR,
+    "file_not_found": ERROR,
+    "fail": ERROR,
+    "install_failed": ERROR,
+    "requirements_missing": ERROR,
+    "map_records_missing": ERROR,
+    "readme_missing": ERROR,
+    "name_crawl_failed": ERROR,
+    "crawl_failed": ERROR,
+    "no_pid": ERROR,
+    "friend_refresh_failed": ERROR,
+    "sync_send_failed": ERROR,
+    "friend_sync_failed": ERROR
+}
+
+log_translations = {
+    "ko": {
+        "config_saved": "✅ config.ini 저장 완료!",
+        # "config_not_found": "⚠ config.ini 파일이 존재하지 않아 기본값을 생성합니다.",
+        # "script_running": "🔄 {script_name} 실행 중...",
+        # "script_completed": "✅ {script_name} 실행 완료!",
+        "script_stopped": "⛔ 스크립트 실행 중단됨.",
+        # "no_script_running": "⚠ 실행 중인 스크립트가 없습니다.",
+        "error_occurred": "❌ 오류 발생: {error}",
+        "installing_libraries": "📦 필수 라이브러리 설치 중...",
+        "installation_complete": "✅ 필수 라이브러리 설치 완료!",
+        "file_not_found": "❌ {file} 파일이 존재하지 않습니다.",
+        "install_output": "📦 {output}",
+        "script_output": "📜 {output}",
+        "load_settings": "📥 설정 파일 로드 중...",
+        "load_complete": "✅ 설정 로드 완료 - PID: {pid}, Sheet ID: {sheet_id}",
+        "no_settings": "⚠ 설정 파일 없음! 기본값 사용",
+        "load_records": "📂 기존 기록 로드 중...",
+        "fetching_map_uids": "📂 클리어한 맵 UID 수집 중...",
+        "accessing": "🌍 접근 중: {url}",
+        "change_filter": "🔄 필터를 'All'로 변경 완료. 테이블이 다시 로드될 때까지 대기 중...",
+        "record_updated": "✅ {map_name} 기록 갱신됨: {best_time} (랭크: {current_rank})\n",
+        "record_same": "✅ {map_name} 기존 기록과 동일함\n",
+        "record_save": "📂 갱신된 기록 저장 중...",
+        "save_complete": "✅ 모든 기록이 records.db에 저장됨.\n",
+        "map_uid_collected": "🔹 {count}개의 갱신된 클리어 맵 UID 수집 완료.\n",
+        "dropdown_not_found": "⚠️ 드롭다운을 찾지 못함. 기본 10개 기록만 가져옴.",
+        "record_not_found": "⚠️ {map_name} 기록 찾기 실패: {error}",
+        "send_request": "📤 GAS 웹 앱 호출 중...",
+        "success": "✅ GAS 웹 앱 호출 성공: {response}\n",
+        "fail": "❌ GAS 웹 앱 호출 실패. 상태 코드: {status_code}",
+        "response": "응답 내용: {response_text}",
+        "language_changed": "🌐 언어가 변경되었습니다.",
+        "all_components_installed": "✅ 모든 필수 구성 요소가 설치되어 있습니다.",
+        "first_run": "🎯 첫 실행입니다. 환경을 점검합니다...",
+        "start_env_check": "🧪 환경 점검 시작 (최초 실행)",
+        "current_python": "📍 현재 실행 중인 Python 경로: {current_python_path}",
+        "python_in_path": "✅ 시스템 PATH에 등록된 python: {python_in_path}",
+        "python_not_found": "⚠️ 시스템 PATH에 'python' 명령어가 등록되어 있지 않습니다.",
+        "how_to_fix": "💡 해결 방법:",
+        "fix_step_1": "1️⃣ 시작 메뉴에서 '시스템 환경 변수 편집'을 검색하여 엽니다.",
+        "fix_step_2": "2️⃣ '환경 변수(N)...' 버튼을 클릭합니다.",
+        "fix_step_3": "3️⃣ '시스템 변수' 또는 '사용자 변수'에서 'Path'를 선택하고 '편집(E)...'을 클릭합니다.",
+        "fix_step_4": "4️⃣ 아래 경로를 새 항목으로 추가한 후 확인을 누릅니다:",
+        "fix_reminder": "🔁 변경 후, 프로그램을 다시 실행하거나 컴퓨터를 재시작할 수도 있습니다.",
+        "requirements_missing": "❌ requirements.txt 파일이 존재하지 않습니다.",
+        "missing_libraries": "⚠️ 누락된 라이브러리 감지됨:",
+        "installing_missing": "📦 설치 시도 중...",
+        "missing_installed": "✅ 누락된 라이브러리 설치 완료",
+        "install_failed": "❌ 라이브러리 설치 실패: {e}",
+        "all_installed": "✅ 모든 필수 라이브러리가 설치되어 있습니다.",
+        "env_check_complete": "✅ 환경 점검 완료!",
+        "map_records_missing": "❌ 저장된 기록이 없습니다!",
+        "readme_missing": "README.txt 파일이 존재하지 않습니다.",
+        "friends_ini_loaded": "📂 friends.ini 로드됨",
+        "friend_load_failed": "⚠️ 친구 로딩 실패 ({section}): {error}",
+        "name_crawl_failed": "[이름 크롤링 실패] {error}",
+        "crawl_failed": "크롤링 실패: {e}",
+        "legacy_imported": "📂 기존 기록 파일 {count}개를 records.db로 가져왔습니다.",
+        "no_pid": "❌ PID가 설정되지 않았습니다. config.ini 또는 --pid로 지정하세요.",
+        "friend_refresh_done": "✅ {name} 갱신 완료 (클리어 {count}개)",
+        "friend_refresh_failed": "❌ 친구 갱신 실패 (PID: {pid})",
+        "compare_section": "== {title} ({count}) ==",
+        "compare_friend_maps": "친구가 클리어한 맵 목록",
+        "compare_only_friend": "친구만 클리어한 맵",
+        "compare_only_me": "나만 클리어한 맵",
+        "compare_worse_rank": "내 랭킹이 더 낮은 공통 맵",
+        "network_stats": "🌐 동시성 {concurrency}/{max_concurrency}, 속도 {rate}/{configured_rate} 요청/초, 평균 지연 {avg_latency}초, 제한 응답 {throttled}회\n",
+        "legacy_import_failed": "⚠️ 기존 기록 파일 가져오기 실패: {error}",
+        "cache_open_failed": "⚠️ 캐시 파일을 열 수 없어 캐시 없이 진행합니다: {error}",
+        "watch_started": "👀 감시 모드 시작 ({interval}초마다 확인)",
+        "watch_unchanged": "💤 변경 없음",
+        "watch_changed": "🔔 클리어 목록이 바뀌어 갱신합니다.",
+        "watch_poll_failed": "⚠️ 확인 실패, 다음 주기에 다시 시도합니다: {error}",
+        "watch_stopped": "⏹ 감시 모드 종료",
+        "sync_unchanged": "✅ 시트에 보낼 변경 사항이 없습니다.",
+        "sync_delta": "📤 변경된 행만 전송: 추가/변경 {upsert}개, 삭제 {remove}개",
+        "sync_version_mismatch": "⚠️ 시트 버전이 맞지 않아 (로컬 {local}, 시트 {remote}) 전체 기록을 다시 보냅니다.",
+        "sync_send_failed": "❌ GAS 웹 앱 호출 실패: {error}",
+        "sync_queued": "📥 보내지 못한 요청을 저장했습니다. {seconds}초 후 다음 동기화 때 다시 보냅니다.",
+        "sync_outbox_retry": "🔁 저장된 동기화 요청 다시 보내는 중 (이전 시도 {attempts}회)",
+        "sync_outbox_empty": "✅ 대기 중인 동기화 요청이 없습니다.",
+        "sync_outbox_left": "⚠️ 아직 보내지 못한 동기화 요청 {count}개",
+        "friend_sync_none": "⚠️ Sheet ID가 등록된 친구가 없습니다.",
+        "friend_sync_start": "👥 친구 대시보드 {count}개 갱신 시작 (동시 {workers}개)",
+        "friend_sync_done": "✅ {name} 대시보드 갱신 완료",
+        "friend_sync_failed": "❌ {name} 대시보드 갱신 실패: {error}",
+        "friend_sync_summary": "👥 친구 대시보드 {ok}/{total}개 갱신 완료 ({seconds}초)",
+        "log_file_failed": "⚠️ 로그 파일을 열 수 없어 파일 기록 없이 계속합니다: {error}",
+        "unexpected_error": "❌ 예기치 않은 오류: {error}"
+    },
+    "en": {
+        "config_saved": "✅ config.ini saved successfully!",
+        # "config_not_found": "⚠ config.ini not found. Creating default settings.",
+        # "script_running": "🔄 Running {script_name}...",
+        # "script_completed": "✅ {script_name} completed!",
+        "script_stopped": "⛔ Script execution stopped.",
+        # "no_script_running": "⚠ No script is currently running.",
+        "error_occurred": "❌ Error occurred: {error}",
+        "installing_libraries": "📦 Installing required libraries...",
+        "installation_complete": "✅ Library installation complete!",
+        "file_not_found": "❌ {file} not found.",
+        "install_output": "📦 {output}",
+        "script_output": "📜 {output}",
+        "load_settings": "📥 Loading settings...",
+        "load_complete": "✅ Settings loaded - PID: {pid}, Sheet ID: {sheet_id}",
+        "no_settings": "⚠ No settings file found! Using default values.",
+        "load_records": "📂 Loading existing records...",
+        "fetching_map_uids": "📂 Fetching cleared map UIDs...",
+        "accessing": "🌍 Accessing: {url}",
+        "change_filter": "🔄 Changed filter to 'All'. Waiting for table reload...",
+        "record_updated": "✅ {map_name} record updated: {best_time} (Rank: {current_rank})\n",
+        "record_same": "✅ {map_name} is same as previous record\n",
+        "record_save": "📂 Saving updated records...",
+        "save_complete": "✅ All records saved to records.db.\n",
+        "map_uid_collected": "🔹 Collected {count} updated cleared map UIDs.\n",
+        "dropdown_not_found": "⚠️ Could not find dropdown. Fetching only 10 default records.",
+        "record_not_found": "⚠️ Failed to find record for {map_name}: {error}",
+        "send_request": "📤 Calling GAS Web App...",
+        "success": "✅ GAS Web App call successful: {response}\n",
+        "fail": "❌ GAS Web App call failed. Status code: {status_code}",
+        "response": "Response content: {response_text}",
+        "language_changed": "🌐 The language has been changed.",
+        "all_components_installed": "✅ All required components are installed.",
+        "first_run": "🎯 First launch detected. Checking environment...",
+        "start_env_check": "🧪 Starting environment check (first run)",
+        "current_python": "📍 Currently running Python path: {current_python_path}",
+        "python_in_path": "✅ Python found in system PATH: {python_in_path}",
+        "python_not_found": "⚠️ The 'python' command is not registered in the system PATH.",
+        "how_to_fix": "💡 How to fix:",
+        "fix_step_1": "1️⃣ Open 'Edit the system environment variables' from the Start menu.",
+        "fix_step_2": "2️⃣ Click the 'Environment Variables...' button.",
+        "fix_step_3": "3️⃣ In 'System variables' or 'User variables', select 'Path' and click 'Edit...'.",
+        "fix_step_4": "4️⃣ Add the path below as a new entry and click OK:",
+        "fix_reminder": "🔁 After making changes, restart the program or your computer.",
+        "requirements_missing": "❌ requirements.txt file does not exist.",
+        "missing_libraries": "⚠️ Missing libraries detected:",
+        "installing_missing": "📦 Attempting to install missing libraries...",
+        "missing_installed": "✅ Missing libraries installed successfully",
+        "install_failed": "❌ Failed to install libraries: {e}",
+        "all_installed": "✅ All required libraries are installed.",
+        "env_check_complete": "✅ Environment check complete!",
+        "map_records_missing": "❌ No saved records to send!",
+        "readme_missing": "README.txt file does not exist.",
+        "friends_ini_loaded": "📂 friends.ini loaded",
+        "friend_load_failed": "⚠️ Failed to load friend ({section}): {e}",
+        "name_crawl_failed": "[Name crawling failed] {error}",
+        "crawl_failed": "Crawling failed: {e}",
+        "legacy_imported": "📂 Imported {count} legacy record file(s) into records.db.",
+        "no_pid": "❌ No PID set. Set it in config.ini or pass --pid.",
+        "friend_refresh_done": "✅ {name} refreshed ({count} maps cleared)",
+        "friend_refresh_failed": "❌ Failed to refresh friend (PID: {pid})",
+        "compare_section": "== {title} ({count}) ==",
+        "compare_friend_maps": "Maps cleared by friend",
+        "compare_only_friend": "Cleared by friend only",
+        "compare_only_me": "Cleared by me only",
+        "compare_worse_rank": "Common maps where my rank is worse",
+        "network_stats": "🌐 Concurrency {concurrency}/{max_concurrency}, rate {rate}/{configured_rate} req/s, avg latency {avg_latency}s, throttled {throttled} time(s)\n",
+        "legacy_import_failed": "⚠️ Failed to import legacy record files: {error}",
+        "cache_open_failed": "⚠️ Could not open the cache file, continuing without cache: {error}",
+        "watch_started": "👀 Watch mode started (checking every {interval}s)",
+        "watch_unchanged": "💤 No changes",
+        "watch_changed": "🔔 Cleared maps changed, refreshing.",
+        "watch_poll_failed": "⚠️ Check failed, retrying next interval: {error}",
+        "watch_stopped": "⏹ Watch mode stopped",
+        "sync_unchanged": "✅ Nothing changed since the last sheet update.",
+        "sync_delta": "📤 Sending changed rows only: {upsert} added/changed, {remove} removed",
+        "sync_version_mismatch": "⚠️ Sheet version mismatch (local {local}, sheet {remote}), sending all records again.",
+        "sync_send_failed": "❌ GAS Web App call failed: {error}",
+        "sync_queued": "📥 Saved the unsent request. It will be retried on a sync after {seconds}s.",
+        "sync_outbox_retry": "🔁 Resending a saved sync request (previous attempts: {attempts})",
+        "sync_outbox_empty": "✅ No queued sync requests.",
+        "sync_outbox_left": "⚠️ {count} sync request(s) still queued",
+        "friend_sync_none": "⚠️ No friends have a Sheet ID.",
+        "friend_sync_start": "👥 Updating {count} friend dashboard(s) ({workers} at a time)",
+        "friend_sync_done": "✅ {name}'s dashboard updated",
+        "friend_sync_failed": "❌ Failed to update {name}'s dashboard: {error}",
+        "friend_sync_summary": "👥 Updated {ok}/{total} friend dashboard(s) in {seconds}s",
+        "log_file_failed": "⚠️ Could not open the log file, continuing without it: {error}",
+        "unexpected_error": "❌ Unexpected error: {error}"
+    }
+}
+
+print_level = INFO  # 표준 출력에 보일 최소 수준 (set_level)
+_file_logger = None
+
+def _print_sink(message, level=INFO):
+    if level < print_level:
+        return
+    try:
+        print(message, flush=True)
+    except UnicodeEncodeError:
+        encoding = sys.stdout.encoding or "utf-8"
+        print(message.encode(encoding, "replace").decode(encoding), flush=True)
+
+class QueueSink:
+    """작업 스레드는 막힘 없이 넣기만 하고, UI 스레드가 주기적으로 모아서 꺼내 가는 출력 대상"""
+
+    def __init__(self):
+        self._queue = queue.SimpleQueue()
+
+    def __call__(self, message, level=INFO):
+        self._queue.put((level, message))
+
+    def drain(self, limit=None):
+        """쌓인 (level, message)를 최대 limit개까지 순서대로 꺼냄"""
+        messages = []
+        while limit is None or len(messages) < limit:
+            try:
+                messages.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return messages
+
+_sink = _print_sink
+
+def set_sink(sink):
+    global _sink
+    _sink = sink or _print_sink
+
+def set_level(level):
+    """표준 출력에 보일 최소 수준 ("debug" / "info" / "warning" / "error" 또는 숫자)"""
+    global print_level
+    print_level = LEVEL_NAMES.get(level, INFO) if isinstance(level, str) else level
+
+def configure_file(path, max_bytes=1024 * 1024, backups=3, level=DEBUG):
+    """회전 로그 파일 켜기 (max_bytes를 넘으면 path.1 … path.{backups}로 밀려남), path가 비어 있으면 끄기"""
+    global _file_logger
+    close_file()
+    if not path:
+        return
+
+    import logging
+    from logging.handlers import RotatingFileHandler
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    handler = RotatingFileHandler(path, maxBytes=max_bytes, backupCount=backups, encoding="utf-8")
+    handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)-7s %(message)s"))
+    logger = logging.getLogger("kda")
+    logger.propagate = False
+    logger.setLevel(LEVEL_NAMES.get(level, DEBUG) if isinstance(level, str) else level)
+    logger.addHandler(handler)
+    _file_logger = logger
+
+def close_file():
+    global _file_logger
+    if _file_logger:
+        for handler in list(_file_logger.handlers):
+            _file_logger.removeHandler(handler)
+            handler.close()
+        _file_logger = None
+
+def set_language(lang):
+    global language
+    language = lang if lang in log_translations else "en"
+
+# 현재 언어에 맞게 로그 메시지를 변환하는 함수
+def log_translate(key, **kwargs):
+    message_template = log_translations.get(language, {}).get(key, key)
+    return message_template.format(**kwargs)
+
+def log_message(key, **kwargs):
+    level = log_levels.get(key, INFO)
+    message = log_translate(key, **kwargs)
+    if _file_logger:
+        _file_logger.log(level, message.strip())
+    _sink(message, level)
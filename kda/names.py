@@ -0,0 +1,62 @@
+"""플레이어 닉네임 가져오기
+
+edition_history 응답의 PlayerName(`$` 서식 코드 포함)을 records.db에 pid별로 저장해 두고
+(fetch_player_data가 받을 때마다 갱신), NAME_TTL 안이면 요청 없이 그대로 사용한다.
+저장된 이름이 없거나 오래됐으면 edition_history를 한 번 받고,
+클리어 기록이 없어 그마저 비어 있을 때만 players.php 페이지를 파싱한다.
+"""
+from kda.app import get_record_store
+from kda.fetch import fetch_edition_history, fetch_name_parts
+from kda.log import log_message
+from kda.tmformat import parse_tm_name, plain_name
+
+NAME_TTL = 24 * 3600  # 이름 캐시 유지 시간 (초)
+
+def get_raw_name(pid, max_age=NAME_TTL):
+    """서식 코드가 남아 있는 닉네임 (캐시 → edition_history 순), 없으면 None"""
+    store = get_record_store()
+    raw_name = store.get_raw_name(pid, max_age)
+    if raw_name is not None:
+        return raw_name
+
+    try:
+        data = fetch_edition_history(pid) or []
+    except Exception as e:
+        log_message("name_crawl_failed", error=e)
+        return None
+
+    raw_name = next((entry["PlayerName"] for entry in data if entry.get("PlayerName")), None)
+    if raw_name is not None:
+        store.upsert_player(pid, plain_name(raw_name), raw_name=raw_name)
+    return raw_name
+
+def get_cached_name_parts(pid):
+    """요청 없이 저장된 닉네임만 조각으로 반환 (오래됐어도 사용, 시작 화면용), 없으면 None"""
+    store = get_record_store()
+    raw_name = store.get_raw_name(pid)
+    if raw_name is not None:
+        return parse_tm_name(raw_name)
+    player = store.get_player(pid)
+    if player and player["name"]:
+        return [(player["name"], None, "normal", "roman")]
+    return None
+
+def get_name_parts(pid, max_age=NAME_TTL):
+    """닉네임을 (텍스트, 색상, 굵기, 기울임) 조각으로 반환, 실패 시 None"""
+    raw_name = get_raw_name(pid, max_age)
+    if raw_name is not None:
+        return parse_tm_name(raw_name)
+
+    # 클리어 기록이 없는 플레이어: 유저 페이지에서 직접 가져오기
+    try:
+        return fetch_name_parts(pid)
+    except Exception as e:
+        log_message("name_crawl_failed", error=e)
+        return None
+
+def get_name(pid, max_age=NAME_TTL):
+    """서식 코드를 뺀 닉네임, 실패 시 None"""
+    parts = get_name_parts(pid, max_age)
+    if not parts:
+        return None
+    return "".join(part[0] for part in parts).strip() or None
@@ -0,0 +1,76 @@
+"""보내지 못한 시트 동기화 요청을 보관하는 디스크 outbox
+
+GAS 호출이 실패하면(오프라인, 타임아웃, 200이 아닌 응답) 요청을 sheet_id별 파일 하나에
+gzip으로 압축해 저장한다. 같은 시트로 새 요청이 오면 파일을 덮어쓰므로 항상 가장 최근
+요청 하나만 남고, 복구 후에는 시트마다 요청 한 번으로 따라잡는다.
+실패할 때마다 다음 시도까지의 대기 시간이 두 배로 늘어난다 (최대 1시간).
+"""
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+
+BACKOFF_BASE = 30      # 첫 재시도 대기 (초)
+BACKOFF_MAX = 3600     # 최대 대기 (초)
+
+class Outbox:
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        os.makedirs(path, exist_ok=True)
+
+    def _file(self, sheet_id):
+        return os.path.join(self.path, hashlib.sha1(sheet_id.encode("utf-8")).hexdigest() + ".json.gz")
+
+    def put(self, entry, error=None):
+        """entry(sheet_id, pid, payload, rows)를 저장, 같은 시트의 이전 요청은 대체된다"""
+        entry = dict(entry)
+        now = time.time()
+        entry.setdefault("created_at", now)
+        entry["attempts"] = entry.get("attempts", 0) + 1
+        entry["next_attempt"] = now + min(BACKOFF_MAX, BACKOFF_BASE * 2 ** (entry["attempts"] - 1))
+        entry["last_error"] = None if error is None else str(error)
+
+        path = self._file(entry["sheet_id"])
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with self._lock:
+            with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        return entry
+
+    def get(self, sheet_id):
+        return self._read(self._file(sheet_id))
+
+    def remove(self, sheet_id):
+        with self._lock:
+            try:
+                os.remove(self._file(sheet_id))
+            except FileNotFoundError:
+                pass
+
+    def _read(self, path):
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            # 쓰다가 끊긴 파일은 버린다 (다음 동기화 때 저장소에서 다시 만든다)
+            with self._lock:
+                os.remove(path)
+            return None
+
+    def pending(self, due_only=False):
+        """저장된 요청 목록 (오래된 순), due_only면 재시도 시간이 된 것만"""
+        entries = []
+        now = time.time()
+        for filename in os.listdir(self.path):
+            if not filename.endswith(".json.gz"):
+                continue
+            entry = self._read(os.path.join(self.path, filename))
+            if entry and (not due_only or entry["next_attempt"] <= now):
+                entries.append(entry)
+        return sorted(entries, key=lambda entry: entry["created_at"])
@@ -0,0 +1,22 @@
+"""설정 / 기록 파일 경로
+
+실행 파일(또는 main.py)이 있는 폴더를 기준으로 하며,
+KDA_HOME 환경 변수로 다른 데이터 폴더를 지정할 수 있다 (서버, 컨테이너 등).
+"""
+import os
+import sys
+
+if getattr(sys, 'frozen', False):
+    BASE_DIR = os.path.dirname(sys.executable)
+else:
+    BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+BASE_DIR = os.environ.get("KDA_HOME") or BASE_DIR
+
+CONFIG_PATH = os.path.join(BASE_DIR, "config.ini")
+FRIENDS_PATH = os.path.join(BASE_DIR, "friends.ini")
+MAP_RECORDS_PATH = os.path.join(BASE_DIR, "map_records.txt")
+RECORDS_DIR = os.path.join(BASE_DIR, "records")
+RECORDS_DB_PATH = os.path.join(BASE_DIR, "records.db")
+CACHE_PATH = os.path.join(BASE_DIR, "cache", "http_cache.sqlite")
+OUTBOX_DIR = os.path.join(BASE_DIR, "outbox")
@@ -0,0 +1,117 @@
+"""호스트별 요청 속도 제한 (토큰 버킷) + AIMD 방식 동시성 자동 조절
+
+- 토큰 버킷: 초당 rate개, 최대 burst개까지 몰아서 보낼 수 있다.
+- 동시성: 응답이 빠르고 정상이면 1씩 늘리고(가산 증가),
+  429/5xx, 타임아웃, 목표보다 느린 응답이 나오면 절반으로 줄인다(승산 감소).
+  429/5xx가 나오면 전송 속도도 절반으로 줄였다가 천천히 설정값까지 회복한다.
+- 기다리는 동안에도 WAIT_STEP초마다 중단 요청(check_stop)을 확인한다.
+"""
+import threading
+import time
+
+from kda.control import check_stop, current_token
+
+THROTTLE_STATUS = (429, 500, 502, 503, 504)
+WAIT_STEP = 0.2  # 대기 중 중단 요청 확인 주기 (초)
+
+class TokenBucket:
+    def __init__(self, rate, burst):
+        self.rate = float(rate)
+        self.burst = max(1.0, float(burst))
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self):
+        """토큰 하나를 얻을 때까지 대기 (중단되면 InterruptedError)"""
+        while True:
+            check_stop()
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate if self.rate > 0 else 0.1
+            current_token().wait(min(wait, WAIT_STEP))
+
+    def set_rate(self, rate):
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = float(rate)
+
+class HostLimiter:
+    def __init__(self, max_concurrency=8, min_concurrency=1, rate=5.0, burst=10, target_latency=2.0):
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.min_concurrency = max(1, min(int(min_concurrency), self.max_concurrency))
+        self.configured_rate = float(rate)
+        self.target_latency = float(target_latency)
+
+        self.bucket = TokenBucket(rate, burst)
+        self.concurrency = self.min_concurrency  # 처음에는 최소값에서 시작해 늘려 간다
+        self.in_flight = 0
+        self.avg_latency = None
+        self.throttled = 0
+        self.completed = 0
+        self._successes = 0
+        self._cond = threading.Condition()
+
+    def acquire(self):
+        """동시 요청 자리와 토큰을 얻을 때까지 대기 (중단되면 InterruptedError, 자리는 돌려놓음)"""
+        with self._cond:
+            while self.in_flight >= self.concurrency:
+                check_stop()
+                self._cond.wait(WAIT_STEP)
+            check_stop()
+            self.in_flight += 1
+        try:
+            self.bucket.acquire()
+        except BaseException:
+            with self._cond:
+                self.in_flight -= 1
+                self._cond.notify_all()
+            raise
+
+    def release(self, latency, status=None, failed=False, throttled_retries=0):
+        with self._cond:
+            self.in_flight -= 1
+            self.completed += 1
+            if latency is not None:
+                self.avg_latency = latency if self.avg_latency is None else self.avg_latency * 0.8 + latency * 0.2
+
+            throttled = failed or status in THROTTLE_STATUS or throttled_retries > 0
+            if throttled:
+                self.throttled += 1
+                self._successes = 0
+                self.concurrency = max(self.min_concurrency, self.concurrency // 2)
+                self.bucket.set_rate(max(self.configured_rate / 8, self.bucket.rate / 2))
+            elif latency is not None and latency > self.target_latency:
+                self._successes = 0
+                self.concurrency = max(self.min_concurrency, self.concurrency // 2)
+            else:
+                # 현재 동시성만큼 연속으로 성공하면 한 단계 늘림
+                self._successes += 1
+                if self._successes >= self.concurrency:
+                    self._successes = 0
+                    self.concurrency = min(self.max_concurrency, self.concurrency + 1)
+                if self.bucket.rate < self.configured_rate:
+                    self.bucket.set_rate(min(self.configured_rate, self.bucket.rate * 1.1))
+
+            self._cond.notify_all()
+
+    def stats(self):
+        with self._cond:
+            return {
+                "concurrency": self.concurrency,
+                "max_concurrency": self.max_concurrency,
+                "in_flight": self.in_flight,
+                "rate": round(self.bucket.rate, 2),
+                "configured_rate": self.configured_rate,
+                "avg_latency": None if self.avg_latency is None else round(self.avg_latency, 3),
+                "completed": self.completed,
+                "throttled": self.throttled
+            }
@@ -0,0 +1,95 @@
+"""기록 모델 (맵 UID, 맵 이름 번호, 시간 ms, 랭크)
+
+시간("1.23", "01:12.340", "0")과 랭크 문자열은 받는 곳(edition_history, 리더보드, 예전 TSV)에서
+한 번만 정수로 바꾸고, 이후 비교 / 정렬 / 집계는 정수로 한다. 문자열로 되돌리는 것은
+시트에 보낼 때와 로그에 쓸 때뿐이다 (time_str / rank_str). 기록이 없으면 time_ms, rank는 None.
+맵 이름은 map_names에 한 번만 저장하고 각 기록에는 번호(name_id)만 둔다.
+"""
+import threading
+
+from kda.leaderboard import format_time, parse_time
+
+def to_time_ms(time_str):
+    """map_records.txt 형식 시간을 밀리초로 변환 ("0" 또는 해석 불가 → None)"""
+    time_str = str(time_str).strip()
+    if not time_str or time_str == "0":
+        return None
+    try:
+        return parse_time(time_str) or None
+    except ValueError:
+        return None
+
+def to_time_str(time_ms):
+    return format_time(time_ms) if time_ms else "0"
+
+def to_rank(rank_str):
+    try:
+        return int(rank_str)
+    except (TypeError, ValueError):
+        return None
+
+class NameTable:
+    """문자열 ↔ 번호 (같은 문자열은 항상 같은 번호, 프로세스 안에서만 유효)"""
+
+    def __init__(self):
+        self._ids = {}
+        self._names = []
+        self._lock = threading.Lock()
+
+    def intern(self, name):
+        name_id = self._ids.get(name)
+        if name_id is None:
+            with self._lock:
+                name_id = self._ids.get(name)
+                if name_id is None:
+                    name_id = len(self._names)
+                    self._names.append(name)
+                    self._ids[name] = name_id
+        return name_id
+
+    def name(self, name_id):
+        return self._names[name_id]
+
+    def __len__(self):
+        return len(self._names)
+
+map_names = NameTable()
+
+class Record:
+    __slots__ = ("uid", "name_id", "time_ms", "rank")
+
+    def __init__(self, uid, name_id, time_ms=None, rank=None):
+        self.uid = uid
+        self.name_id = name_id
+        self.time_ms = time_ms
+        self.rank = rank
+
+    @classmethod
+    def create(cls, uid, name, time_ms=None, rank=None):
+        return cls(uid, map_names.intern(name), time_ms, rank)
+
+    @property
+    def name(self):
+        return map_names.name(self.name_id)
+
+    @property
+    def time_str(self):
+        return to_time_str(self.time_ms)
+
+    @property
+    def rank_str(self):
+        return "" if self.rank is None else str(self.rank)
+
+    def result(self):
+        """(time_ms, rank), 저장된 기록과 달라졌는지 비교할 때 사용"""
+        return self.time_ms, self.rank
+
+    def __eq__(self, other):
+        if not isinstance(other, Record):
+            return NotImplemented
+        return (self.uid, self.name_id, self.time_ms, self.rank) == (other.uid, other.name_id, other.time_ms, other.rank)
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"Record({self.uid!r}, {self.name!r}, time_ms={self.time_ms}, rank={self.rank})"
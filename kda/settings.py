@@ -0,0 +1,72 @@
+"""config.ini 설정값 읽기 (GUI / CLI 공용, 파일은 kda.config가 한 번만 읽어 둔 값을 사용)"""
+from kda.config import get_config
+
+def load_account():
+    """(pid, sheet_id, language)"""
+    config = get_config()
+    pid = config.get("Settings", "pid")
+    sheet_id = config.get("Settings", "sheet_id")
+    language = config.get("Settings", "language", fallback="en").lower()
+    return pid, sheet_id, language
+
+def load_map_settings():
+    config = get_config()
+    total_maps = config.get_int("Rank", "total_maps", fallback=526)
+    kacky_color = config.get("Rank", "kacky_color", fallback="positive").lower()
+    if kacky_color not in ["positive", "negative"]:
+        kacky_color = "positive"
+        config.set("Rank", "kacky_color", "positive")
+    return total_maps, kacky_color == "positive"
+
+def load_network_settings():
+    config = get_config()
+    settings = {
+        "workers": config.get_int("Network", "workers", fallback=8),
+        "min_workers": config.get_int("Network", "min_workers", fallback=1),
+        "rate": config.get_float("Network", "rate", fallback=5.0),
+        "burst": config.get_int("Network", "burst", fallback=10),
+        "target_latency": config.get_float("Network", "target_latency", fallback=2.0)
+    }
+    settings["workers"] = max(1, min(settings["workers"], 32))
+    settings["min_workers"] = max(1, min(settings["min_workers"], settings["workers"]))
+    settings["rate"] = max(0.1, settings["rate"])
+    settings["burst"] = max(1, settings["burst"])
+    return settings
+
+def load_cache_settings():
+    config = get_config()
+    enabled = config.get_bool("Cache", "enabled", fallback=True)
+    ttl_days = config.get_float("Cache", "ttl_days", fallback=7)
+    max_mb = config.get_float("Cache", "max_mb", fallback=64)
+    return enabled, ttl_days, max_mb
+
+def load_watch_settings():
+    """감시 모드 확인 간격(초), 사이트 부담을 줄이기 위해 최소 30초"""
+    return max(30.0, get_config().get_float("Watch", "interval", fallback=300))
+
+def load_log_settings():
+    """로그 창 최대 줄 수 / 표시 수준, 회전 로그 파일 (file이 비어 있으면 파일 기록 안 함)"""
+    config = get_config()
+    settings = {
+        "max_lines": config.get_int("Log", "max_lines", fallback=2000),
+        "level": config.get("Log", "level", fallback="info").lower(),
+        "file": config.get("Log", "file"),
+        "file_level": config.get("Log", "file_level", fallback="debug").lower(),
+        "file_max_kb": config.get_int("Log", "file_max_kb", fallback=1024),
+        "file_backups": config.get_int("Log", "file_backups", fallback=3)
+    }
+    for key in ("level", "file_level"):
+        if settings[key] not in ("debug", "info", "warning", "error"):
+            settings[key] = "info" if key == "level" else "debug"
+    settings["max_lines"] = max(100, settings["max_lines"])
+    settings["file_max_kb"] = max(16, settings["file_max_kb"])
+    settings["file_backups"] = max(0, min(settings["file_backups"], 20))
+    return settings
+
+def load_sync_settings():
+    """GAS 웹 앱 주소 (비어 있으면 기본 주소, 로컬 테스트 서버를 쓸 때만 지정)와 친구 대시보드 동시 전송 수"""
+    config = get_config()
+    return {
+        "webhook_url": config.get("Sync", "webhook_url"),
+        "workers": max(1, min(config.get_int("Sync", "workers", fallback=4), 8))
+    }
@@ -0,0 +1,54 @@
+"""같은 요청이 동시에 여러 번 들어오면 한 번만 실행하고 결과를 나눠 쓰기 (singleflight)
+
+    group = Group()
+    data = group.do(("edition_history", pid), fetch, pid)
+
+먼저 들어온 호출(leader)만 fn을 실행하고, 그 사이 같은 key로 들어온 호출은 끝날 때까지 기다렸다가
+같은 결과(또는 같은 예외)를 받는다. 끝난 뒤 들어온 호출은 다시 실행한다 (캐시가 아님).
+결과 객체는 호출한 쪽 모두가 공유하므로 수정하지 않는다.
+
+leader가 중단되면(InterruptedError) 기다리던 호출은 그 예외를 받지 않고 직접 다시 실행하며,
+기다리는 동안에도 자기 작업의 중단 요청(check_stop)은 확인한다.
+"""
+import threading
+
+from kda.control import check_stop
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+class Group:
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, fn, *args, **kwargs):
+        while True:
+            with self._lock:
+                call = self._calls.get(key)
+                leader = call is None
+                if leader:
+                    call = self._calls[key] = _Call()
+
+            if leader:
+                try:
+                    call.result = fn(*args, **kwargs)
+                except BaseException as e:
+                    call.error = e
+                    raise
+                finally:
+                    with self._lock:
+                        del self._calls[key]
+                    call.done.set()
+                return call.result
+
+            while not call.done.wait(0.5):
+                check_stop()
+            if isinstance(call.error, InterruptedError):
+                continue
+            if call.error is not None:
+                raise call.error
+            return call.result
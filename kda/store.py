@@ -0,0 +1,328 @@
+"""플레이어 / 맵 / 기록을 저장하는 SQLite 기록 저장소
+
+map_records.txt, records/{pid}_records.txt 대신 하나의 파일(records.db)을 사용한다.
+기록은 맵 이름이 아닌 맵 UID로 저장되고, WAL 모드로 열기 때문에
+백그라운드에서 쓰는 동안에도 GUI 쪽 읽기가 막히지 않는다.
+스레드마다 별도 연결을 사용한다.
+"""
+import os
+import sqlite3
+import threading
+import time
+
+from kda.catalog import normalize_name
+from kda.records import Record, to_rank, to_time_ms, to_time_str
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS players (
+    pid TEXT PRIMARY KEY,
+    name TEXT,
+    clear_count INTEGER NOT NULL DEFAULT 0,
+    updated_at REAL,
+    raw_name TEXT,
+    raw_name_at REAL
+);
+CREATE TABLE IF NOT EXISTS maps (
+    uid TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    edition INTEGER,
+    norm_name TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS records (
+    pid TEXT NOT NULL,
+    uid TEXT NOT NULL,
+    time_ms INTEGER,
+    rank INTEGER,
+    fetched_at REAL NOT NULL,
+    PRIMARY KEY (pid, uid)
+);
+CREATE TABLE IF NOT EXISTS sync_state (
+    sheet_id TEXT PRIMARY KEY,
+    pid TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    synced_at REAL
+);
+CREATE TABLE IF NOT EXISTS sync_rows (
+    sheet_id TEXT NOT NULL,
+    uid TEXT NOT NULL,
+    name TEXT NOT NULL,
+    time TEXT NOT NULL,
+    rank TEXT NOT NULL,
+    PRIMARY KEY (sheet_id, uid)
+);
+CREATE INDEX IF NOT EXISTS records_uid ON records (uid);
+CREATE INDEX IF NOT EXISTS maps_name ON maps (name);
+CREATE INDEX IF NOT EXISTS maps_norm_name ON maps (norm_name);
+"""
+
+# 예전 TSV 파일에서 가져온 기록은 UID를 모르므로 이름 기반 임시 UID를 쓰고,
+# 실제 UID가 확인되면(register_maps) 그쪽으로 옮긴다.
+LEGACY_UID_PREFIX = "name:"
+
+class RecordStore:
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+
+        conn = self._connect()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(SCHEMA)
+        conn.commit()
+
+    def _connect(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA foreign_keys=OFF")
+            self._local.conn = conn
+        return conn
+
+    def close(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    # 설정값 / 상태값
+    def get_meta(self, key, default=None):
+        row = self._connect().execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else default
+
+    def set_meta(self, key, value):
+        conn = self._connect()
+        with conn:
+            conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    # 플레이어
+    def upsert_player(self, pid, name=None, clear_count=None, raw_name=None):
+        """raw_name: `$` 서식 코드가 남아 있는 닉네임 (이름 캐시, 저장 시각과 함께 기록)"""
+        now = time.time()
+        conn = self._connect()
+        with conn:
+            conn.execute(
+                "INSERT INTO players (pid, name, clear_count, updated_at, raw_name, raw_name_at) "
+                "VALUES (?, ?, COALESCE(?, 0), ?, ?, CASE WHEN ? IS NULL THEN NULL ELSE ? END) "
+                "ON CONFLICT (pid) DO UPDATE SET name = COALESCE(excluded.name, name), "
+                "clear_count = COALESCE(?, clear_count), updated_at = excluded.updated_at, "
+                "raw_name = COALESCE(excluded.raw_name, raw_name), raw_name_at = COALESCE(excluded.raw_name_at, raw_name_at)",
+                (str(pid), name, clear_count, now, raw_name, raw_name, now, clear_count)
+            )
+
+    def get_raw_name(self, pid, max_age=None):
+        """저장된 서식 포함 닉네임, 없거나 max_age초보다 오래됐으면 None"""
+        row = self._connect().execute(
+            "SELECT raw_name, raw_name_at FROM players WHERE pid = ?", (str(pid),)
+        ).fetchone()
+        if not row or row[0] is None:
+            return None
+        if max_age is not None and (row[1] is None or time.time() - row[1] > max_age):
+            return None
+        return row[0]
+
+    def get_player(self, pid):
+        row = self._connect().execute(
+            "SELECT name, clear_count, updated_at FROM players WHERE pid = ?", (str(pid),)
+        ).fetchone()
+        if not row:
+            return None
+        return {"pid": str(pid), "name": row[0], "clear_count": row[1], "updated_at": row[2]}
+
+    # 맵 (보통은 kda.catalog.MapCatalog를 거쳐 사용)
+    def get_maps(self):
+        """UID가 확인된 맵 (uid, name, edition) 목록 (예전 TSV의 임시 UID 제외)"""
+        return self._connect().execute(
+            "SELECT uid, name, edition FROM maps WHERE uid NOT LIKE ?", (LEGACY_UID_PREFIX + "%",)
+        ).fetchall()
+
+    def register_maps(self, maps):
+        """(uid, name, edition) 목록을 등록하고, 이름이 같은(정규화 기준) 임시 UID 기록을 실제 UID로 옮긴다"""
+        conn = self._connect()
+        with conn:
+            for uid, name, edition in maps:
+                norm_name = normalize_name(name)
+                conn.execute(
+                    "INSERT INTO maps (uid, name, edition, norm_name) VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT (uid) DO UPDATE SET name = excluded.name, edition = COALESCE(excluded.edition, edition), "
+                    "norm_name = excluded.norm_name",
+                    (uid, name, edition, norm_name)
+                )
+                legacy_uids = conn.execute(
+                    "SELECT uid FROM maps WHERE norm_name = ? AND uid LIKE ?", (norm_name, LEGACY_UID_PREFIX + "%")
+                ).fetchall()
+                for (legacy_uid,) in legacy_uids:
+                    conn.execute("UPDATE OR IGNORE records SET uid = ? WHERE uid = ?", (uid, legacy_uid))
+                    conn.execute("DELETE FROM records WHERE uid = ?", (legacy_uid,))
+                    conn.execute("DELETE FROM maps WHERE uid = ?", (legacy_uid,))
+
+    # 기록
+    def get_records(self, pid):
+        """{uid: Record}"""
+        rows = self._connect().execute(
+            "SELECT r.uid, m.name, r.time_ms, r.rank FROM records r JOIN maps m ON m.uid = r.uid WHERE r.pid = ?",
+            (str(pid),)
+        )
+        return {uid: Record.create(uid, name, time_ms, rank) for uid, name, time_ms, rank in rows}
+
+    def count_records(self, pid):
+        return self._connect().execute("SELECT COUNT(*) FROM records WHERE pid = ?", (str(pid),)).fetchone()[0]
+
+    def has_records(self, pid):
+        return self._connect().execute("SELECT 1 FROM records WHERE pid = ? LIMIT 1", (str(pid),)).fetchone() is not None
+
+    def upsert_records(self, records):
+        """(pid, uid, time_ms, rank) 목록을 한 트랜잭션으로 저장"""
+        now = time.time()
+        conn = self._connect()
+        with conn:
+            conn.executemany(
+                "INSERT INTO records (pid, uid, time_ms, rank, fetched_at) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (pid, uid) DO UPDATE SET time_ms = excluded.time_ms, rank = excluded.rank, "
+                "fetched_at = excluded.fetched_at",
+                [(str(pid), uid, time_ms, rank, now) for pid, uid, time_ms, rank in records]
+            )
+
+    def delete_records(self, pid, uids):
+        conn = self._connect()
+        with conn:
+            conn.executemany("DELETE FROM records WHERE pid = ? AND uid = ?", [(str(pid), uid) for uid in uids])
+
+    def batch(self, size=25, interval=2.0):
+        return RecordBatch(self, size, interval)
+
+    def export_rows(self, pid):
+        """시트에 들어가는 (맵 UID, 맵 이름, 시간, 랭크) 문자열 목록, 이름 순"""
+        return [
+            (uid, name, to_time_str(time_ms), "" if rank is None else str(rank))
+            for uid, name, time_ms, rank in self._connect().execute(
+                "SELECT r.uid, m.name, r.time_ms, r.rank FROM records r JOIN maps m ON m.uid = r.uid WHERE r.pid = ? "
+                "ORDER BY m.name, r.uid",
+                (str(pid),)
+            )
+        ]
+
+    # 시트 동기화 상태 (GAS가 마지막으로 확인한 버전과 그때 보낸 행)
+    def get_sync_state(self, sheet_id):
+        """(pid, version, {맵 UID: (이름, 시간, 랭크)}) 또는 None"""
+        conn = self._connect()
+        row = conn.execute("SELECT pid, version FROM sync_state WHERE sheet_id = ?", (sheet_id,)).fetchone()
+        if not row:
+            return None
+        rows = conn.execute("SELECT uid, name, time, rank FROM sync_rows WHERE sheet_id = ?", (sheet_id,)).fetchall()
+        return row[0], row[1], {uid: (name, time_str, rank) for uid, name, time_str, rank in rows}
+
+    def save_sync_state(self, sheet_id, pid, version, rows):
+        conn = self._connect()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO sync_state (sheet_id, pid, version, synced_at) VALUES (?, ?, ?, ?)",
+                (sheet_id, str(pid), version, time.time())
+            )
+            conn.execute("DELETE FROM sync_rows WHERE sheet_id = ?", (sheet_id,))
+            conn.executemany(
+                "INSERT INTO sync_rows (sheet_id, uid, name, time, rank) VALUES (?, ?, ?, ?, ?)",
+                [(sheet_id, uid, name, time_str, rank) for uid, (name, time_str, rank) in rows.items()]
+            )
+
+    def clear_sync_state(self, sheet_id):
+        conn = self._connect()
+        with conn:
+            conn.execute("DELETE FROM sync_state WHERE sheet_id = ?", (sheet_id,))
+            conn.execute("DELETE FROM sync_rows WHERE sheet_id = ?", (sheet_id,))
+
+    # 예전 TSV 파일 가져오기
+    def import_legacy(self, my_pid, map_records_path, records_dir):
+        """map_records.txt / records/{pid}_records.txt 를 한 번만 가져온다 (원본 파일은 그대로 둔다)"""
+        sources = []
+        if my_pid:
+            sources.append((str(my_pid), map_records_path))
+        if os.path.isdir(records_dir):
+            for filename in sorted(os.listdir(records_dir)):
+                if filename.endswith("_records.txt"):
+                    sources.append((filename[:-len("_records.txt")], os.path.join(records_dir, filename)))
+
+        imported = 0
+        conn = self._connect()
+        for pid, path in sources:
+            key = "imported:" + os.path.abspath(path)
+            if not os.path.exists(path) or conn.execute("SELECT 1 FROM meta WHERE key = ?", (key,)).fetchone():
+                continue
+
+            rows = []
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    parts = line.strip().split("\t")
+                    if len(parts) == 3:
+                        map_name, time_str, rank = parts
+                    elif len(parts) == 2:
+                        map_name, rank = parts
+                        time_str = "0"
+                    else:
+                        continue
+                    rows.append((map_name, to_time_ms(time_str), to_rank(rank)))
+
+            with conn:
+                # 이미 받아온 기록이 있으면 예전 파일보다 저장소를 우선
+                if not conn.execute("SELECT 1 FROM records WHERE pid = ? LIMIT 1", (pid,)).fetchone():
+                    for map_name, time_ms, rank in rows:
+                        norm_name = normalize_name(map_name)
+                        uid_row = conn.execute(
+                            "SELECT uid FROM maps WHERE norm_name = ? AND uid NOT LIKE ? LIMIT 1",
+                            (norm_name, LEGACY_UID_PREFIX + "%")
+                        ).fetchone()
+                        uid = uid_row[0] if uid_row else LEGACY_UID_PREFIX + map_name
+                        if not uid_row:
+                            conn.execute("INSERT OR IGNORE INTO maps (uid, name, norm_name) VALUES (?, ?, ?)", (uid, map_name, norm_name))
+                        conn.execute(
+                            "INSERT OR IGNORE INTO records (pid, uid, time_ms, rank, fetched_at) VALUES (?, ?, ?, ?, ?)",
+                            (pid, uid, time_ms, rank, os.path.getmtime(path))
+                        )
+                    conn.execute(
+                        "INSERT INTO players (pid, clear_count) VALUES (?, ?) ON CONFLICT (pid) DO NOTHING",
+                        (pid, len(rows))
+                    )
+                    imported += 1
+                conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, str(time.time())))
+
+        return imported
+
+class RecordBatch:
+    """기록 upsert를 모아 작은 트랜잭션으로 저장
+
+    size개가 모이거나 interval초가 지나면 바로 기록하므로, 실행이 중단되어도
+    그때까지 완료된 기록은 남는다. with 블록을 벗어날 때 남은 기록을 저장한다.
+    """
+    def __init__(self, store, size=25, interval=2.0):
+        self.store = store
+        self.size = size
+        self.interval = interval
+        self.written = 0
+        self._pending = []
+        self._last_flush = time.monotonic()
+
+    def add(self, pid, uid, time_ms, rank):
+        self._pending.append((pid, uid, time_ms, rank))
+        self._maybe_flush()
+
+    def _maybe_flush(self):
+        if len(self._pending) >= self.size or time.monotonic() - self._last_flush >= self.interval:
+            self.flush()
+
+    def flush(self):
+        if self._pending:
+            self.store.upsert_records(self._pending)
+            self.written += len(self._pending)
+            self._pending = []
+        self._last_flush = time.monotonic()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.flush()
+        return False
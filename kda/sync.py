@@ -0,0 +1,255 @@
+"""GAS 웹 앱으로 대시보드(구글 시트) 갱신
+
+시트마다 GAS가 마지막으로 확인(ack)한 버전과 그때 보낸 행을 records.db에 저장해 두고,
+다음 동기화 때는 추가/변경/삭제된 행만 보낸다 (delta).
+처음이거나, 서버 버전이 다르거나, 서버가 delta를 모르는 예전 스크립트면 전체를 보낸다 (full).
+행은 맵 UID로 구분하고 이름은 열로 보낸다 (이름이 같은 맵도 각각 한 줄).
+
+    full : {"mode": "full", "version": n, "sheet_id", "rows": [[UID, 이름, 시간, 랭크], ...],
+            "map_records": "이름\\t시간\\t랭크\\n..."}
+    delta: {"mode": "delta", "base_version": n, "version": n + 1, "sheet_id",
+            "upsert": [[UID, 이름, 시간, 랭크], ...], "remove": [UID, ...]}
+    응답 : {"status": "ok", "version": n} 또는 {"status": "version_mismatch", "version": 서버 버전}
+
+full 요청의 map_records는 예전 형식 그대로라 기존에 배포된 스크립트도 계속 동작한다 (새 스크립트는 rows 사용).
+ack를 보낸 적 있는 시트에는 {"encoding": "gzip", "data": base64} 형태로 압축해 보낸다.
+전송에 실패한 요청은 kda.outbox에 보관했다가 다음 동기화 때 다시 보낸다.
+참고용 GAS 코드와 로컬 테스트 서버는 gas/ 폴더에 있다.
+"""
+import base64
+import gzip
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from kda import http_client
+from kda.app import get_outbox, get_record_store
+from kda.control import bind, check_stop
+from kda.friends import load_friends, refresh_friend
+from kda.log import log_message
+from kda.settings import load_sync_settings
+
+WEBHOOK_URL = "https://script.google.com/macros/s/AKfycbyQsuyDAC-hwbrFuuOWu4uL8FNl1ryKgMuGFeqCoXZvtweCSlX_nj1zyfS4sGeERbGK/exec"
+
+def _sorted_rows(rows):
+    """이름 순 (같은 이름이면 UID 순) (UID, (이름, 시간, 랭크)) 목록"""
+    return sorted(rows.items(), key=lambda item: (item[1][0], item[0]))
+
+def build_delta(old_rows, new_rows):
+    """({UID: (이름, 시간, 랭크)} 두 개) → (upsert 행 목록, 삭제할 UID 목록)"""
+    upsert = [[uid, *row] for uid, row in _sorted_rows(new_rows) if old_rows.get(uid) != row]
+    remove = sorted(set(old_rows) - set(new_rows))
+    return upsert, remove
+
+def _read_ack(response):
+    """GAS 응답에서 (status, version), JSON이 아니면 (None, None) (delta를 모르는 예전 스크립트)"""
+    try:
+        data = response.json()
+    except ValueError:
+        return None, None
+    if not isinstance(data, dict):
+        return None, None
+    try:
+        version = int(data.get("version"))
+    except (TypeError, ValueError):
+        version = None
+    return data.get("status"), version
+
+def _post(payload, compress=False):
+    check_stop()
+
+    # 요청 헤더 추가 (Content-Type: application/json)
+    headers = {
+        "Content-Type": "application/json"
+    }
+
+    # 새 스크립트로 확인된 시트에는 본문을 gzip + base64로 압축해 전송
+    if compress:
+        data = gzip.compress(json.dumps(payload, ensure_ascii=False).encode("utf-8"))
+        payload = {"encoding": "gzip", "data": base64.b64encode(data).decode("ascii")}
+
+    response = http_client.post(load_sync_settings()["webhook_url"] or WEBHOOK_URL, json=payload, headers=headers)
+
+    check_stop()
+    return response
+
+def _full_payload(sheet_id, rows, version):
+    return {
+        "mode": "full",
+        "version": version,
+        "rows": [[uid, *row] for uid, row in _sorted_rows(rows)],
+        "map_records": "".join(f"{name}\t{time_str}\t{rank}\n" for _, (name, time_str, rank) in _sorted_rows(rows)),
+        "sheet_id": sheet_id
+    }
+
+def _deliver(store, entry):
+    """entry의 요청을 전송하고 ack를 처리 (성공 시 True, 200이 아닌 응답은 False, 연결 오류는 예외)"""
+    sheet_id, pid, payload, rows = entry["sheet_id"], entry["pid"], entry["payload"], entry["rows"]
+    # ack를 보낸 적 있는 시트(동기화 상태가 남아 있음)면 full / delta 모두 압축
+    acknowledged = store.get_sync_state(sheet_id) is not None
+
+    response = _post(payload, compress=acknowledged)
+    if response.status_code != 200:
+        # 상태는 그대로 두고 다음에 같은 버전 기준으로 다시 시도
+        log_message("fail", status_code=response.status_code)
+        log_message("response", response_text=response.text)
+        return False
+
+    status, server_version = _read_ack(response)
+    if payload["mode"] == "delta" and not (status == "ok" and server_version == payload["version"]):
+        # 시트가 다른 곳에서 바뀌었거나, 응답을 놓쳤거나, delta를 모르는 스크립트면 전체 전송
+        log_message("sync_version_mismatch", local=payload["base_version"], remote=server_version)
+        acknowledged = status == "version_mismatch"
+        payload = _full_payload(sheet_id, rows, max(payload["base_version"], server_version or 0) + 1)
+        response = _post(payload, compress=acknowledged)
+        if response.status_code != 200:
+            log_message("fail", status_code=response.status_code)
+            log_message("response", response_text=response.text)
+            return False
+        status, server_version = _read_ack(response)
+
+    if status == "ok" and server_version == payload["version"]:
+        store.save_sync_state(sheet_id, pid, payload["version"], rows)
+    else:
+        # delta를 지원하지 않는 예전 스크립트: 다음에도 전체 전송
+        store.clear_sync_state(sheet_id)
+
+    log_message("success", response=response.text)
+    return True
+
+def _send(store, entry):
+    """전송하고 실패하면 outbox에 보관 (같은 시트의 이전 요청은 대체), 성공 시 True"""
+    outbox = get_outbox()
+    error = None
+    try:
+        if _deliver(store, entry):
+            outbox.remove(entry["sheet_id"])
+            return True
+    except InterruptedError:
+        raise
+    except Exception as e:
+        error = e
+        log_message("sync_send_failed", error=e)
+
+    queued = outbox.put(entry, error)
+    log_message("sync_queued", seconds=round(queued["next_attempt"] - time.time()))
+    return False
+
+def sync_dashboard(pid, sheet_id, full=False, flush=True):
+    """pid의 기록을 sheet_id 시트로 전송 (성공 시 True), full=True면 항상 전체 전송"""
+    check_stop()
+
+    # 다른 시트로 보내지 못한 요청이 있으면 먼저 재시도
+    if flush:
+        flush_outbox(exclude=(sheet_id,))
+
+    # GAS 웹 앱 호출
+    log_message("send_request")
+
+    store = get_record_store()
+    rows = {uid: (name, time_str, rank) for uid, name, time_str, rank in store.export_rows(pid)} if pid else {}
+    if not rows:
+        log_message("map_records_missing")
+        return False
+
+    state = store.get_sync_state(sheet_id)
+    base_version = state[1] if state else 0
+
+    # 이 시트의 대기 중인 요청은 지금 만드는 최신 요청으로 대체된다
+    if state and state[0] == str(pid) and not full:
+        upsert, remove = build_delta(state[2], rows)
+        if not upsert and not remove:
+            get_outbox().remove(sheet_id)
+            log_message("sync_unchanged")
+            return True
+
+        log_message("sync_delta", upsert=len(upsert), remove=len(remove))
+        payload = {
+            "mode": "delta",
+            "base_version": base_version,
+            "version": base_version + 1,
+            "sheet_id": sheet_id,
+            "upsert": upsert,
+            "remove": remove
+        }
+    else:
+        payload = _full_payload(sheet_id, rows, base_version + 1)
+
+    entry = {"sheet_id": sheet_id, "pid": str(pid), "payload": payload, "rows": rows}
+    pending = get_outbox().get(sheet_id)
+    if pending:
+        entry["created_at"] = pending["created_at"]
+        entry["attempts"] = pending["attempts"]
+    return _send(store, entry)
+
+def flush_outbox(force=False, exclude=()):
+    """outbox에 남은 요청을 재시도 시간이 된 것부터 전송 (force면 대기 시간 무시), 남은 개수 반환"""
+    store = get_record_store()
+    outbox = get_outbox()
+    for entry in outbox.pending(due_only=not force):
+        if entry["sheet_id"] in exclude:
+            continue
+        check_stop()
+        log_message("sync_outbox_retry", attempts=entry["attempts"])
+        entry["rows"] = {uid: tuple(row) for uid, row in entry["rows"].items()}
+        _send(store, entry)
+    return len(outbox.pending())
+
+def _sync_friend(friend):
+    """친구 한 명의 기록 갱신 + 대시보드 전송, 실패 사유 (성공 시 None)"""
+    check_stop()
+    # 시트에는 시간까지 보내므로 시간도 함께 갱신 (시간 없이 보내면 시트의 기존 시간이 "0"으로 덮어써짐)
+    if not refresh_friend(friend["pid"], include_time=True):
+        return "refresh failed"
+    if not sync_dashboard(friend["pid"], friend["sheet_id"], flush=False):
+        return "sync failed"
+    return None
+
+def sync_friend_dashboards(max_workers=None):
+    """sheet_id가 있는 친구마다 기록을 갱신하고 대시보드로 전송
+
+    친구마다 독립적으로 병렬 처리하므로 한 명이 실패해도 나머지는 계속 진행되고,
+    전체 시간은 가장 느린 한 명과 비슷하다. [{"pid", "name", "ok", "error"}] 반환 (friends.ini 순서).
+    """
+    friends = [friend for friend in load_friends() if friend["sheet_id"].strip()]
+    if not friends:
+        log_message("friend_sync_none")
+        return []
+
+    # 각 작업이 outbox를 따로 비우지 않도록 시작 전에 한 번만 재시도
+    flush_outbox(exclude={friend["sheet_id"] for friend in friends})
+
+    workers = min(max_workers or load_sync_settings()["workers"], len(friends))
+    log_message("friend_sync_start", count=len(friends), workers=workers)
+    started = time.monotonic()
+
+    results = [None] * len(friends)
+    executor = ThreadPoolExecutor(max_workers=workers)
+    futures = {executor.submit(bind(_sync_friend), friend): i for i, friend in enumerate(friends)}
+    try:
+        for future in as_completed(futures):
+            check_stop()
+            i = futures[future]
+            friend = friends[i]
+            try:
+                error = future.result()
+            except InterruptedError:
+                raise
+            except Exception as e:
+                error = str(e)
+
+            results[i] = {"pid": friend["pid"], "name": friend["name"], "ok": error is None, "error": error}
+            if error is None:
+                log_message("friend_sync_done", name=friend["name"])
+            else:
+                log_message("friend_sync_failed", name=friend["name"], error=error)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    log_message(
+        "friend_sync_summary",
+        ok=sum(1 for result in results if result and result["ok"]),
+        total=len(friends),
+        seconds=round(time.monotonic() - started, 1)
+    )
+    return results
@@ -0,0 +1,87 @@
+"""TrackMania `$` 서식 코드 해석
+
+edition_history의 PlayerName처럼 `$` 코드가 들어 있는 문자열을
+(텍스트, 색상, 굵기, 기울임) 조각 목록으로 바꾼다 (fetch_name_parts와 같은 형식).
+색상이 지정되지 않은 조각의 색상은 None이다.
+
+    $fff / $f00   색상 (16진수 세 자리 → #ffffff / #ff0000)
+    $g            색상 초기화
+    $o            굵게
+    $i            기울임
+    $t            대문자
+    $z            모든 서식 초기화
+    $$            문자 '$'
+    $l[url]...$l  링크 (텍스트만 남김, $h / $p도 같음)
+    $w $n $m $s   폭 / 그림자 (무시)
+"""
+HEX_DIGITS = "0123456789abcdefABCDEF"
+LINK_CODES = "lhp"
+
+def parse_tm_name(raw):
+    """`$` 코드가 들어 있는 문자열 → [(text, color, weight, slant), ...]"""
+    parts = []
+    color, bold, italic, upper = None, False, False, False
+    text = []
+
+    def flush():
+        if text:
+            chunk = "".join(text)
+            style = (color, "bold" if bold else "normal", "italic" if italic else "roman")
+            if parts and parts[-1][1:] == style:
+                parts[-1] = (parts[-1][0] + chunk,) + style
+            else:
+                parts.append((chunk,) + style)
+            text.clear()
+
+    i = 0
+    length = len(raw)
+    while i < length:
+        char = raw[i]
+        if char != "$":
+            text.append(char.upper() if upper else char)
+            i += 1
+            continue
+
+        i += 1
+        if i >= length:
+            break
+        code = raw[i]
+
+        if code == "$":
+            text.append("$")
+            i += 1
+            continue
+
+        flush()
+        if code in HEX_DIGITS:
+            digits = ""
+            while i < length and len(digits) < 3 and raw[i] in HEX_DIGITS:
+                digits += raw[i]
+                i += 1
+            digits = digits.ljust(3, "0").lower()
+            color = "#" + "".join(digit * 2 for digit in digits)
+            continue
+
+        i += 1
+        code = code.lower()
+        if code == "g":
+            color = None
+        elif code == "o":
+            bold = True
+        elif code == "i":
+            italic = True
+        elif code == "t":
+            upper = True
+        elif code == "z":
+            color, bold, italic, upper = None, False, False, False
+        elif code in LINK_CODES and i < length and raw[i] == "[":
+            # 링크 주소는 표시하지 않음
+            end = raw.find("]", i)
+            i = length if end == -1 else end + 1
+
+    flush()
+    return parts
+
+def plain_name(raw):
+    """서식 코드를 모두 뺀 텍스트"""
+    return "".join(part[0] for part in parse_tm_name(raw)).strip()
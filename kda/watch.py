@@ -0,0 +1,77 @@
+"""감시 모드: edition_history를 주기적으로 확인하고 바뀌었을 때만 갱신 + 시트 동기화
+
+확인할 때마다 edition_history.php 요청 한 번만 보내고, FinishedMaps / RecordsMaps
+해시가 마지막으로 처리한 값과 같으면 리더보드 요청이나 시트 전송을 하지 않는다.
+마지막 해시는 records.db에 저장되므로 프로그램을 다시 켜도 이어서 비교한다.
+변경이 없을 때도 outbox에 남은 동기화 요청은 재시도 시간이 되면 보낸다.
+"""
+import threading
+import time
+
+from kda import control
+from kda.app import get_record_store
+from kda.fetch import edition_generation, fetch_edition_history, fetch_player_data
+from kda.friends import load_friend_pids
+from kda.log import log_message
+from kda.sync import flush_outbox, sync_dashboard
+
+def _generation_key(pid):
+    return f"watch_generation:{pid}"
+
+def _wait(seconds, stop_event):
+    """seconds초 대기, 중단 요청이 오면 True"""
+    deadline = time.monotonic() + seconds
+    while not control.stop_requested():
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        if stop_event.wait(min(remaining, 1.0)):
+            return True
+    return True
+
+def poll_once(pid, sheet_id="", friend_pids=None, sync=True):
+    """한 번 확인, 바뀐 내용을 처리했으면 True (변화 없음 / 실패는 False)
+
+    friend_pids가 None이면 확인할 때마다 friends.ini에서 다시 읽는다.
+    """
+    data = fetch_edition_history(pid)
+    if not data:
+        return False
+
+    store = get_record_store()
+    generation = edition_generation(data)
+    if generation == store.get_meta(_generation_key(pid)):
+        log_message("watch_unchanged")
+        # 변경이 없어도 예전에 보내지 못한 동기화 요청은 재시도 시간이 되면 전송
+        if sync:
+            flush_outbox()
+        return False
+
+    log_message("watch_changed")
+    if friend_pids is None:
+        friend_pids = load_friend_pids()
+    if not fetch_player_data(pid, include_time=True, friend_pids=friend_pids, history=data):
+        return False
+
+    # 갱신이 끝나면 기록 (시트 전송에 실패한 요청은 outbox에 남아 다음 확인 때 다시 보내므로 다시 크롤링하지 않음)
+    store.set_meta(_generation_key(pid), generation)
+    control.check_stop()
+    return sync_dashboard(pid, sheet_id) if sync else True
+
+def watch(pid, sheet_id="", interval=300, friend_pids=None, sync=True, stop_event=None):
+    """stop_event가 설정되거나 중단 요청(control)이 올 때까지 interval초마다 확인"""
+    stop_event = stop_event or threading.Event()
+    log_message("watch_started", interval=int(interval))
+    try:
+        while not stop_event.is_set():
+            control.check_stop()
+            try:
+                poll_once(pid, sheet_id, friend_pids, sync)
+            except InterruptedError:
+                raise
+            except Exception as e:
+                log_message("watch_poll_failed", error=e)
+            if _wait(interval, stop_event):
+                break
+    finally:
+        log_message("watch_stopped")
@@ -1,36 +1,33 @@
 __version__ = "1.3.2"
 
+import time
+STARTUP_STARTED = time.perf_counter()  # 시작 시간 측정 기준 (첫 화면이 그려질 때까지)
+
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox
-import subprocess
 import os
-import threading
+import queue
 import sys
-from PIL import Image, ImageTk
-from bs4 import BeautifulSoup
-import json
-import configparser
-import re
-import importlib.util
-import shutil
 import webbrowser
-import locale
-import time
-import select
-import requests
+from collections import deque
 import math
+from kda import app, control, log
+from kda.app import get_map_catalog, get_record_store
+from kda.compare import compare_players
+from kda.config import get_config
+from kda.fetch import fetch_player_data
+from kda.friends import delete_friend, is_friend, load_friend_pids, load_friends, refresh_friends, save_friend, update_friend
+from kda.jobs import FRIENDS, HIGH, LOW, RECORDS, JobScheduler
+from kda.log import log_message
+from kda.names import get_cached_name_parts, get_name, get_name_parts
+from kda.paths import BASE_DIR
+from kda.settings import load_log_settings, load_map_settings, load_watch_settings
+from kda.sync import sync_dashboard, sync_friend_dashboards
+from kda.watch import poll_once
 
-if getattr(sys, 'frozen', False):
-    BASE_DIR = os.path.dirname(sys.executable)
-else:
-    BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-
-CONFIG_PATH = os.path.join(BASE_DIR, "config.ini")
-MAP_RECORDS_PATH = os.path.join(BASE_DIR, "map_records.txt")
 README_PATH = os.path.join(BASE_DIR, "README.txt")
 REQUIREMENTS_PATH = os.path.join(BASE_DIR, "requirements.txt")
 FIRST_RUN_FLAG_PATH = os.path.join(BASE_DIR, "first_run.flag")
-FRIENDS_PATH = os.path.join(BASE_DIR, "friends.ini")
 
 if getattr(sys, 'frozen', False):
     BASE_DIR = sys._MEIPASS
@@ -42,82 +39,30 @@ ICON_PATH = os.path.join(BASE_DIR, "KDA.ico")
 LANG_IMG_PATH = os.path.join(BASE_DIR, "lang.png")
 STOP_IMG_PATH = os.path.join(BASE_DIR, "stop.png")
 
+# config.ini 기본값 (없거나 비어 있는 값만 채움)
+DEFAULT_CONFIG = {
+    "Settings": {"pid": "", "sheet_id": "", "language": "en"},
+    "Shortcuts": {"save": "Ctrl+S", "run": "Ctrl+R", "quit": "Ctrl+Q"},
+    "Rank": {"total_maps": "526", "kacky_color": "positive"},
+    "Window": {"x": "", "y": ""},
+    "Network": {"workers": "8", "min_workers": "1", "rate": "5", "burst": "10", "target_latency": "2.0"},
+    "Cache": {"enabled": "true", "ttl_days": "7", "max_mb": "64"}
+}
+
+# config.ini는 kda.config가 한 번만 읽어 메모리에 두고, 값이 바뀔 때만 잠시 뒤 한 번에 저장
+config = get_config()
+
 # config.ini 파일 로드
 def load_config():
     global current_language, shortcuts
-    config = configparser.ConfigParser()
-
-    # 기본값 정의
-    default_settings = {
-        "pid": "",
-        "sheet_id": "",
-        "language": "en"
-    }
-
-    default_shortcuts = {
-        "save": "Ctrl+S",
-        "run": "Ctrl+R",
-        "quit": "Ctrl+Q"
-    }
-
-    default_rank = {
-        "total_maps": "526",
-        "kacky_color": "positive"
-    }
-
-    default_window = {
-        "x": "",
-        "y": ""
-    }
-
-    # config.ini가 없으면 생성
-    if not os.path.exists(CONFIG_PATH):
-        config["Settings"] = default_settings
-        config["Shortcuts"] = default_shortcuts
-        config["Rank"] = default_rank
-        with open(CONFIG_PATH, "w", encoding="utf-8") as f:
-            config.write(f)
-
-    # config.ini 읽기
-    config.read(CONFIG_PATH, encoding="utf-8")
 
-    # Settings 섹션 처리
-    if "Settings" not in config:
-        config["Settings"] = default_settings
-    else:
-        for key, value in default_settings.items():
-            if key not in config["Settings"] or not config["Settings"][key].strip():
-                config["Settings"][key] = value
-
-    # Shortcuts 섹션 처리
-    if "Shortcuts" not in config:
-        config["Shortcuts"] = default_shortcuts
-    else:
-        for key, value in default_shortcuts.items():
-            if key not in config["Shortcuts"] or not config["Shortcuts"][key].strip():
-                config["Shortcuts"][key] = value
-
-    # Rank 섹션 처리
-    if "Rank" not in config:
-        config["Rank"] = default_rank
-    for key, value in default_rank.items():
-        if key not in config["Rank"] or not config["Rank"][key].strip():
-            config["Rank"][key] = value
-
-    # Window 섹션 처리
-    if "Window" not in config:
-        config["Window"] = default_window
-    else:
-        for key, value in default_window.items():
-            if key not in config["Window"] or not config["Window"][key].strip():
-                config["Window"][key] = value
-
-    # config 저장
-    with open(CONFIG_PATH, "w", encoding="utf-8") as f:
-        config.write(f)
+    # 빠진 값만 채움 (채운 값이 없으면 파일을 다시 쓰지 않음)
+    for section, defaults in DEFAULT_CONFIG.items():
+        config.set_defaults(section, defaults)
 
     # 결과 적용
-    current_language = config["Settings"]["language"]
+    current_language = config.get("Settings", "language", fallback="en")
+    log.set_language(current_language)
 
     # 단축키 변환
     def to_tk_format(value):
@@ -125,112 +70,53 @@ def load_config():
 
     shortcuts = {}
     for key in default_shortcuts:
-        shortcuts[key] = to_tk_format(config["Shortcuts"][key].strip())
+        shortcuts[key] = to_tk_format(config.get("Shortcuts", key))
 
-    pid_var.set(config["Settings"]["pid"])
-    sheet_id_var.set(config["Settings"]["sheet_id"])
+    pid_var.set(config.get("Settings", "pid"))
+    sheet_id_var.set(config.get("Settings", "sheet_id"))
 
-def save_config():
-    config = configparser.ConfigParser()
-
-    # 설정 파일이 존재하면 기존 내용 불러오기
-    if os.path.exists(CONFIG_PATH):
-        config.read(CONFIG_PATH, encoding="utf-8")
-
-    # Settings 섹션이 없다면 생성
-    if "Settings" not in config:
-        config["Settings"] = {}
+    app.init(config.get("Settings", "pid"))
 
+def save_config():
     # 기본값 처리 (공백 방지 포함)
     pid = pid_var.get().strip()
     sheet_id = sheet_id_var.get().strip()
     lang = current_language.strip() if current_language else "ko"
 
-    config["Settings"]["pid"] = pid if pid else "0000"
-    config["Settings"]["sheet_id"] = sheet_id if sheet_id else "unknown"
-    config["Settings"]["language"] = lang
-
-    with open(CONFIG_PATH, "w", encoding="utf-8") as configfile:
-        config.write(configfile)
-
+    # 바뀐 값이 있을 때만 저장되고, 닉네임 표시는 변경 알림(on_config_changed)으로 갱신
+    config.update("Settings", {
+        "pid": pid if pid else "0000",
+        "sheet_id": sheet_id if sheet_id else "unknown",
+        "language": lang
+    })
     log_message("config_saved")
-    get_username()
 
 def save_language():
-    config = configparser.ConfigParser()
-
-    # 설정 파일이 존재하면 읽기
-    if os.path.exists(CONFIG_PATH):
-        config.read(CONFIG_PATH, encoding="utf-8")
-
-    # Settings 섹션이 없으면 생성
-    if "Settings" not in config:
-        config["Settings"] = {}
-
     # 언어 값이 비었을 경우 기본값 설정
     lang = current_language.strip().lower() if current_language else "ko"
     if lang not in ["ko", "en"]:
         lang = "en"  # 허용되지 않은 값은 기본값 사용
-
-    config["Settings"]["language"] = lang
-
-    with open(CONFIG_PATH, "w", encoding="utf-8") as configfile:
-        config.write(configfile)
+    config.set("Settings", "language", lang)
 
 # 현재 언어 상태 변수
 current_language = "en"  # 기본값: 영어
 
 def load_language():
     global current_language
-    config = configparser.ConfigParser()
-
-    if not os.path.exists(CONFIG_PATH):
-        # config.ini가 없을 때 자동 생성
-        config["Settings"] = {"language": "en"}
-        with open(CONFIG_PATH, "w", encoding="utf-8") as f:
-            config.write(f)
-        current_language = "en"
-        return
-
-    config.read(CONFIG_PATH, encoding="utf-8")
-
-    # "Settings" 섹션이 없을 경우 생성
-    if "Settings" not in config:
-        config["Settings"] = {}
 
     # 언어 값 읽기 (공백 또는 유효하지 않은 값 처리)
-    lang_value = config["Settings"].get("language", "").strip().lower()
-
+    lang_value = config.get("Settings", "language").lower()
     if lang_value not in ("ko", "en"):
         # 기본값으로 설정
         lang_value = "en"
-        config["Settings"]["language"] = lang_value
-        with open(CONFIG_PATH, "w", encoding="utf-8") as f:
-            config.write(f)
+        config.set("Settings", "language", lang_value)
 
     current_language = lang_value
+    log.set_language(current_language)
 
 # 프로그램 실행 시 언어 설정 불러오기
 load_language()
 
-def load_map_settings():
-    config = configparser.ConfigParser()
-    if os.path.exists(CONFIG_PATH):
-        config.read(CONFIG_PATH, encoding="utf-8")
-        total_maps = config.getint("Rank", "total_maps", fallback=526)
-        kacky_color = config.get("Rank", "kacky_color", fallback="positive").strip().lower()
-        if kacky_color not in ["positive", "negative"]:
-            kacky_color = "positive"
-            config.set("Rank", "kacky_color", "positive")
-
-            with open(CONFIG_PATH, "w", encoding="utf-8") as f:
-                config.write(f)
-
-        is_positive = kacky_color == "positive"
-        return total_maps, is_positive
-
-    return 526, True  # 기본값
-
 def get_rank_and_color(count, total, is_positive=True):
     kacky_positive_colors = ["#aa0000", "#aa0000", "#aa6600", "#aaaa00", "#00aa00"]
     kacky_negative_colors = ["#aa0066", "#aa0066", "#aa3300", "#aa6600", "#ff4400"]
@@ -249,358 +135,190 @@ def get_rank_and_color(count, total, is_positive=True):
 
     return ("norank", "#ffffff")
 
-# 크롤링 함수
-def fetch_player_data(pid, include_time=False):
-    try:
-        url = f"https://kackiestkacky.com/hunting/editions/edition_history.php?pid={pid}&edition=0"
-        headers = {
-            "User-Agent": "Mozilla/5.0"
-        }
-        if include_time:
-            log_message("load_records")
-        log_message("fetching_map_uids")
-
-        response = requests.get(url, headers=headers, timeout=10)
-        if response.status_code != 200:
-            log_message("error", status_code=response.status_code)
-            log_message("response", response_text=response.text)
-            return None
+def get_username():
+    """저장된 상태(닉네임, 클리어 수, 랭크 색상)로 바로 그리고, 닉네임은 백그라운드에서 다시 확인"""
+    pid = config.get("Settings", "pid")
+    sheet_id = config.get("Settings", "sheet_id")
 
-        data = response.json()
-        if not data:
-            log_message("script_output", output="❌ There is no response data.")
-            return None
+    if not (pid and sheet_id):
+        render_username("", None)
+        return
 
-        all_records = []
-        raw_name = "Unknown"
-
-        def clean_name(name):
-            return re.sub(r"\$[0-9a-zA-Z]{1,3}", "", name)
-
-        existing_records = {}
-        if include_time and os.path.exists("map_records.txt"):
-            with open("map_records.txt", "r", encoding="utf-8") as f:
-                for line in f:
-                    parts = line.strip().split("\t")
-                    if len(parts) == 3:
-                        map_name, time, rank = parts
-                        existing_records[map_name] = (time, rank)
-
-        update_targets = []
-
-        for entry in data:
-            raw_name = entry.get("PlayerName", raw_name)
-            finished = entry.get("FinishedMaps", "")
-            ranks = entry.get("RecordsMaps", "")
-            if not finished or not ranks:
-                continue
-
-            parts = finished.split(";")
-            if len(parts) != 2:
-                continue
-
-            map_names_raw = parts[0].split(",")
-            map_uids = parts[1].split(",")
-            ranks_list = ranks.split(",")
-
-            for i in range(min(len(map_names_raw), len(map_uids), len(ranks_list))):
-                check_stop()
-
-                map_name_raw = map_names_raw[i]
-                map_uid = map_uids[i]
-                rank = ranks_list[i]
-                map_name = clean_name(map_name_raw)
-
-                if not include_time:
-                    # 친구 기록
-                    all_records.append((map_name, rank))
-                    continue
-
-                # 내 기록: 기존 기록 비교
-                old = existing_records.get(map_name)
-                if not old:
-                    update_targets.append((map_name, map_uid, rank, None))
-                else:
-                    old_time, old_rank = old
-                    update_targets.append((map_name, map_uid, rank, old)) if old_rank != rank or old_time == "0" else all_records.append((map_name, old_time, old_rank))
-
-        if include_time:
-            log_message("map_uid_collected", count=len(update_targets))
-
-            for map_name, map_uid, rank, old in update_targets:
-                check_stop()
-                try:
-                    detail_url = f"https://kackiestkacky.com/hunting/editions/maps.php?uid={map_uid}"
-                    log_message("accessing", url=detail_url)
-                    record = fetch_record_time(pid, map_uid)
-                    best_time = record["time"]
-                    current_rank = rank
-
-                    if old and old[0] == best_time:
-                        log_message("record_same", map_name=map_name)
-                    else:
-                        log_message("record_updated", map_name=map_name, best_time=best_time, current_rank=current_rank)
-
-                    all_records.append((map_name, best_time, current_rank))
-
-                except Exception as e:
-                    log_message("record_not_found", map_name=map_name, error=e)
-                    if old:
-                        all_records.append((map_name, old[0], old[1]))
-                    else:
-                        all_records.append((map_name, "0", rank))
-
-        clean_player_name = clean_name(raw_name)
-        clear_count = len(all_records)
-
-        log_message("record_save")
-        os.makedirs("records", exist_ok=True)
-        filename = "map_records.txt" if include_time else f"records/{pid}_records.txt"
-        with open(filename, "w", encoding="utf-8") as f:
-            for record in all_records:
-                if include_time:
-                    f.write(f"{record[0]}\t{record[1]}\t{record[2]}\n")
-                else:
-                    f.write(f"{record[0]}\t{record[1]}\n")
-
-        if include_time:
-            log_message("save_complete")
-
-        return clean_player_name, clear_count, all_records
-
-    except Exception as e:
-        log_message("crawl_failed", e=str(e))
-        return None
-
-# 내 pid일 경우 기록 시간 크롤링
-def fetch_record_time(pid, map_uid):
     try:
-        url = f"https://kackiestkacky.com/hunting/editions/maps.php?uid={map_uid}&raw=1"
-        response = requests.get(url, timeout=10)
-        soup = BeautifulSoup(response.text, "html.parser")
-
-        for row in soup.find_all("tr"):
-            player_link = row.find("a", href=re.compile(f"pid={pid}"))
-            if player_link:
-                tds = row.find_all("td")
-                rank = int(tds[0].text.strip()) if tds else 0
-                time_str = tds[2].text.strip() if len(tds) > 2 else "0:00.000"
-
-                minutes, seconds = time_str.split(":")
-                if minutes == "00":
-                    formatted_time = str(float(seconds))  # ex: 00:01.23 → 1.23
-                else:
-                    formatted_time = time_str  # ex: 01:12.34 → 01:12.34
+        cached_parts = get_cached_name_parts(pid)
+    except Exception:
+        cached_parts = None
+    render_username(pid, cached_parts)
 
-                return {"rank": rank, "time": formatted_time}
+    def revalidate():
+        try:
+            name_parts = get_name_parts(pid)
+        except Exception:
+            return
+        if name_parts and name_parts != cached_parts:
+            call_in_ui(render_username, pid, name_parts)
 
-    except Exception as e:
-        log_message("record_not_found", map_name=map_uid, error=str(e))
+    scheduler.submit(("name", pid), revalidate, priority=LOW, resources=(RECORDS,))
 
-    return {"rank": 0, "time": 0}
+def render_username(pid, name_parts):
+    username_display_label.configure(state="normal")
+    username_display_label.delete("1.0", tk.END)
 
-def get_username():
-    config = configparser.ConfigParser()
-    if os.path.exists(CONFIG_PATH):
-        config.read(CONFIG_PATH, encoding="utf-8")
-        pid = config.get("Settings", "pid", fallback="")
-        sheet_id = config.get("Settings", "sheet_id", fallback="")
+    if pid:
+        try:
+            # ✅ 클리어한 맵 개수 계산
+            clear_count = get_record_store().count_records(pid)
+
+            # ✅ 전체 맵 수 (맵 카탈로그에서 확인된 수, config.ini의 total_maps는 최솟값) 및 색상 가져오기
+            total_maps, is_positive = load_map_settings()
+            total_maps = get_map_catalog().total_maps(total_maps)
+            rank_name, rank_color = get_rank_and_color(clear_count, total_maps, is_positive)
+
+            if rank_name == "kacky" and isinstance(rank_color, list):
+                symbols = ["["] + list(str(clear_count)) + ["]", " "]
+                for i, char in enumerate(symbols):
+                    color = rank_color[min(i, len(rank_color) - 1)]
+                    tag_name = f"rank_{i}"
+                    username_display_label.tag_configure(tag_name, foreground=color, font=("Arial", 14, "bold"))
+                    username_display_label.insert(tk.END, char, tag_name)
+            else:
+                tag_name = "rank_tag"
+                username_display_label.tag_configure(tag_name, foreground=rank_color, font=("Arial", 14, "bold"))
+                username_display_label.insert(tk.END, f"[{clear_count}] ", tag_name)
+
+            # ✅ 닉네임 ($ 서식 코드 → 색상/굵기/기울임 조각), 아직 없으면 확인이 끝날 때까지 "..."
+            if name_parts:
+                for i, (text, color, weight, slant) in enumerate(name_parts):
+                    if color is None and weight == "normal" and slant == "roman":
+                        username_display_label.insert(tk.END, text)
+                        continue
 
-        username_display_label.configure(state="normal")
-        username_display_label.delete("1.0", tk.END)
+                    tag_name = f"color{i}"
+                    username_display_label.tag_configure(tag_name, font=("Arial", 14, weight, slant))
+                    if color:
+                        username_display_label.tag_configure(tag_name, foreground=color)
+                    username_display_label.insert(tk.END, text, tag_name)
+            else:
+                username_display_label.insert(tk.END, "...")
 
-        if pid and sheet_id:
-            try:
-                # ✅ 클리어한 맵 개수 계산
-                clear_count = 0
-                if os.path.exists(MAP_RECORDS_PATH):
-                    with open(MAP_RECORDS_PATH, "r", encoding="utf-8") as file:
-                        clear_count = len([line for line in file if line.strip()])
-
-                # ✅ 전체 맵 수 및 색상 가져오기
-                total_maps, is_positive = load_map_settings()
-                rank_name, rank_color = get_rank_and_color(clear_count, total_maps, is_positive)
-
-                if rank_name == "kacky" and isinstance(rank_color, list):
-                    symbols = ["["] + list(str(clear_count)) + ["]", " "]
-                    for i, char in enumerate(symbols):
-                        color = rank_color[min(i, len(rank_color) - 1)]
-                        tag_name = f"rank_{i}"
-                        username_display_label.tag_configure(tag_name, foreground=color, font=("Arial", 14, "bold"))
-                        username_display_label.insert(tk.END, char, tag_name)
-                else:
-                    tag_name = f"rank_tag"
-                    username_display_label.tag_configure(tag_name, foreground=rank_color, font=("Arial", 14, "bold"))
-                    username_display_label.insert(tk.END, f"[{clear_count}] ", tag_name)
-
-                # ✅ 유저 페이지 파싱
-                url = f"https://kackiestkacky.com/hunting/editions/players.php?pid={pid}&edition=0"
-                response = requests.get(url, timeout=10)
-                soup = BeautifulSoup(response.text, "html.parser")
-                h4 = soup.find("h4", class_="text-center padding-top")
-
-                if h4:
-                    if all(isinstance(child, str) for child in h4.contents):
-                        full_text = h4.get_text(strip=True)
-                        if "on All Editions" in full_text:
-                            clean_name = full_text.split("on All Editions")[0].strip()
-                        else:
-                            clean_name = full_text.strip()
-                        username_display_label.insert(tk.END, clean_name)
-                    else:
-                        for i, part in enumerate(h4.contents):
-                            if isinstance(part, str):
-                                if "on All Editions" in part:
-                                    break
-                                username_display_label.insert(tk.END, part)
-                            elif part.name == "span":
-                                style = part.get("style", "")
-                                color_match = re.search(r"color:(#[0-9a-fA-F]{6})", style)
-                                color = color_match.group(1) if color_match else "#000000"
-                                weight = "bold" if "font-weight:bold" in style else "normal"
-                                slant = "italic" if "font-style:italic" in style else "roman"
-
-                                tag_name = f"color{i}"
-                                username_display_label.tag_configure(
-                                    tag_name,
-                                    foreground=color,
-                                    font=("Arial", 14, weight, slant)
-                                )
-                                username_display_label.insert(tk.END, part.get_text(), tag_name)
-
-                    username_display_label.tag_add("center", "1.0", "end")
-                    username_display_label.tag_configure("center", justify="center")
-                else:
-                    username_display_label.insert(tk.END, "Unknown")
-                    username_display_label.tag_add("center", "1.0", "end")
-                    username_display_label.tag_configure("center", justify="center")
-
-            except Exception as e:
-                username_display_label.insert(tk.END, "Failed to load nickname")
-                username_display_label.configure(state="disabled")
-        else:
-            username_display_label.insert(tk.END, "Not set")
             username_display_label.tag_add("center", "1.0", "end")
             username_display_label.tag_configure("center", justify="center")
 
-        username_display_label.configure(state="disabled")
+        except Exception:
+            username_display_label.insert(tk.END, "Failed to load nickname")
+    else:
+        username_display_label.insert(tk.END, "Not set")
+        username_display_label.tag_add("center", "1.0", "end")
+        username_display_label.tag_configure("center", justify="center")
 
-running_process = None  # 실행 중인 프로세스를 저장할 변수
+    username_display_label.configure(state="disabled")
 
-script_should_stop = False
-stopped_logged = False
+running_process = None  # 실행 중인 프로세스를 저장할 변수
 
-def stop_script():
-    def do_stop():
-        global driver, script_should_stop, stopped_logged
+# 모든 백그라운드 작업은 이 스케줄러에서 실행 (같은 파일을 쓰는 작업은 한 번에 하나씩, 작업별 취소)
+scheduler = JobScheduler()
 
-        script_should_stop = True
+# 작업 스레드는 Tk 위젯을 직접 건드리지 않고 화면 갱신을 이 큐에 넣음 (Tk 스레드에서 UI_DRAIN_MS마다 실행)
+UI_DRAIN_MS = 50
+ui_calls = queue.SimpleQueue()
+ui_drain_job = None
 
-        if not stopped_logged:
-            log_message("script_stopped")
-            stopped_logged = True
+def call_in_ui(fn, *args):
+    ui_calls.put((fn, args))
 
-    threading.Thread(target=do_stop, daemon=True).start()
+def drain_ui_calls():
+    global ui_drain_job
+    while True:
+        try:
+            fn, args = ui_calls.get_nowait()
+        except queue.Empty:
+            break
+        try:
+            fn(*args)
+        except Exception as e:
+            log_message("unexpected_error", error=str(e))
+    ui_drain_job = root.after(UI_DRAIN_MS, drain_ui_calls)
 
-def check_stop():
-    if script_should_stop:
-        raise InterruptedError("🛑 The script was interrupted by the user.")
+def stop_script():
+    # 감시 모드도 끄고, 대기 중 / 실행 중인 작업을 모두 취소
+    if watch_var.get():
+        watch_var.set(False)
+        toggle_watch()
+    if scheduler.cancel_all():
+        log_message("script_stopped")
 
 def get_maps():
-    config = configparser.ConfigParser()
-    if os.path.exists("config.ini"):
-        config.read("config.ini", encoding="utf-8")
-        pid = config.get("Settings", "pid", fallback="")
-        if pid:
-            result = fetch_player_data(pid, include_time=True)
-            return result
+    pid = config.get("Settings", "pid")
+    if pid:
+        result = fetch_player_data(pid, include_time=True, friend_pids=load_friend_pids())
+        return result
 
 def check_list():
-    global script_should_stop, stopped_logged
-    check_stop()
-
-    # config.ini 파일 읽기
-    config = configparser.ConfigParser()
-    config.read("config.ini")
-    sheet_id = config.get("Settings", "sheet_id", fallback="")
+    pid = config.get("Settings", "pid")
+    sheet_id = config.get("Settings", "sheet_id")
 
-    with open("map_records.txt", "r", encoding="utf-8") as file:
-        map_records_content = file.read()
-
-    payload = {
-        "map_records": map_records_content,
-        "sheet_id": sheet_id
-    }
+    sync_dashboard(pid, sheet_id)
 
-    check_stop()
-
-    # GAS 웹 앱 호출
-    log_message("send_request")
+def run_scripts():
+    pid = config.get("Settings", "pid")
+    sheet_id = config.get("Settings", "sheet_id")
+    log_message("load_complete", pid=pid, sheet_id=sheet_id)
 
-    if not os.path.exists(MAP_RECORDS_PATH):
-        log_message("script_output", output="❌ map_records.txt is missing!")
+    def execute():
+        get_maps()
+        control.check_stop()
+        check_list()
+
+    # 실행 중에 다시 누르면 끝난 뒤 한 번만 더 실행 (대기 중인 같은 작업은 합쳐짐)
+    scheduler.submit(("run", pid), execute, priority=HIGH, resources=(RECORDS,))
+
+watch_timer = None  # 다음 확인 예약 (root.after)
+watch_key = None
+
+# 감시 모드: edition_history가 바뀌었을 때만 실행 버튼과 같은 작업 수행
+# interval초마다 확인 작업을 스케줄러에 넣고, 이전 확인이 아직 대기 중이면 합쳐짐
+def toggle_watch():
+    global watch_timer, watch_key
+
+    if not watch_var.get():
+        if watch_timer:
+            root.after_cancel(watch_timer)
+            watch_timer = None
+            scheduler.cancel(watch_key)
+            log_message("watch_stopped")
         return
 
-    with open(MAP_RECORDS_PATH, "r", encoding="utf-8") as file:
-        map_records_content = file.read()
-
-    payload = {
-        "map_records": map_records_content,
-        "sheet_id": sheet_id
-    }
-
-    check_stop()
-
-   # 요청 헤더 추가 (Content-Type: application/json)
-    headers = {
-        "Content-Type": "application/json"
-    }
-
-    webhook_url = "https://script.google.com/macros/s/AKfycbyQsuyDAC-hwbrFuuOWu4uL8FNl1ryKgMuGFeqCoXZvtweCSlX_nj1zyfS4sGeERbGK/exec"
-
-    response = requests.post(webhook_url, json=payload, headers=headers)  # headers 추가
-
-    check_stop()
-
-    if response.status_code == 200:
-        log_message("success", response=response.text)
-    else:
-        log_message("fail", status_code=response.status_code)
-        log_message("response", response_text=response.text)
-
-def run_scripts():
-    config_file = "config.ini"
-    config = configparser.ConfigParser()
-    if os.path.exists(config_file):
-        config.read(config_file, encoding="utf-8")
-        pid = config.get("Settings", "pid", fallback=None)
-        sheet_id = config.get("Settings", "sheet_id", fallback=None)
-        log_message("load_complete", pid=pid, sheet_id=sheet_id)
-    else:
-        log_message("no_settings")
-        pid, sheet_id = None, None
+    pid = config.get("Settings", "pid")
+    sheet_id = config.get("Settings", "sheet_id")
+    if not pid:
+        log_message("no_pid")
+        watch_var.set(False)
+        return
 
-    global script_should_stop, stopped_logged
-    script_should_stop = False
-    stopped_logged = False
+    interval = load_watch_settings()
+    watch_key = ("watch", pid)
+    log_message("watch_started", interval=int(interval))
 
     def execute():
         try:
-            check_stop()
-            get_maps()
-            check_stop()
-            check_list()
+            poll_once(pid, sheet_id)
         except InterruptedError:
-            pass
+            raise
         except Exception as e:
-            log_message("unexpected_error", error=str(e))
+            log_message("watch_poll_failed", error=e)
 
-    threading.Thread(target=execute, daemon=True).start()
+    def schedule():
+        global watch_timer
+        scheduler.submit(watch_key, execute, priority=LOW, resources=(RECORDS,))
+        watch_timer = root.after(int(interval * 1000), schedule)
+
+    schedule()
 
 # README.txt 열기
 def open_readme():
     """README.txt 파일을 메모장에서 실행"""
     if os.path.exists(README_PATH):
+        import subprocess
         subprocess.Popen(["notepad.exe", README_PATH])
     else:
         messagebox.showerror(
@@ -637,8 +355,16 @@ def open_lis_list():
     url = "https://docs.google.com/document/d/1ce1WhT_5MVHhPd-XX39mr6zHv7RWScGp4mCJ9OuBJWc/edit?usp=sharing"
     webbrowser.open_new_tab(url)
 
+# PNG 이미지 로드 (Tk 8.6은 PNG를 직접 읽으므로 Pillow는 Tk가 못 읽을 때만 불러옴)
+def load_image(path):
+    try:
+        return tk.PhotoImage(file=path)
+    except tk.TclError:
+        from PIL import Image, ImageTk
+        return ImageTk.PhotoImage(Image.open(path))
+
 def get_logo():
-    return ImageTk.PhotoImage(Image.open(LOGO_PATH))
+    return load_image(LOGO_PATH)
 
 # 우클릭 복사 기능 함수
 def copy_selected_item(listbox):
@@ -673,7 +399,7 @@ def open_friend_list():
     x, y = get_window_position()
     popup = tk.Toplevel(root)
     popup.title(title_translations[current_language]["friend_list"])
-    popup.geometry(f"385x214+{x + 0}+{y + 203}")
+    popup.geometry(f"385x282+{x + 0}+{y + 203}")
     popup.transient(root)
     popup.grab_set()
     popup.focus_force()
@@ -737,34 +463,35 @@ def open_friend_list():
 
     ttk.Button(right_frame, text=translations[current_language]["dashboard_btn"], width=10, command=lambda: open_sheet(get_selected_friend()[0]["sheet_id"]) if get_selected_friend() else None).pack(pady=5)
     ttk.Button(right_frame, text=translations[current_language]["userpage_btn"], width=10, command=lambda: open_userpage(get_selected_friend()[0]["pid"]) if get_selected_friend() else None).pack(pady=5)
+    ttk.Button(right_frame, text=translations[current_language]["refresh_all_btn"], width=10, command=lambda: refresh_all_friends(friend_listbox)).pack(pady=5)
+    ttk.Button(right_frame, text=translations[current_language]["sync_all_btn"], width=10, command=sync_all_dashboards).pack(pady=5)
+
+# 친구 전체를 백그라운드에서 병렬로 갱신하고, 끝나는 친구부터 목록 줄을 바로 바꿈
+def refresh_all_friends(listbox):
+    data = friends_data
 
+    def show_result(pid, result):
+        # 팝업이 닫혔거나 목록이 바뀌었으면 (삭제 등) 건너뜀, friends.ini는 마지막에 한 번에 저장됨
+        if data is not friends_data or not listbox.winfo_exists():
+            return
+        for idx, friend in enumerate(data):
+            if friend["pid"] == pid:
+                friend["name"], friend["clear_count"] = result
+                listbox.delete(idx)
+                listbox.insert(idx, f"[{result[1]}] {result[0]}")
+                break
 
-def load_friends():
-    config = configparser.ConfigParser()
-    if not os.path.exists(FRIENDS_PATH):
-        log_message("script_output", output="❌ friends.ini is missing!")
-        return []
+    def on_result(pid, result):
+        if result:
+            call_in_ui(show_result, pid, result)
 
-    config.read(FRIENDS_PATH, encoding="utf-8")
-    friends = []
+    scheduler.submit(("refresh_friends",), refresh_friends, [friend["pid"] for friend in data], on_result=on_result,
+                     priority=HIGH, resources=(FRIENDS, RECORDS))
+
+# Sheet ID가 있는 친구 대시보드를 모두 갱신 (백그라운드, 결과는 로그 창에 표시)
+def sync_all_dashboards():
+    scheduler.submit(("sync_friends",), sync_friend_dashboards, priority=HIGH, resources=(FRIENDS, RECORDS))
 
-    log_message("friends_ini_loaded")
-    for section in config.sections():
-        if section.startswith("friend_") or section.isdigit():  # <- 숫자 PID인 경우 처리
-            try:
-                friend = {
-                    "pid": config.get(section, "pid", fallback=section),
-                    "sheet_id": config.get(section, "sheet_id", fallback=""),
-                    "name": config.get(section, "name", fallback="Unknown"),
-                    "clear_count": config.getint(section, "clear_count", fallback=0),
-                    "cleared_map": config.get(section, "cleared_map", fallback="").split(", ")
-                }
-                friends.append(friend)
-                # log_message("script_output", output=f"✅ 친구 로드됨: {friend['name']} (맵 {friend['clear_count']}개)")
-            except Exception as e:
-                log_message("friend_load_failed", section=section, e=e)
-
-    return friends
 
 # 친구 추가 팝업
 def add_friend(listbox=None, parent_popup=None):
@@ -786,58 +513,66 @@ def add_friend(listbox=None, parent_popup=None):
             return
 
         # ✅ 현재 config.ini의 pid와 중복 확인
-        config_main = configparser.ConfigParser()
-        if os.path.exists("config.ini"):
-            config_main.read("config.ini", encoding="utf-8")
-            current_pid = config_main.get("Settings", "pid", fallback="")
-            if pid == current_pid:
-                messagebox.showwarning(title_translations[current_language]["warning"], message_translations[current_language]["already_added"], parent=add_window)
-                return
+        if pid == config.get("Settings", "pid"):
+            messagebox.showwarning(title_translations[current_language]["warning"], message_translations[current_language]["already_added"], parent=add_window)
+            return
 
         # ✅ 중복 추가 방지
-        config = configparser.ConfigParser()
-        if os.path.exists("friends.ini"):
-            config.read("friends.ini", encoding="utf-8")
-            if pid in config.sections():
-                messagebox.showwarning(title_translations[current_language]["warning"], message_translations[current_language]["already_added"], parent=add_window)
-                return
-
-        record_path = os.path.join("records", f"{pid}_records.txt")
-
-        # ✅ 이름은 항상 BeautifulSoup으로 가져오기
-        name = get_friend_name(pid)
-        if not name:
-            messagebox.showerror(title_translations[current_language]["error"], message_translations[current_language]["name_fail"], parent=add_window)
+        if is_friend(pid):
+            messagebox.showwarning(title_translations[current_language]["warning"], message_translations[current_language]["already_added"], parent=add_window)
             return
 
-        # ✅ 기록 파일이 있으면 개수만 계산, 없으면 셀레니움 실행
-        record_path = os.path.join("records", f"{pid}_records.txt")
-        if os.path.exists(record_path):
-            with open(record_path, "r", encoding="utf-8") as f:
-                lines = [line.strip() for line in f if line.strip()]
-                clear_count = len(lines)
+        # ✅ 크롤링은 백그라운드에서, 끝나면 Tk 스레드에서 결과 표시 (그동안 버튼 비활성화)
+        confirm_btn.configure(state="disabled")
+        data = friends_data
+
+        def execute():
+            result = None
+            try:
+                result = load_and_save(pid, sheet_id)
+            finally:
+                call_in_ui(show_added, data, pid, sheet_id, result)
+
+        scheduler.submit(("add_friend", pid), execute, priority=HIGH, resources=(FRIENDS, RECORDS))
+
+    # 작업 스레드: (이름, 클리어 수) 또는 실패 메시지 키
+    def load_and_save(pid, sheet_id):
+        # ✅ 저장된 기록이 있으면 개수만 계산, 없으면 크롤링 (이름도 같은 응답에서 가져옴)
+        store = get_record_store()
+        if store.has_records(pid):
+            name = get_name(pid)
+            clear_count = store.count_records(pid)
         else:
             result = fetch_player_data(pid, include_time=False)
             if not result:
-                messagebox.showerror(title_translations[current_language]["error"], message_translations[current_language]["record_fail"], parent=add_window)
-                return
+                return "record_fail"
             name, clear_count, cleared_maps = result
+            if name == "Unknown":
+                name = get_name(pid)
+
+        if not name:
+            return "name_fail"
 
         # ✅ friends.ini 저장
-        config = configparser.ConfigParser()
-        if os.path.exists("friends.ini"):
-            config.read("friends.ini", encoding="utf-8")
-        config[pid] = {
-            "pid": pid,
-            "name": name,
-            "clear_count": str(clear_count),
-            "sheet_id": sheet_id
-        }
-        with open("friends.ini", "w", encoding="utf-8") as f:
-            config.write(f)
-
-        # ✅ listbox에 직접 추가
-        if listbox:
+        save_friend(pid, name, clear_count, sheet_id)
+        return name, clear_count
+
+    # Tk 스레드: 결과 표시 (취소 / 오류면 result는 None, 사유는 로그 창에 표시됨)
+    def show_added(data, pid, sheet_id, result):
+        window_open = add_window.winfo_exists()
+        if window_open:
+            confirm_btn.configure(state="normal")
+        if result is None:
+            return
+        if isinstance(result, str):
+            if window_open:
+                messagebox.showerror(title_translations[current_language]["error"], message_translations[current_language][result], parent=add_window)
+            return
+
+        name, clear_count = result
+
+        # ✅ listbox에 직접 추가 (그 사이 친구 목록 창이 닫혔거나 다시 열렸으면 건너뜀)
+        if listbox and data is friends_data and listbox.winfo_exists():
             display_text = f"[{clear_count}] {name}"
             listbox.insert(tk.END, display_text)
 
@@ -849,8 +584,9 @@ def add_friend(listbox=None, parent_popup=None):
                 "clear_count": clear_count
             })
 
-        messagebox.showinfo(title_translations[current_language]["complete"], message_translations[current_language]["add_success"].format(name=name), parent=add_window)
-        add_window.destroy()
+        if window_open:
+            messagebox.showinfo(title_translations[current_language]["complete"], message_translations[current_language]["add_success"].format(name=name), parent=add_window)
+            add_window.destroy()
 
     ttk.Label(add_window, text=translations[current_language]["pid_label"]).pack(anchor="w", padx=10, pady=(10, 0))
     pid_entry = ttk.Entry(add_window)
@@ -861,7 +597,8 @@ def add_friend(listbox=None, parent_popup=None):
     sheet_entry = ttk.Entry(add_window)
     sheet_entry.pack(fill="x", padx=10)
 
-    ttk.Button(add_window, text=translations[current_language]["confirm_add_btn"], command=confirm_add).pack(pady=10)
+    confirm_btn = ttk.Button(add_window, text=translations[current_language]["confirm_add_btn"], command=confirm_add)
+    confirm_btn.pack(pady=10)
 
 #기타 친구 함수
 def remove_friend(listbox, popup=None):
@@ -883,12 +620,7 @@ def remove_friend(listbox, popup=None):
         pid = friends_data[index]["pid"]
 
         # friends.ini에서 삭제
-        config = configparser.ConfigParser()
-        config.read("friends.ini", encoding="utf-8")
-        if pid in config.sections():
-            config.remove_section(pid)
-            with open("friends.ini", "w", encoding="utf-8") as f:
-                config.write(f)
+        delete_friend(pid)
 
         # 내부 리스트와 UI에서 삭제
         friends_data.pop(index)
@@ -955,51 +687,7 @@ def compare_friend(friend, listbox=None, idx=None):
 
     # 비교 결과 계산 함수
     def compare_with_friend(friend_pid):
-        my_records = load_records("map_records.txt")
-        friend_records = load_records(f"records/{friend_pid}_records.txt")
-
-        friend_maps = set(friend_records.keys())
-        my_maps = set(my_records.keys())
-
-        only_friend = friend_maps - my_maps
-        only_me = my_maps - friend_maps
-        both = friend_maps & my_maps
-
-        worse_rank = []
-        for map_name in both:
-            my_rank = parse_rank(my_records[map_name])
-            friend_rank = parse_rank(friend_records[map_name])
-            if my_rank and friend_rank and my_rank > friend_rank:
-                worse_rank.append(map_name)
-
-        return {
-            "friend_maps": sorted(friend_maps),
-            "only_friend": sorted(only_friend),
-            "only_me": sorted(only_me),
-            "worse_rank": sorted(worse_rank)
-        }
-
-    # 기록 로드
-    def load_records(path):
-        records = {}
-        if os.path.exists(path):
-            with open(path, "r", encoding="utf-8") as f:
-                for line in f:
-                    parts = line.strip().split("\t")
-                    if len(parts) == 3:
-                        map_name, _, rank = parts
-                    elif len(parts) == 2:
-                        map_name, rank = parts
-                    else:
-                        continue
-                    records[map_name] = rank
-        return records
-
-    def parse_rank(rank_str):
-        try:
-            return int(rank_str)
-        except:
-            return None
+        return compare_players(pid_var.get().strip(), friend_pid)
 
     # 리스트박스에 결과 출력
     def display_comparison_results(friend_maps, my_missing, friend_missing, rank_lower):
@@ -1025,13 +713,27 @@ def compare_friend(friend, listbox=None, idx=None):
                                  message_translations[current_language]["select_friend"], parent=parent_popup)
             return
 
-        # 이름 + 맵 정보 크롤링
-        name_result = get_friend_name(pid)
-        result = result = fetch_player_data(pid, include_time=False)
+        # 이름 + 맵 정보 크롤링은 백그라운드에서 (이름은 같은 응답의 PlayerName), 끝나면 Tk 스레드에서 표시
+        refresh_btn.configure(state="disabled")
+        data = friends_data
 
-        if not name_result:
-            messagebox.showerror(title_translations[current_language]["error"],
-                                 message_translations[current_language]["name_fail"], parent=parent_popup)
+        def execute():
+            result = None
+            try:
+                result = fetch_player_data(pid, include_time=False)
+                if result:
+                    # friends.ini 갱신
+                    update_friend(pid, result[0], result[1])
+            finally:
+                call_in_ui(show_refreshed, data, pid, result, parent_popup, control.stop_requested())
+
+        scheduler.submit(("refresh_friend", pid), execute, priority=HIGH, resources=(FRIENDS, RECORDS))
+
+    def show_refreshed(data, pid, result, parent_popup, cancelled):
+        if not parent_popup.winfo_exists():
+            return
+        refresh_btn.configure(state="normal")
+        if cancelled:
             return
 
         if not result or not isinstance(result, tuple):
@@ -1046,17 +748,8 @@ def compare_friend(friend, listbox=None, idx=None):
                                  message_translations[current_language]["friend_parse_failed"].format(error=e), parent=parent_popup)
             return
 
-        # friends.ini 갱신
-        config = configparser.ConfigParser()
-        config.read("friends.ini", encoding="utf-8")
-        if pid in config:
-            config[pid]["name"] = name_got
-            config[pid]["clear_count"] = str(clear_count)
-            with open("friends.ini", "w", encoding="utf-8") as f:
-                config.write(f)
-
-        # 친구 목록 UI 갱신
-        if listbox and idx is not None:
+        # 친구 목록 UI 갱신 (그 사이 친구 목록 창이 닫혔거나 다시 열렸으면 건너뜀)
+        if listbox and idx is not None and data is friends_data and listbox.winfo_exists():
             updated_display = f"[{clear_count}] {name_got}"
             listbox.delete(idx)
             listbox.insert(idx, updated_display)
@@ -1082,19 +775,6 @@ def compare_friend(friend, listbox=None, idx=None):
     popup.focus_force()
     popup.grab_set()
 
-def get_friend_name(pid):
-    try:
-        url = f"https://kackiestkacky.com/hunting/editions/players.php?pid={pid}&edition=0"
-        response = requests.get(url, timeout=10)
-        soup = BeautifulSoup(response.text, "html.parser")
-        h4 = soup.find("h4", class_="text-center padding-top")
-        if h4:
-            full_text = h4.get_text(strip=True)
-            return full_text.split("on All Editions")[0].strip() if "on All Editions" in full_text else full_text.strip()
-    except Exception as e:
-        log_message("name_crawl_failed", error=e)
-    return None
-
 # 다국어 지원 딕셔너리
 title_translations = {
     "ko": {
@@ -1124,6 +804,7 @@ translations = {
         "sheet_label": "Sheet ID:",
         "save_btn": "저장",
         "run_btn": "실행",
+        "watch_check": "자동 감시 (바뀌면 실행)",
         "sheet_page_btn": "대시보드 열기",
         "user_page_btn": "유저 페이지 열기",
         "lis_btn": "LIS 목록 열기",
@@ -1136,6 +817,8 @@ translations = {
         "compare_btn": "비교",
         "dashboard_btn": "대시보드",
         "userpage_btn": "유저페이지",
+        "sync_all_btn": "전체 동기화",
+        "refresh_all_btn": "전체 갱신",
         "sheet_required_label": "Sheet ID (선택):",
         "confirm_add_btn": "추가",
         "friend_clears": "친구가 클리어한 맵 목록",
@@ -1150,6 +833,7 @@ translations = {
         "sheet_label": "Sheet ID:",
         "save_btn": "Save",
         "run_btn": "Run",
+        "watch_check": "Watch (run on change)",
         "sheet_page_btn": "Open Dashboard",
         "user_page_btn": "Open User Page",
         "lis_btn": "Open LIS List",
@@ -1162,6 +846,8 @@ translations = {
         "compare_btn": "Comparison",
         "dashboard_btn": "Dashboard",
         "userpage_btn": "Userpage",
+        "sync_all_btn": "Sync All",
+        "refresh_all_btn": "Refresh All",
         "sheet_required_label": "Sheet ID (optional):",
         "confirm_add_btn": "Add",
         "friend_clears": "Maps cleared by friend",
@@ -1172,125 +858,6 @@ translations = {
     }
 }
 
-log_translations = {
-    "ko": {
-        "config_saved": "✅ config.ini 저장 완료!",
-        # "config_not_found": "⚠ config.ini 파일이 존재하지 않아 기본값을 생성합니다.",
-        # "script_running": "🔄 {script_name} 실행 중...",
-        # "script_completed": "✅ {script_name} 실행 완료!",
-        "script_stopped": "⛔ 스크립트 실행 중단됨.",
-        # "no_script_running": "⚠ 실행 중인 스크립트가 없습니다.",
-        "error_occurred": "❌ 오류 발생: {error}",
-        "installing_libraries": "📦 필수 라이브러리 설치 중...",
-        "installation_complete": "✅ 필수 라이브러리 설치 완료!",
-        "file_not_found": "❌ {file} 파일이 존재하지 않습니다.",
-        "install_output": "📦 {output}",
-        "script_output": "📜 {output}",
-        "load_settings": "📥 설정 파일 로드 중...",
-        "load_complete": "✅ 설정 로드 완료 - PID: {pid}, Sheet ID: {sheet_id}",
-        "no_settings": "⚠ 설정 파일 없음! 기본값 사용",
-        "load_records": "📂 기존 기록 로드 중...",
-        "fetching_map_uids": "📂 클리어한 맵 UID 수집 중...",
-        "accessing": "🌍 접근 중: {url}",
-        "change_filter": "🔄 필터를 'All'로 변경 완료. 테이블이 다시 로드될 때까지 대기 중...",
-        "record_updated": "✅ {map_name} 기록 갱신됨: {best_time} (랭크: {current_rank})\n",
-        "record_same": "✅ {map_name} 기존 기록과 동일함\n",
-        "record_save": "📂 갱신된 기록 저장 중...",
-        "save_complete": "✅ 모든 기록이 map_records.txt에 저장됨.\n",
-        "map_uid_collected": "🔹 {count}개의 갱신된 클리어 맵 UID 수집 완료.\n",
-        "dropdown_not_found": "⚠️ 드롭다운을 찾지 못함. 기본 10개 기록만 가져옴.",
-        "record_not_found": "⚠️ {map_name} 기록 찾기 실패: {error}",
-        "send_request": "📤 GAS 웹 앱 호출 중...",
-        "success": "✅ GAS 웹 앱 호출 성공: {response}\n",
-        "fail": "❌ GAS 웹 앱 호출 실패. 상태 코드: {status_code}",
-        "response": "응답 내용: {response_text}",
-        "language_changed": "🌐 언어가 변경되었습니다.",
-        "all_components_installed": "✅ 모든 필수 구성 요소가 설치되어 있습니다.",
-        "first_run": "🎯 첫 실행입니다. 환경을 점검합니다...",
-        "start_env_check": "🧪 환경 점검 시작 (최초 실행)",
-        "current_python": "📍 현재 실행 중인 Python 경로: {current_python_path}",
-        "python_in_path": "✅ 시스템 PATH에 등록된 python: {python_in_path}",
-        "python_not_found": "⚠️ 시스템 PATH에 'python' 명령어가 등록되어 있지 않습니다.",
-        "how_to_fix": "💡 해결 방법:",
-        "fix_step_1": "1️⃣ 시작 메뉴에서 '시스템 환경 변수 편집'을 검색하여 엽니다.",
-        "fix_step_2": "2️⃣ '환경 변수(N)...' 버튼을 클릭합니다.",
-        "fix_step_3": "3️⃣ '시스템 변수' 또는 '사용자 변수'에서 'Path'를 선택하고 '편집(E)...'을 클릭합니다.",
-        "fix_step_4": "4️⃣ 아래 경로를 새 항목으로 추가한 후 확인을 누릅니다:",
-        "fix_reminder": "🔁 변경 후, 프로그램을 다시 실행하거나 컴퓨터를 재시작할 수도 있습니다.",
-        "requirements_missing": "❌ requirements.txt 파일이 존재하지 않습니다.",
-        "missing_libraries": "⚠️ 누락된 라이브러리 감지됨:",
-        "installing_missing": "📦 설치 시도 중...",
-        "missing_installed": "✅ 누락된 라이브러리 설치 완료",
-        "install_failed": "❌ 라이브러리 설치 실패: {e}",
-        "all_installed": "✅ 모든 필수 라이브러리가 설치되어 있습니다.",
-        "env_check_complete": "✅ 환경 점검 완료!",
-        "map_records_missing": "❌ map_records.txt가 없습니다!",
-        "readme_missing": "README.txt 파일이 존재하지 않습니다.",
-        "friends_ini_loaded": "📂 friends.ini 로드됨",
-        "friend_load_failed": "⚠️ 친구 로딩 실패 ({section}): {error}",
-        "name_crawl_failed": "[이름 크롤링 실패] {e}",
-        "crawl_failed": "크롤링 실패: {e}"
-    },
-    "en": {
-        "config_saved": "✅ config.ini saved successfully!",
-        # "config_not_found": "⚠ config.ini not found. Creating default settings.",
-        # "script_running": "🔄 Running {script_name}...",
-        # "script_completed": "✅ {script_name} completed!",
-        "script_stopped": "⛔ Script execution stopped.",
-        # "no_script_running": "⚠ No script is currently running.",
-        "error_occurred": "❌ Error occurred: {error}",
-        "installing_libraries": "📦 Installing required libraries...",
-        "installation_complete": "✅ Library installation complete!",
-        "file_not_found": "❌ {file} not found.",
-        "install_output": "📦 {output}",
-        "script_output": "📜 {output}",
-        "load_settings": "📥 Loading settings...",
-        "load_complete": "✅ Settings loaded - PID: {pid}, Sheet ID: {sheet_id}",
-        "no_settings": "⚠ No settings file found! Using default values.",
-        "load_records": "📂 Loading existing records...",
-        "fetching_map_uids": "📂 Fetching cleared map UIDs...",
-        "accessing": "🌍 Accessing: {url}",
-        "change_filter": "🔄 Changed filter to 'All'. Waiting for table reload...",
-        "record_updated": "✅ {map_name} record updated: {best_time} (Rank: {current_rank})\n",
-        "record_same": "✅ {map_name} is same as previous record\n",
-        "record_save": "📂 Saving updated records...",
-        "save_complete": "✅ All records saved to map_records.txt.\n",
-        "map_uid_collected": "🔹 Collected {count} updated cleared map UIDs.\n",
-        "dropdown_not_found": "⚠️ Could not find dropdown. Fetching only 10 default records.",
-        "record_not_found": "⚠️ Failed to find record for {map_name}: {error}",
-        "send_request": "📤 Calling GAS Web App...",
-        "success": "✅ GAS Web App call successful: {response}\n",
-        "fail": "❌ GAS Web App call failed. Status code: {status_code}",
-        "response": "Response content: {response_text}",
-        "language_changed": "🌐 The language has been changed.",
-        "all_components_installed": "✅ All required components are installed.",
-        "first_run": "🎯 First launch detected. Checking environment...",
-        "start_env_check": "🧪 Starting environment check (first run)",
-        "current_python": "📍 Currently running Python path: {current_python_path}",
-        "python_in_path": "✅ Python found in system PATH: {python_in_path}",
-        "python_not_found": "⚠️ The 'python' command is not registered in the system PATH.",
-        "how_to_fix": "💡 How to fix:",
-        "fix_step_1": "1️⃣ Open 'Edit the system environment variables' from the Start menu.",
-        "fix_step_2": "2️⃣ Click the 'Environment Variables...' button.",
-        "fix_step_3": "3️⃣ In 'System variables' or 'User variables', select 'Path' and click 'Edit...'.",
-        "fix_step_4": "4️⃣ Add the path below as a new entry and click OK:",
-        "fix_reminder": "🔁 After making changes, restart the program or your computer.",
-        "requirements_missing": "❌ requirements.txt file does not exist.",
-        "missing_libraries": "⚠️ Missing libraries detected:",
-        "installing_missing": "📦 Attempting to install missing libraries...",
-        "missing_installed": "✅ Missing libraries installed successfully",
-        "install_failed": "❌ Failed to install libraries: {e}",
-        "all_installed": "✅ All required libraries are installed.",
-        "env_check_complete": "✅ Environment check complete!",
-        "map_records_missing": "❌ map_records.txt does not exist!",
-        "readme_missing": "README.txt file does not exist.",
-        "friends_ini_loaded": "📂 friends.ini loaded",
-        "friend_load_failed": "⚠️ Failed to load friend ({section}): {e}",
-        "name_crawl_failed": "[Name crawling failed] {error}",
-        "crawl_failed": "Crawling failed: {e}"
-    }
-}
-
 message_translations = {
     "ko": {
         "select_friend": "친구를 선택해주세요.",
@@ -1304,7 +871,12 @@ message_translations = {
         "confirm_remove": "정말로 이 친구를 삭제하시겠습니까?",
         "friend_parse_failed": "친구 데이터 파싱 실패: {error}",
         "friend_refreshed": "{name}님 정보가 갱신되었습니다.",
-        "copy": "복사"
+        "copy": "복사",
+        "log_level_debug": "모두 보기 (맵별 진행 포함)",
+        "log_level_info": "일반 메시지",
+        "log_level_warning": "경고 / 오류만",
+        "log_level_error": "오류만",
+        "log_clear": "로그 지우기"
     },
     "en": {
         "select_friend": "Please select a friend.",
@@ -1318,26 +890,81 @@ message_translations = {
         "confirm_remove": "Are you sure you want to remove this friend?",
         "friend_parse_failed": "Failed to parse friend data: {error}",
         "friend_refreshed": "{name}'s information has been updated.",
-        "copy": "Copy"
+        "copy": "Copy",
+        "log_level_debug": "Show all (including per-map progress)",
+        "log_level_info": "Normal messages",
+        "log_level_warning": "Warnings and errors only",
+        "log_level_error": "Errors only",
+        "log_clear": "Clear log"
     }
 }
 
-# 현재 언어에 맞게 로그 메시지를 변환하는 함수
-def log_translate(key, **kwargs):
-    message_template = log_translations.get(current_language, {}).get(key, key)
-    return message_template.format(**kwargs)
-
-# 로그 메시지 출력 함수 (변경된 메시지 적용)
-def log_message(key, **kwargs):
-    translated_message = log_translate(key, **kwargs)
-    log_text.insert(tk.END, translated_message + "\n")
+# 로그 창 출력: 작업 스레드는 큐에 넣기만 하고, Tk 스레드가 LOG_DRAIN_MS마다 모아서 한 번에 붙임
+# 최근 로그는 [Log] max_lines개까지만 log_history에 두고, 로그 창도 그 줄 수를 넘으면 앞에서부터 지움
+# (표시 수준을 바꾸면 log_history에서 다시 그림, 오래된 기록은 [Log] file 로그 파일에서 확인)
+LOG_DRAIN_MS = 50      # 로그 창 갱신 주기 (ms)
+LOG_DRAIN_BATCH = 500  # 한 번에 붙이는 최대 줄 수 (남은 줄은 다음 주기에)
+
+log_settings = load_log_settings()
+log_max_lines = log_settings["max_lines"]
+log_view_level = log.LEVEL_NAMES[log_settings["level"]]
+log_history = deque(maxlen=log_max_lines)  # (level, message)
+log_sink = log.QueueSink()
+log.set_sink(log_sink)
+log_drain_job = None
+
+def show_log_entries(entries):
+    text = "".join(message + "\n" for level, message in entries if level >= log_view_level)
+    if not text:
+        return
+    log_text.insert(tk.END, text)
+    excess = int(log_text.index("end-1c").split(".")[0]) - 1 - log_max_lines
+    if excess > 0:
+        log_text.delete("1.0", f"{excess + 1}.0")
     log_text.yview(tk.END)
-    root.update_idletasks()
+
+def drain_log():
+    global log_drain_job
+    entries = log_sink.drain(LOG_DRAIN_BATCH)
+    if entries:
+        log_history.extend(entries)
+        show_log_entries(entries)
+    log_drain_job = root.after(LOG_DRAIN_MS, drain_log)
+
+def set_log_level(level):
+    global log_view_level
+    log_view_level = level
+    log_text.delete("1.0", tk.END)
+    show_log_entries(log_history)
+
+def clear_log():
+    log_history.clear()
+    log_text.delete("1.0", tk.END)
+
+def attach_log_menu(widget):
+    level_var = tk.IntVar()
+
+    def show_log_menu(event):
+        texts = message_translations[current_language]
+        level_var.set(log_view_level)
+        menu = tk.Menu(widget, tearoff=0)
+        for name in log.LEVEL_NAMES:
+            menu.add_radiobutton(label=texts[f"log_level_{name}"], variable=level_var, value=log.LEVEL_NAMES[name],
+                                 command=lambda: set_log_level(level_var.get()))
+        menu.add_separator()
+        menu.add_command(label=texts["log_clear"], command=clear_log)
+        try:
+            menu.tk_popup(event.x_root, event.y_root)
+        finally:
+            menu.grab_release()
+
+    widget.bind("<Button-3>", show_log_menu)
 
 # 언어 변경 함수
 def switch_language():
     global current_language
     current_language = "en" if current_language == "ko" else "ko"  # ✅ 한국어 ↔ 영어 전환
+    log.set_language(current_language)
     save_language()
 
     # UI 요소 텍스트 변경
@@ -1346,6 +973,7 @@ def switch_language():
     sheet_label.config(text=translations[current_language]["sheet_label"])
     save_btn.config(text=translations[current_language]["save_btn"])
     run_btn.config(text=translations[current_language]["run_btn"])
+    watch_check.config(text=translations[current_language]["watch_check"])
     help_btn.config(text=translations[current_language]["help_btn"])
     user_page_btn.config(text=translations[current_language]["user_page_btn"])
     sheet_page_btn.config(text=translations[current_language]["sheet_page_btn"])
@@ -1367,22 +995,10 @@ shortcuts = default_shortcuts.copy()
 
 def load_shortcuts():
     global shortcuts
-    config = configparser.ConfigParser()
-
-    # 설정 파일이 없으면 생성
-    if not os.path.exists(CONFIG_PATH):
-        config["Shortcuts"] = {k: v.replace("<Control-", "Ctrl+").replace(">", "") for k, v in default_shortcuts.items()}
-        with open(CONFIG_PATH, "w", encoding="utf-8") as f:
-            config.write(f)
-        return
-
-    config.read(CONFIG_PATH, encoding="utf-8")
 
     # Shortcuts 섹션이 없으면 생성
-    if "Shortcuts" not in config:
-        config["Shortcuts"] = {k: v.replace("<Control-", "Ctrl+").replace(">", "") for k, v in default_shortcuts.items()}
-        with open(CONFIG_PATH, "w", encoding="utf-8") as f:
-            config.write(f)
+    if not config.has("Shortcuts"):
+        config.update("Shortcuts", {k: v.replace("<Control-", "Ctrl+").replace(">", "") for k, v in default_shortcuts.items()})
 
     # 변환 함수: Ctrl+S → <Control-s>
     def to_tk_format(value):
@@ -1390,7 +1006,7 @@ def load_shortcuts():
 
     # 각 단축키 항목 로드
     for key in default_shortcuts:
-        raw_value = config["Shortcuts"].get(key, "").strip()
+        raw_value = config.get("Shortcuts", key)
         if raw_value:
             shortcuts[key] = to_tk_format(raw_value)
         else:
@@ -1450,38 +1066,27 @@ def position_bottom_left(widget, x_offset=10, y_offset=44):
 
 # 마지막 창 위치 저장
 def save_window_position():
-    x = root.winfo_x()
-    y = root.winfo_y()
-    config = configparser.ConfigParser()
-    if os.path.exists(CONFIG_PATH):
-        config.read(CONFIG_PATH, encoding="utf-8")
-    if "Window" not in config:
-        config["Window"] = {}
-    config["Window"]["x"] = str(x)
-    config["Window"]["y"] = str(y)
-    with open(CONFIG_PATH, "w", encoding="utf-8") as f:
-        config.write(f)
+    config.update("Window", {"x": root.winfo_x(), "y": root.winfo_y()})
 
 def load_window_position():
-    config = configparser.ConfigParser()
-    if os.path.exists(CONFIG_PATH):
-        config.read(CONFIG_PATH, encoding="utf-8")
-        x = config.get("Window", "x", fallback="")
-        y = config.get("Window", "y", fallback="")
-        if x.isdigit() and y.isdigit():
-            root.geometry(f"+{int(x)}+{int(y)}")
+    x = config.get("Window", "x")
+    y = config.get("Window", "y")
+    if x.isdigit() and y.isdigit():
+        root.geometry(f"+{int(x)}+{int(y)}")
 
 def get_window_position():
-    config = configparser.ConfigParser()
-    if os.path.exists(CONFIG_PATH):
-        config.read(CONFIG_PATH, encoding="utf-8")
-        x = config.getint("Window", "x", fallback=100)
-        y = config.getint("Window", "y", fallback=100)
-        return x, y
-    return 100, 100
+    return config.get_int("Window", "x", fallback=100), config.get_int("Window", "y", fallback=100)
 
 def on_exit():
+    if watch_timer:
+        root.after_cancel(watch_timer)
+    scheduler.shutdown()
+    if log_drain_job:
+        root.after_cancel(log_drain_job)
+    if ui_drain_job:
+        root.after_cancel(ui_drain_job)
     save_window_position()
+    app.shutdown()
     root.destroy()
 
 # GUI 설정
@@ -1489,7 +1094,7 @@ root = tk.Tk()
 load_window_position()
 load_shortcuts()
 root.title(translations[current_language]["title"])
-root.geometry("820x382")
+root.geometry("820x408")
 
 # 창 아이콘 변경
 if os.path.exists(ICON_PATH):
@@ -1497,12 +1102,12 @@ if os.path.exists(ICON_PATH):
 
 # 버튼 아이콘 적용
 if os.path.exists(LANG_IMG_PATH):
-    lang_img = ImageTk.PhotoImage(Image.open(LANG_IMG_PATH))
+    lang_img = load_image(LANG_IMG_PATH)
 else:
     lang_img = None
 
 if os.path.exists(STOP_IMG_PATH):
-    stop_img = ImageTk.PhotoImage(Image.open(STOP_IMG_PATH))
+    stop_img = load_image(STOP_IMG_PATH)
 else:
     stop_img = None
 
@@ -1559,6 +1164,10 @@ run_btn = ttk.Button(input_frame, text=translations[current_language]["run_btn"]
 run_btn.grid(row=0, column=2, rowspan=2, padx=(5, 0), sticky="ns")
 ToolTip(run_btn, lambda: f"스크립트 실행 ({format_shortcut(shortcuts['run'])})" if current_language == "ko" else f"Run Script ({format_shortcut(shortcuts['run'])})")
 
+watch_var = tk.BooleanVar(value=False)
+watch_check = ttk.Checkbutton(top_frame, text=translations[current_language]["watch_check"], variable=watch_var, command=toggle_watch)
+watch_check.grid(row=4, column=0, columnspan=2, pady=(8, 0))
+
 # UI 요소 생성 (라벨 및 버튼)
 sheet_page_btn = ttk.Button(top_frame, text=translations[current_language]["sheet_page_btn"], command=open_google_sheet, width=18)
 sheet_page_btn.grid(row=6, column=0, columnspan=2, pady=(15, 5))
@@ -1588,6 +1197,9 @@ log_text = scrolledtext.ScrolledText(root, height=20, width=70, state="normal")
 log_text.grid(row=0, column=1, sticky="nsew", padx=10, pady=5)
 root.columnconfigure(1, weight=1)  # 로그 창이 가변적으로 늘어나도록 설정
 root.rowconfigure(0, weight=1)
+attach_log_menu(log_text)
+drain_log()
+drain_ui_calls()
 
 root.protocol("WM_DELETE_WINDOW", on_exit)
 
@@ -1595,9 +1207,43 @@ root.bind(shortcuts["save"], lambda e: save_config())
 root.bind(shortcuts["run"], lambda e: run_scripts())
 root.bind(shortcuts["quit"], lambda e: on_exit())
 
-# 설정 로드
+# 시작 시간 측정: 창이 처음 그려진 시점까지 (KDA_STARTUP_BENCH가 있으면 출력 후 종료, benchmarks/bench_startup.py)
+startup_seconds = None
+
+def on_first_paint(event):
+    if event.widget is not root or startup_seconds is not None:
+        return
+
+    def record():
+        global startup_seconds
+        if startup_seconds is not None:
+            return
+        startup_seconds = time.perf_counter() - STARTUP_STARTED
+        if os.environ.get("KDA_STARTUP_BENCH"):
+            print(f"startup_ms={startup_seconds * 1000:.1f}", flush=True)
+            on_exit()
+
+    root.after_idle(record)
+
+root.bind("<Map>", on_first_paint, add="+")
+
+# pid / Sheet ID가 실제로 바뀌었을 때만 닉네임 표시 갱신 (한 번에 여러 값이 바뀌어도 한 번만)
+username_refresh_job = None
+
+def refresh_username():
+    global username_refresh_job
+    username_refresh_job = None
+    get_username()
+
+def on_config_changed(section, key, value):
+    global username_refresh_job
+    if section == "Settings" and key in ("pid", "sheet_id") and username_refresh_job is None:
+        username_refresh_job = root.after_idle(refresh_username)
+
+# 설정 로드 (네트워크 요청 없이 저장된 상태로 그리고, 닉네임 확인은 백그라운드에서)
 load_config()
 get_username()
+config.subscribe(on_config_changed)
 
 # GUI 실행
 root.mainloop()
@@ -0,0 +1,87 @@
+import base64
+import gzip
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from kda import app, sync
+from kda.outbox import Outbox
+from kda.store import RecordStore
+
+class FakeResponse:
+    status_code = 200
+
+    def __init__(self, data):
+        self._data = data
+        self.text = json.dumps(data)
+
+    def json(self):
+        return self._data
+
+class SyncCompressionTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = RecordStore(os.path.join(self.tmp.name, "records.db"))
+        self.store.register_maps([("uid1", "Map #1", 1), ("uid2", "Map #2", 1)])
+        self.store.upsert_records([("111", "uid1", 12340, 3), ("111", "uid2", None, 7)])
+        patches = [
+            mock.patch.object(app, "record_store", self.store),
+            mock.patch.object(app, "outbox", Outbox(os.path.join(self.tmp.name, "outbox"))),
+            mock.patch.object(sync, "load_sync_settings", return_value={"webhook_url": "http://gas.test", "workers": 1})
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        self.sent = []
+
+    def tearDown(self):
+        self.store.close()
+        self.tmp.cleanup()
+
+    def post(self, url, json=None, headers=None):
+        self.sent.append(json)
+        payload = self.decode(json)
+        return FakeResponse({"status": "ok", "version": payload["version"]})
+
+    @staticmethod
+    def decode(body):
+        if body.get("encoding") == "gzip":
+            return json.loads(gzip.decompress(base64.b64decode(body["data"])))
+        return body
+
+    def test_first_full_send_is_uncompressed(self):
+        with mock.patch.object(sync.http_client, "post", self.post):
+            self.assertTrue(sync.sync_dashboard("111", "sheet", flush=False))
+        self.assertEqual(self.sent[0]["mode"], "full")
+
+    def test_full_send_to_acknowledged_sheet_is_compressed(self):
+        with mock.patch.object(sync.http_client, "post", self.post):
+            self.assertTrue(sync.sync_dashboard("111", "sheet", flush=False))
+            self.assertTrue(sync.sync_dashboard("111", "sheet", full=True, flush=False))
+        self.assertEqual(self.sent[1]["encoding"], "gzip")
+        payload = self.decode(self.sent[1])
+        self.assertEqual(payload["mode"], "full")
+        self.assertEqual(payload["version"], 2)
+
+    def test_maps_with_the_same_name_stay_separate_rows(self):
+        self.store.register_maps([("uid3", "Map #1", 2)])
+        self.store.upsert_records([("111", "uid3", 45670, 1)])
+        with mock.patch.object(sync.http_client, "post", self.post):
+            self.assertTrue(sync.sync_dashboard("111", "sheet", flush=False))
+            self.store.upsert_records([("111", "uid3", 45000, 1)])
+            self.assertTrue(sync.sync_dashboard("111", "sheet", flush=False))
+
+        self.assertEqual(self.decode(self.sent[0])["rows"], [
+            ["uid1", "Map #1", "12.34", "3"],
+            ["uid3", "Map #1", "45.67", "1"],
+            ["uid2", "Map #2", "0", "7"]
+        ])
+        delta = self.decode(self.sent[1])
+        self.assertEqual(delta["mode"], "delta")
+        self.assertEqual(delta["upsert"], [["uid3", "Map #1", "45.0", "1"]])
+        self.assertEqual(delta["remove"], [])
+
+if __name__ == "__main__":
+    unittest.main()